@@ -7,7 +7,8 @@ from alembic import context
 
 from src.todo.config.settings import settings
 from src.todo.db import Base
-from src.todo.models import ProjectORM, TaskORM
+from src.todo.db.sqlite import configure_sqlite
+from src.todo.models import ProjectORM, TaskORM, IdempotencyKeyORM
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -50,6 +51,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
     )
 
     with context.begin_transaction():
@@ -69,9 +71,14 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
+    configure_sqlite(connectable)
+
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most constraints; batch mode recreates the table instead.
+            render_as_batch=connection.dialect.name == "sqlite",
         )
 
         with context.begin_transaction():
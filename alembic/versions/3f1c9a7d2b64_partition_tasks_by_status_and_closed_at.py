@@ -0,0 +1,141 @@
+"""partition tasks by status and closed_at
+
+Revision ID: 3f1c9a7d2b64
+Revises: 652a65338178
+Create Date: 2026-10-19 10:12:31.518204
+
+Turns ``tasks`` into a declaratively partitioned table (PostgreSQL only):
+
+    tasks                      PARTITION BY LIST (status)
+    ├── tasks_open             FOR VALUES IN ('TODO', 'DOING')
+    └── tasks_closed           FOR VALUES IN ('DONE') PARTITION BY RANGE (closed_at)
+        ├── tasks_closed_YYYY_MM   one partition per calendar month (UTC)
+        └── tasks_closed_default   DEFAULT (closed_at NULL or outside the months)
+
+PostgreSQL cannot enforce a unique constraint on a partitioned table unless it
+contains every partition key, so the primary key on ``id`` is kept per leaf
+partition. Ids are generated UUIDs, so global uniqueness is not at risk.
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.todo.config.settings import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, Sequence[str], None] = '652a65338178'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _task_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column('project_id', sa.Uuid(as_uuid=False), nullable=False),
+        sa.Column('title', sa.String(length=30), nullable=False),
+        sa.Column('description', sa.String(length=150), nullable=False),
+        sa.Column('status', sa.Enum('TODO', 'DOING', 'DONE', name='taskstatus', native_enum=False), nullable=False),
+        sa.Column('deadline', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def _add_month(month: datetime.date) -> datetime.date:
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def _create_month_partition(month: datetime.date) -> None:
+    name = f"tasks_closed_{month:%Y_%m}"
+    op.execute(
+        f"CREATE TABLE {name} PARTITION OF tasks_closed "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+        f"TO ('{_add_month(month):%Y-%m-%d} 00:00:00+00')"
+    )
+    op.execute(f"ALTER TABLE {name} ADD PRIMARY KEY (id)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # Declarative partitioning is PostgreSQL-specific; other backends keep the plain table.
+        return
+
+    op.create_table(
+        'tasks_partitioned',
+        *_task_columns(),
+        postgresql_partition_by='LIST (status)',
+    )
+    op.execute("CREATE TABLE tasks_open PARTITION OF tasks_partitioned FOR VALUES IN ('TODO', 'DOING')")
+    op.execute("ALTER TABLE tasks_open ADD PRIMARY KEY (id)")
+    op.execute(
+        "CREATE TABLE tasks_closed PARTITION OF tasks_partitioned FOR VALUES IN ('DONE') "
+        "PARTITION BY RANGE (closed_at)"
+    )
+    op.execute("CREATE TABLE tasks_closed_default PARTITION OF tasks_closed DEFAULT")
+    op.execute("ALTER TABLE tasks_closed_default ADD PRIMARY KEY (id)")
+
+    # Monthly partitions covering existing closed tasks plus a few months ahead,
+    # so nothing lands in the default partition during the copy below.
+    today = datetime.datetime.now(datetime.timezone.utc).date().replace(day=1)
+    oldest = bind.execute(
+        sa.text("SELECT min(closed_at) FROM tasks WHERE status = 'DONE'")
+    ).scalar()
+    month = oldest.astimezone(datetime.timezone.utc).date().replace(day=1) if oldest else today
+    last = today
+    for _ in range(settings.TASKS_PARTITION_MONTHS_AHEAD):
+        last = _add_month(last)
+    while month <= last:
+        _create_month_partition(month)
+        month = _add_month(month)
+
+    op.execute(
+        "INSERT INTO tasks_partitioned "
+        "(id, project_id, title, description, status, deadline, created_at, closed_at) "
+        "SELECT id, project_id, title, description, status, deadline, created_at, closed_at FROM tasks"
+    )
+    op.drop_table('tasks')
+    op.rename_table('tasks_partitioned', 'tasks')
+    op.create_foreign_key(
+        'tasks_project_id_fkey', 'tasks', 'projects', ['project_id'], ['id'], ondelete='CASCADE'
+    )
+
+    # Indexes on the parent cascade to every current and future partition.
+    op.create_index('ix_tasks_project_id_created_at', 'tasks', ['project_id', 'created_at'])
+    op.create_index(
+        'ix_tasks_open_deadline', 'tasks_open', ['deadline'],
+        postgresql_where=sa.text('deadline IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Partitions detached for archival are not attached to ``tasks`` anymore and are left untouched.
+    op.create_table(
+        'tasks_unpartitioned',
+        *_task_columns(),
+        sa.PrimaryKeyConstraint('id', name='tasks_unpartitioned_pkey'),
+    )
+    op.execute(
+        "INSERT INTO tasks_unpartitioned "
+        "(id, project_id, title, description, status, deadline, created_at, closed_at) "
+        "SELECT id, project_id, title, description, status, deadline, created_at, closed_at FROM tasks"
+    )
+    op.drop_table('tasks')
+    op.rename_table('tasks_unpartitioned', 'tasks')
+    op.execute("ALTER TABLE tasks RENAME CONSTRAINT tasks_unpartitioned_pkey TO tasks_pkey")
+    op.create_foreign_key(
+        'tasks_project_id_fkey', 'tasks', 'projects', ['project_id'], ['id'], ondelete='CASCADE'
+    )
@@ -0,0 +1,71 @@
+"""portable id and created_at columns
+
+Revision ID: a61e0c3f5b27
+Revises: d93f6a0c7e18
+Create Date: 2026-10-19 13:20:44.615902
+
+The initial migration declares ids as ``UUID`` and defaults ``created_at`` to
+``now()``. PostgreSQL has both, so nothing changes there. On SQLite a ``UUID``
+column gets NUMERIC affinity, which turns ids made only of digits into numbers,
+and ``now()`` does not exist. So ids become ``CHAR(32)``, which is what the models
+use, and ``created_at`` defaults to ``CURRENT_TIMESTAMP``.
+
+SQLite changes column types by copying each table into a new one. Dropping the
+old ``projects`` table would cascade into ``tasks`` while foreign keys are
+enforced, so they are switched off for the copy and checked afterwards.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a61e0c3f5b27'
+down_revision: Union[str, Sequence[str], None] = 'd93f6a0c7e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _alter_columns(id_type: sa.types.TypeEngine, old_id_type: sa.types.TypeEngine, created_at_default) -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+
+    # The pragma is ignored inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("PRAGMA foreign_keys=OFF")
+    try:
+        with op.batch_alter_table('projects') as batch_op:
+            batch_op.alter_column('id', type_=id_type, existing_type=old_id_type, existing_nullable=False)
+            batch_op.alter_column(
+                'created_at',
+                server_default=created_at_default,
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+            )
+        with op.batch_alter_table('tasks') as batch_op:
+            batch_op.alter_column('id', type_=id_type, existing_type=old_id_type, existing_nullable=False)
+            batch_op.alter_column('project_id', type_=id_type, existing_type=old_id_type, existing_nullable=False)
+            batch_op.alter_column(
+                'created_at',
+                server_default=created_at_default,
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+            )
+        violations = bind.exec_driver_sql("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise RuntimeError(f"Foreign key violations after copying tables: {violations}")
+    finally:
+        with op.get_context().autocommit_block():
+            op.execute("PRAGMA foreign_keys=ON")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alter_columns(sa.Uuid(as_uuid=False), sa.UUID(as_uuid=False), sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _alter_columns(sa.UUID(as_uuid=False), sa.Uuid(as_uuid=False), sa.text('now()'))
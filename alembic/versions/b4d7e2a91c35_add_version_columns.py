@@ -0,0 +1,33 @@
+"""add version columns
+
+Revision ID: b4d7e2a91c35
+Revises: 8c2e5b1f4a90
+Create Date: 2026-10-19 10:52:18.403117
+
+Adds the row version used for optimistic concurrency (ETag / If-Match). Existing
+rows start at version 1. On a partitioned ``tasks`` table the column is added to
+the parent and propagates to every partition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d7e2a91c35'
+down_revision: Union[str, Sequence[str], None] = '8c2e5b1f4a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('tasks', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tasks', 'version')
+    op.drop_column('projects', 'version')
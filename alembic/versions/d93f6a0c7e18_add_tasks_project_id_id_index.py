@@ -0,0 +1,30 @@
+"""add tasks project_id id index
+
+Revision ID: d93f6a0c7e18
+Revises: b4d7e2a91c35
+Create Date: 2026-10-19 11:04:51.287340
+
+Supports keyset pagination of a project's tasks (``WHERE project_id = ? AND id > ?
+ORDER BY id``). On a partitioned ``tasks`` table the index cascades to every partition.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93f6a0c7e18'
+down_revision: Union[str, Sequence[str], None] = 'b4d7e2a91c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_project_id_id', 'tasks', ['project_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_project_id_id', table_name='tasks')
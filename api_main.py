@@ -8,7 +8,7 @@ from src.todo.api.app import app
 
 
 def main():
-    """Run the FastAPI application server."""
+    """Run the FastAPI development server (auto-reload, single process; see server_main.py for production)."""
     uvicorn.run(
         "src.todo.api.app:app",
         host="0.0.0.0",
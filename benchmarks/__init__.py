@@ -0,0 +1,4 @@
+"""Performance benchmarks for repositories, the service layer and the Web API.
+
+Run with ``python -m benchmarks --database-url <url>``; see ``benchmarks/run.py``.
+"""
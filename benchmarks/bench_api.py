@@ -0,0 +1,49 @@
+"""Benchmarks for the FastAPI endpoints through an in-process ASGI client."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import httpx
+
+from src.todo.api.app import app
+
+from .dataset import Dataset
+from .harness import BenchmarkResult, ameasure
+
+GROUP = "api"
+
+
+async def _run(dataset: Dataset, iterations: int) -> list[BenchmarkResult]:
+    project_id = dataset.project_ids[0]
+    task_id = dataset.task_ids[0]
+    statuses = itertools.cycle(["DOING", "TODO"])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api/v1") as client:
+        async def request(method: str, url: str, **kwargs) -> httpx.Response:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {url} failed: {response.status_code} {response.text}")
+            return response
+
+        async def create_and_delete_task() -> None:
+            response = await request("POST", f"/projects/{project_id}/tasks", json={"title": "bench-api-task"})
+            await request("DELETE", f"/tasks/{response.json()['data']['id']}")
+
+        cases = {
+            "GET /projects": lambda: request("GET", "/projects"),
+            "GET /projects/{id}": lambda: request("GET", f"/projects/{project_id}"),
+            "GET /projects/{id}/tasks": lambda: request("GET", f"/projects/{project_id}/tasks"),
+            "GET /tasks/{id}": lambda: request("GET", f"/tasks/{task_id}"),
+            "PATCH /tasks/{id}/status": lambda: request(
+                "PATCH", f"/tasks/{task_id}/status", json={"status": next(statuses)}
+            ),
+            "POST+DELETE /projects/{id}/tasks": create_and_delete_task,
+        }
+        return [await ameasure(name, GROUP, func, iterations) for name, func in cases.items()]
+
+
+def run(dataset: Dataset, iterations: int) -> list[BenchmarkResult]:
+    return asyncio.run(_run(dataset, iterations))
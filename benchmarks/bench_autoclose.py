@@ -0,0 +1,43 @@
+"""Benchmarks for the auto-close overdue tasks command."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from src.todo.commands import autoclose_overdue_tasks
+from src.todo.db.session import SessionLocal
+from src.todo.models import ProjectORM
+
+from .dataset import seed_overdue
+from .harness import BenchmarkResult, measure
+
+GROUP = "autoclose"
+
+
+def run(engine: Engine, sizes: list[int], iterations: int) -> list[BenchmarkResult]:
+    project_id = str(uuid.uuid4())
+    with engine.begin() as connection:
+        connection.execute(insert(ProjectORM), [{"id": project_id, "name": "bench-autoclose"}])
+
+    def close_all() -> None:
+        with SessionLocal() as session:
+            closed = autoclose_overdue_tasks(session)
+        if closed < size:
+            raise RuntimeError(f"Expected to close {size} tasks, closed {closed}")
+
+    results = []
+    for size in sizes:
+        results.append(measure(
+            f"autoclose_overdue_tasks[{size}]",
+            GROUP,
+            close_all,
+            iterations,
+            warmup=0,
+            setup=lambda: seed_overdue(engine, project_id, size),
+            params={"overdue_tasks": size},
+        ))
+    seed_overdue(engine, project_id, 0)
+    return results
@@ -0,0 +1,46 @@
+"""Benchmarks for ToDoListManager flows."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from src.todo.factory import create_todo_manager_with_session
+from src.todo.models.task_orm import TaskStatus
+from src.todo.services import ToDoListManager
+
+from .bench_repositories import in_session
+from .dataset import Dataset
+from .harness import BenchmarkResult, measure
+
+GROUP = "manager"
+
+
+def run(dataset: Dataset, iterations: int) -> list[BenchmarkResult]:
+    project_id = dataset.project_ids[0]
+    task_id = dataset.task_ids[0]
+
+    def list_projects_with_task_counts(manager: ToDoListManager) -> None:
+        # Mirrors the GET /projects handler: one task listing per project.
+        for project in manager.list_all_projects():
+            len(manager.list_project_tasks(project.id))
+
+    cases: dict[str, Callable[[ToDoListManager], Any]] = {
+        "list_all_projects": lambda m: m.list_all_projects(),
+        "list_projects_with_task_counts": list_projects_with_task_counts,
+        "list_project_tasks": lambda m: m.list_project_tasks(project_id),
+        "get_project": lambda m: m.get_project(project_id),
+        "get_task": lambda m: m.get_task(None, task_id),
+        "create_project": lambda m: m.create_project("bench-new-project", "created"),
+        "add_task_to_project": lambda m: m.add_task_to_project(project_id, "bench-new-task"),
+        "edit_task": lambda m: m.edit_task(task_id, title="bench-edited"),
+        "change_task_status": lambda m: m.change_task_status(task_id, TaskStatus.DOING),
+    }
+    return [
+        measure(
+            name,
+            GROUP,
+            in_session(lambda s, flow=flow: flow(create_todo_manager_with_session(s))),
+            iterations,
+        )
+        for name, flow in cases.items()
+    ]
@@ -0,0 +1,46 @@
+"""Benchmarks for ProjectRepository and TaskRepository operations."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from src.todo.db.session import SessionLocal
+from src.todo.repositories import ProjectRepository, TaskRepository
+
+from .dataset import Dataset
+from .harness import BenchmarkResult, measure
+
+GROUP = "repositories"
+
+
+def in_session(operation: Callable[[Session], Any]) -> Callable[[], None]:
+    """Run ``operation`` in a fresh session that is rolled back, so the dataset is unchanged."""
+    def run() -> None:
+        session = SessionLocal()
+        try:
+            operation(session)
+        finally:
+            session.rollback()
+            session.close()
+    return run
+
+
+def run(dataset: Dataset, iterations: int) -> list[BenchmarkResult]:
+    project_id = dataset.project_ids[0]
+    task_id = dataset.task_ids[0]
+
+    cases: dict[str, Callable[[Session], Any]] = {
+        "project.get_all": lambda s: ProjectRepository(s).get_all(),
+        "project.get_by_id": lambda s: ProjectRepository(s).get_by_id(project_id),
+        "project.get_by_name": lambda s: ProjectRepository(s).get_by_name("bench-project-0"),
+        "project.count": lambda s: ProjectRepository(s).count(),
+        "project.create": lambda s: ProjectRepository(s).create("bench-new-project", "created"),
+        "task.get_by_id": lambda s: TaskRepository(s).get_by_id(task_id),
+        "task.get_by_project_id": lambda s: TaskRepository(s).get_by_project_id(project_id),
+        "task.count_by_project": lambda s: TaskRepository(s).count_by_project(project_id),
+        "task.get_overdue_tasks": lambda s: TaskRepository(s).get_overdue_tasks(),
+        "task.create": lambda s: TaskRepository(s).create(project_id, "bench-new-task", "created"),
+    }
+    return [measure(name, GROUP, in_session(operation), iterations) for name, operation in cases.items()]
@@ -0,0 +1,97 @@
+"""Startup benchmarks: import time of the CLI and command entry points.
+
+Each target runs in a fresh interpreter under ``python -X importtime``. The reported
+time is the cumulative import time of everything the target's code imports (the
+interpreter's own startup is excluded), so results do not depend on a database.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+from .harness import BenchmarkResult, summarize
+
+GROUP = "startup"
+
+_ROOT_DIR = Path(__file__).resolve().parents[1]
+_MARKER = "--startup-marker--"
+
+
+class StartupTarget(NamedTuple):
+    code: str
+    budget_ms: float
+
+
+# What each entry point loads before doing its work, and the import time it may take.
+TARGETS: dict[str, StartupTarget] = {
+    # Up to the first menu: no SQLAlchemy, settings or service graph
+    "cli menu": StartupTarget("import main; from src.todo.cli import ToDoCLI; ToDoCLI()", 100.0),
+    # First CLI command that touches the database
+    "cli first command": StartupTarget(
+        "from src.todo.cli import ToDoCLI; ToDoCLI().manager", 1000.0
+    ),
+    # Scripted subcommands up to argument parsing (settings only, no SQLAlchemy)
+    "cli subcommand parser": StartupTarget(
+        "from src.todo.cli.subcommands import build_parser; build_parser()", 500.0
+    ),
+    "autoclose command": StartupTarget("from src.todo.commands import autoclose_overdue_tasks", 1000.0),
+}
+
+
+def parse_importtime(stderr: str) -> float:
+    """Sum the cumulative time (seconds) of top-level imports after the start marker."""
+    total_us = 0
+    started = False
+    for line in stderr.splitlines():
+        if line == _MARKER:
+            started = True
+            continue
+        if not started or not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented below their parent and already counted in it
+        if name.startswith("  "):
+            continue
+        if cumulative.strip().isdigit():
+            total_us += int(cumulative)
+    return total_us / 1_000_000
+
+
+def import_time(code: str, database_url: str) -> float:
+    """Import time (seconds) of ``code`` in a fresh interpreter."""
+    env = {**os.environ, "DATABASE_URL": database_url, "PYTHONDONTWRITEBYTECODE": "1"}
+    script = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush(); {code}"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=_ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup target failed: {code}\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def run(iterations: int, database_url: str = "sqlite://", budget_factor: float = 1.0) -> list[BenchmarkResult]:
+    """Measure every startup target; ``budget_factor`` scales the budgets for slower machines."""
+    results = []
+    for name, target in TARGETS.items():
+        samples = [import_time(target.code, database_url) for _ in range(iterations)]
+        results.append(summarize(
+            name, GROUP, samples, params={"budget_ms": target.budget_ms * budget_factor},
+        ))
+    return results
+
+
+def over_budget(results: list[BenchmarkResult]) -> list[str]:
+    """List startup targets whose median import time exceeds their budget."""
+    return [
+        f"{result.group}/{result.name}: {result.median_ms:.1f} ms > budget {result.params['budget_ms']:.1f} ms"
+        for result in results
+        if result.group == GROUP and result.median_ms > result.params["budget_ms"]
+    ]
@@ -0,0 +1,95 @@
+"""Seed benchmark datasets of configurable size."""
+
+from __future__ import annotations
+
+import datetime
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import delete, insert
+from sqlalchemy.engine import Engine
+
+from src.todo.db.base import Base
+from src.todo.models import ProjectORM, TaskORM
+from src.todo.models.task_orm import TaskStatus
+
+_STATUSES = (TaskStatus.TODO, TaskStatus.DOING, TaskStatus.DONE)
+
+
+@dataclass
+class Dataset:
+    """Ids of the seeded rows, used to address benchmark targets."""
+    project_ids: list[str] = field(default_factory=list)
+    task_ids: list[str] = field(default_factory=list)
+
+
+def reset_schema(engine: Engine) -> None:
+    """Drop and recreate all tables in the benchmark database."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def seed(engine: Engine, projects: int, tasks_per_project: int, batch_size: int = 5_000) -> Dataset:
+    """Insert ``projects`` x ``tasks_per_project`` rows with mixed statuses and future deadlines."""
+    dataset = Dataset()
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    project_rows = []
+    for index in range(projects):
+        project_id = str(uuid.uuid4())
+        dataset.project_ids.append(project_id)
+        project_rows.append({
+            "id": project_id,
+            "name": f"bench-project-{index}",
+            "description": "Benchmark project",
+            "created_at": now,
+        })
+
+    with engine.begin() as connection:
+        for start in range(0, len(project_rows), batch_size):
+            connection.execute(insert(ProjectORM), project_rows[start:start + batch_size])
+
+        task_rows = []
+        for project_id in dataset.project_ids:
+            for index in range(tasks_per_project):
+                task_id = str(uuid.uuid4())
+                dataset.task_ids.append(task_id)
+                status = _STATUSES[index % len(_STATUSES)]
+                task_rows.append({
+                    "id": task_id,
+                    "project_id": project_id,
+                    "title": f"bench-task-{index}",
+                    "description": "Benchmark task",
+                    "status": status,
+                    "deadline": now + datetime.timedelta(days=30),
+                    "created_at": now + datetime.timedelta(microseconds=index),
+                    "closed_at": now if status == TaskStatus.DONE else None,
+                })
+                if len(task_rows) >= batch_size:
+                    connection.execute(insert(TaskORM), task_rows)
+                    task_rows = []
+        if task_rows:
+            connection.execute(insert(TaskORM), task_rows)
+
+    return dataset
+
+
+def seed_overdue(engine: Engine, project_id: str, count: int, batch_size: int = 5_000) -> None:
+    """Replace the tasks of ``project_id`` with ``count`` open tasks whose deadline has passed."""
+    past = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=1)
+    with engine.begin() as connection:
+        connection.execute(delete(TaskORM).where(TaskORM.project_id == project_id))
+        for start in range(0, count, batch_size):
+            connection.execute(insert(TaskORM), [
+                {
+                    "id": str(uuid.uuid4()),
+                    "project_id": project_id,
+                    "title": f"overdue-{start + offset}",
+                    "description": "",
+                    "status": TaskStatus.TODO,
+                    "deadline": past,
+                    "created_at": past,
+                    "closed_at": None,
+                }
+                for offset in range(min(batch_size, count - start))
+            ])
@@ -0,0 +1,111 @@
+"""Timing primitives and result reporting for the benchmark suite."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary of one benchmark."""
+    name: str
+    group: str
+    iterations: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    ops_per_sec: float
+    params: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def summarize(
+    name: str, group: str, samples: list[float], params: Optional[dict[str, Any]] = None
+) -> BenchmarkResult:
+    """Build a result from per-iteration durations in seconds."""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    mean = statistics.fmean(ordered)
+    return BenchmarkResult(
+        name=name,
+        group=group,
+        iterations=len(ordered),
+        mean_ms=mean * 1000,
+        median_ms=statistics.median(ordered) * 1000,
+        p95_ms=ordered[p95_index] * 1000,
+        min_ms=ordered[0] * 1000,
+        max_ms=ordered[-1] * 1000,
+        ops_per_sec=1 / mean if mean > 0 else 0.0,
+        params=params or {},
+    )
+
+
+def measure(
+    name: str,
+    group: str,
+    func: Callable[[], Any],
+    iterations: int,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+    params: Optional[dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """Time ``func`` over ``iterations`` runs, calling the untimed ``setup`` before each run."""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(name, group, samples, params)
+
+
+async def ameasure(
+    name: str,
+    group: str,
+    func: Callable[[], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 1,
+    params: Optional[dict[str, Any]] = None,
+) -> BenchmarkResult:
+    """Async variant of ``measure`` for coroutine-based benchmarks."""
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return summarize(name, group, samples, params)
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float
+) -> list[str]:
+    """List benchmarks whose median regressed by more than ``threshold`` (0.2 = 20%)."""
+    previous = {(r["group"], r["name"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["group"], result["name"]))
+        if before is None or before["median_ms"] <= 0:
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{result['group']}/{result['name']}: {before['median_ms']:.3f} ms -> "
+                f"{result['median_ms']:.3f} ms (+{change:.0%})"
+            )
+    return regressions
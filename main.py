@@ -7,14 +7,25 @@ Run the API server with: poetry run python api_main.py
 Then access the API at http://localhost:8000/docs
 """
 
+import sys
 import warnings
 
-from src.todo.cli import ToDoCLI
-from src.todo.db import get_session_ctx
 
+def main(argv=None):
+    """Main CLI entry point.
+
+    With arguments, run a non-interactive subcommand (``todo project add ...``,
+    ``todo batch file.ndjson``); without, start the deprecated interactive menu.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from src.todo.cli.subcommands import run_command
+
+        sys.exit(run_command(argv))
+
+    # Imported here so that the entry point itself stays cheap to load
+    from src.todo.cli import ToDoCLI
 
-def main():
-    """Main CLI entry point (deprecated)."""
     warnings.warn(
         "CLI interface is deprecated. Please use the Web API instead. "
         "Run 'poetry run python api_main.py' to start the API server, "
@@ -26,9 +37,8 @@ def main():
     print("   Start the API server: poetry run python api_main.py")
     print("   API documentation: http://localhost:8000/docs\n")
     
-    with get_session_ctx() as db_session:
-        cli = ToDoCLI(db_session)
-        cli.run()
+    # The database session is opened on the first command that needs it
+    ToDoCLI().run()
 
 
 if __name__ == "__main__":
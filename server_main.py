@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Production Web API entry point (multiple workers, no auto-reload)."""
+
+import argparse
+import logging
+
+from src.todo.api.server import run_server
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+def main():
+    """Run the production API server."""
+    parser = argparse.ArgumentParser(description="Serve the ToDo List Web API in production")
+    parser.add_argument("--host", help="Bind address (default: SERVER_HOST)")
+    parser.add_argument("--port", type=int, help="Bind port (default: SERVER_PORT)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: SERVER_WORKERS, else CPU count)")
+    args = parser.parse_args()
+
+    run_server(host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,69 @@
 """FastAPI application factory and configuration."""
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routers import api_router
+from .middleware import (
+    QueryTimingMiddleware,
+    MetricsMiddleware,
+    CompressionMiddleware,
+    CompactJSONMiddleware,
+    IdempotencyMiddleware,
+    RateLimitMiddleware,
+    LoadSheddingMiddleware,
+    ReadYourWritesMiddleware,
+)
+from .rate_limit import create_rate_limit_backend
+from .controllers import metrics_controller
 from .exception_handlers import (
     not_found_handler,
     duplicate_error_handler,
+    precondition_failed_handler,
     validation_error_handler,
     business_rule_error_handler,
     request_validation_error_handler,
     generic_exception_handler,
 )
-from ..exceptions.repository import NotFoundError, DuplicateError
+from ..exceptions.repository import NotFoundError, DuplicateError, PreconditionFailedError
 from ..exceptions.service import ValidationError as ServiceValidationError, BusinessRuleError
+from ..config.settings import settings
+from ..db.session import dispose_engines, get_engine, get_replica_engines, warm_pool
+from ..events.broker import event_broker
+from ..metrics import observe_pool
 from fastapi.exceptions import RequestValidationError
 
+logger = logging.getLogger(__name__)
+
+
+def _warm_pools() -> None:
+    for bind in (get_engine(), *get_replica_engines()):
+        try:
+            opened = warm_pool(bind, settings.DATABASE_POOL_WARMUP_CONNECTIONS)
+        except Exception:
+            # Not fatal: requests reconnect through pool_pre_ping once the database is back
+            logger.warning(f"Could not warm the connection pool of {bind.url}", exc_info=True)
+        else:
+            if opened:
+                logger.info(f"Warmed {opened} connection(s) to {bind.url}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the connection pools before serving; release them once requests have drained."""
+    if settings.STORAGE_BACKEND != "memory" and settings.DATABASE_POOL_WARMUP_CONNECTIONS > 0:
+        await asyncio.to_thread(_warm_pools)
+    try:
+        yield
+    finally:
+        event_broker.stop()
+        dispose_engines()
+
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application instance."""
@@ -25,8 +73,14 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
+    # Saved responses for retried POST requests carrying an Idempotency-Key
+    # (innermost, so replayed responses still get CORS headers and compression)
+    if settings.IDEMPOTENCY_ENABLED:
+        app.add_middleware(IdempotencyMiddleware)
+
     # CORS middleware (configure as needed for production)
     app.add_middleware(
         CORSMiddleware,
@@ -34,11 +88,38 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Server-Timing", "Idempotent-Replayed", "Retry-After", "ETag", "Link"],
     )
 
+    # Null-field stripping for ?compact=1, then negotiated compression (outermost of the two)
+    app.add_middleware(CompactJSONMiddleware)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware)
+
+    # Per-request SQL statement counts and durations
+    app.add_middleware(QueryTimingMiddleware)
+
+    # Read-your-writes stickiness to the primary when reads go to replicas
+    if settings.DATABASE_REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware)
+
+    # Per-client token buckets, then a per-worker in-flight cap (outermost of the two)
+    if settings.RATE_LIMIT_ENABLED:
+        app.add_middleware(RateLimitMiddleware, backend=create_rate_limit_backend())
+    if settings.MAX_IN_FLIGHT_REQUESTS > 0:
+        app.add_middleware(LoadSheddingMiddleware, max_in_flight=settings.MAX_IN_FLIGHT_REQUESTS)
+
+    # Prometheus metrics (request latency, in-flight requests, pool usage)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        observe_pool(get_engine(), "primary")
+        for index, replica in enumerate(get_replica_engines()):
+            observe_pool(replica, f"replica{index}")
+
     # Register exception handlers
     app.add_exception_handler(NotFoundError, not_found_handler)
     app.add_exception_handler(DuplicateError, duplicate_error_handler)
+    app.add_exception_handler(PreconditionFailedError, precondition_failed_handler)
     app.add_exception_handler(ServiceValidationError, validation_error_handler)
     app.add_exception_handler(BusinessRuleError, business_rule_error_handler)
     app.add_exception_handler(RequestValidationError, request_validation_error_handler)
@@ -46,6 +127,8 @@ def create_app() -> FastAPI:
 
     # Include API routers
     app.include_router(api_router, prefix="/api/v1")
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics_controller.router, tags=["metrics"])
 
     return app
 
@@ -5,8 +5,13 @@ from .models import (
     ErrorResponse,
     ErrorDetail,
     Project,
+    ProjectListItem,
     Task,
     HealthResponse,
+    BatchOperation,
+    BatchRequest,
+    BatchOperationResult,
+    BatchOutcome,
 )
 
 __all__ = [
@@ -14,7 +19,12 @@ __all__ = [
     "ErrorResponse",
     "ErrorDetail",
     "Project",
+    "ProjectListItem",
     "Task",
     "HealthResponse",
+    "BatchOperation",
+    "BatchRequest",
+    "BatchOperationResult",
+    "BatchOutcome",
 ]
 
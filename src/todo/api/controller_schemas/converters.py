@@ -0,0 +1,24 @@
+"""Conversions from stored tasks to the API schemas."""
+
+from __future__ import annotations
+
+from typing import Union
+
+from ...models.task import Task as TaskModel
+from ...models.task_orm import TaskORM
+from .models import Task
+
+
+def task_to_schema(task: Union[TaskORM, TaskModel]) -> Task:
+    """Build a Task response schema from an ORM row or an in-memory task (not re-validated)."""
+    return Task.model_construct(
+        id=task.id,
+        project_id=task.project_id,
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        deadline=task.deadline,
+        created_at=task.created_at,
+        closed_at=task.closed_at,
+        version=task.version,
+    )
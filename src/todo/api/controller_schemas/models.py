@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime
 import uuid
-from typing import Optional, Generic, TypeVar, Any
+from typing import Optional, Generic, TypeVar, Any, Literal
 from pydantic import BaseModel, Field, field_validator
 
 from ...models.task_orm import TaskStatus
@@ -45,6 +45,7 @@ class Project(BaseModel):
     description: str = Field(default="", description="Project description", max_length=settings.MAX_PROJECT_DESCRIPTION_LENGTH)
     created_at: Optional[datetime.datetime] = Field(default=None, description="Project creation timestamp (read-only)")
     task_count: Optional[int] = Field(default=None, description="Number of tasks in project (read-only)")
+    version: Optional[int] = Field(default=None, description="Row version, also sent as the ETag (read-only)")
 
     model_config = {"from_attributes": True}
 
@@ -59,6 +60,7 @@ class Task(BaseModel):
     deadline: Optional[datetime.datetime] = Field(default=None, description="Task deadline (ISO 8601 format)")
     created_at: Optional[datetime.datetime] = Field(default=None, description="Task creation timestamp (read-only)")
     closed_at: Optional[datetime.datetime] = Field(default=None, description="Task completion timestamp (read-only)")
+    version: Optional[int] = Field(default=None, description="Row version, also sent as the ETag (read-only)")
 
     @field_validator("deadline")
     @classmethod
@@ -72,3 +74,59 @@ class Task(BaseModel):
 
     model_config = {"from_attributes": True}
 
+
+class ProjectListItem(Project):
+    """Project as returned by the list endpoint; with ``fields=`` only the requested attributes are present."""
+    name: Optional[str] = Field(default=None, description="Project name")
+    tasks: Optional[list[Task]] = Field(default=None, description="Project tasks (only with include=tasks)")
+
+
+BatchOperationType = Literal[
+    "create_project", "update_project", "delete_project",
+    "create_task", "update_task", "change_task_status", "delete_task",
+]
+
+
+class BatchOperation(BaseModel):
+    """One operation of a batch request."""
+    op: BatchOperationType = Field(description="Operation to perform")
+    id: Optional[str] = Field(
+        default=None,
+        description="Target project or task id for update, delete and status operations. "
+                    "`$N` refers to the id created by operation N of the same batch",
+    )
+    if_match: Optional[int] = Field(
+        default=None,
+        description="Only apply an update, status change or delete to this version of the target",
+    )
+    data: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Project or Task fields, as in the single-resource endpoints "
+                    "(for create_task, `project_id` may also be a `$N` reference)",
+    )
+
+
+class BatchRequest(BaseModel):
+    """Batch of operations executed in order in a single transaction."""
+    atomic: bool = Field(
+        default=True,
+        description="All-or-nothing when true; otherwise each operation commits or fails on its own",
+    )
+    operations: list[BatchOperation] = Field(
+        min_length=1, max_length=settings.MAX_BATCH_OPERATIONS, description="Operations to run, in order"
+    )
+
+
+class BatchOperationResult(BaseModel):
+    """Result of one batch operation."""
+    index: int = Field(description="Position of the operation in the request")
+    op: BatchOperationType = Field(description="Operation that was performed")
+    status: int = Field(description="HTTP status the operation would have had as a single request")
+    data: Optional[Project | Task] = Field(default=None, description="Created or updated resource")
+    error: Optional[ErrorDetail] = Field(default=None, description="Error information when the operation failed")
+
+
+class BatchOutcome(BaseModel):
+    """Outcome of a batch request."""
+    committed: bool = Field(description="Whether any changes were committed")
+    results: list[BatchOperationResult] = Field(description="One result per operation, in request order")
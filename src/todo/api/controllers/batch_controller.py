@@ -0,0 +1,187 @@
+"""Batch endpoint controller: many write operations in one request."""
+
+import uuid
+from typing import Any, Callable, Optional
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+
+from ..controller_schemas.converters import task_to_schema
+from ..controller_schemas.models import (
+    BaseResponse,
+    BatchOperation,
+    BatchOperationResult,
+    BatchOutcome,
+    BatchRequest,
+    ErrorDetail,
+    Project,
+    Task,
+)
+from ..dependencies import get_db_session
+from ..exception_handlers import describe_exception
+from ...exceptions.repository import NotFoundError
+from ...exceptions.service import ValidationError
+from ...factory import create_batch_executor, create_todo_manager_with_session
+from ...models.project_orm import ProjectORM
+from ...services.todo_manager import ToDoListManager
+
+router = APIRouter()
+
+# Ids created by earlier operations of the batch, by operation index.
+CreatedIds = dict[int, str]
+
+
+def _resolve(value: Optional[str], created_ids: CreatedIds) -> Optional[str]:
+    """Replace a ``$N`` reference with the id created by operation N."""
+    if value is None or not value.startswith("$"):
+        return value
+    try:
+        index = int(value[1:])
+    except ValueError:
+        raise ValidationError(f"Invalid reference: {value!r}") from None
+    if index not in created_ids:
+        raise ValidationError(f"Reference {value!r} does not point to an earlier successful create operation")
+    return created_ids[index]
+
+
+def _parse_id(value: Optional[str], created_ids: CreatedIds, what: str) -> uuid.UUID:
+    resolved = _resolve(value, created_ids)
+    if resolved is None:
+        raise ValidationError(f"{what} is required")
+    try:
+        return uuid.UUID(resolved)
+    except ValueError:
+        raise ValidationError(f"Invalid {what}: {resolved!r}") from None
+
+
+def _project_data(manager: ToDoListManager, project: ProjectORM, task_count: Optional[int] = None) -> Project:
+    if task_count is None:
+        task_count = len(manager.list_project_tasks(project.id))
+    return Project(
+        id=project.id,
+        name=project.name,
+        description=project.description,
+        created_at=project.created_at,
+        task_count=task_count,
+        version=project.version,
+    )
+
+
+def _create_project(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> Project:
+    project = Project.model_validate(operation.data)
+    created = manager.create_project(project.name, project.description)
+    return _project_data(manager, created, task_count=0)
+
+
+def _update_project(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> Project:
+    project_id = _parse_id(operation.id, created_ids, "Project id")
+    project = Project.model_validate(operation.data)
+    updated = manager.edit_project(project_id, project.name, project.description or None, operation.if_match)
+    return _project_data(manager, updated)
+
+
+def _delete_project(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> None:
+    if not manager.delete_project(_parse_id(operation.id, created_ids, "Project id"), operation.if_match):
+        raise NotFoundError("Project not found")
+
+
+def _create_task(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> Task:
+    data = dict(operation.data)
+    project_id = data.pop("project_id", None)
+    project_uuid = _parse_id(None if project_id is None else str(project_id), created_ids, "Task project_id")
+    task = Task.model_validate(data)
+    if not task.title:
+        raise ValidationError("Task title is required")
+    created = manager.add_task_to_project(project_uuid, task.title, task.description or "", task.deadline)
+    return task_to_schema(created)
+
+
+def _update_task(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> Task:
+    task_id = _parse_id(operation.id, created_ids, "Task id")
+    task = Task.model_validate(operation.data)
+    # Fields left out (None) keep their current values
+    updated = manager.edit_task(
+        task_id, task.title, task.description, task.deadline, task.status, operation.if_match
+    )
+    return task_to_schema(updated)
+
+
+def _change_task_status(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> Task:
+    task_id = _parse_id(operation.id, created_ids, "Task id")
+    task = Task.model_validate(operation.data)
+    if task.status is None:
+        raise ValidationError("Status is required")
+    return task_to_schema(manager.change_task_status(task_id, task.status, operation.if_match))
+
+
+def _delete_task(manager: ToDoListManager, operation: BatchOperation, created_ids: CreatedIds) -> None:
+    if not manager.delete_task(_parse_id(operation.id, created_ids, "Task id"), operation.if_match):
+        raise NotFoundError("Task not found")
+
+
+# Handler and success status code of each operation type
+_OPERATIONS: dict[str, tuple[Callable[[ToDoListManager, BatchOperation, CreatedIds], Any], int]] = {
+    "create_project": (_create_project, status.HTTP_201_CREATED),
+    "update_project": (_update_project, status.HTTP_200_OK),
+    "delete_project": (_delete_project, status.HTTP_204_NO_CONTENT),
+    "create_task": (_create_task, status.HTTP_201_CREATED),
+    "update_task": (_update_task, status.HTTP_200_OK),
+    "change_task_status": (_change_task_status, status.HTTP_200_OK),
+    "delete_task": (_delete_task, status.HTTP_204_NO_CONTENT),
+}
+
+
+def _step(
+    manager: ToDoListManager, index: int, operation: BatchOperation, created_ids: CreatedIds
+) -> Callable[[], Any]:
+    handler, _ = _OPERATIONS[operation.op]
+
+    def run() -> Any:
+        result = handler(manager, operation, created_ids)
+        if operation.op.startswith("create_"):
+            created_ids[index] = str(result.id)
+        return result
+
+    return run
+
+
+@router.post(
+    "/batch",
+    response_model=BaseResponse[BatchOutcome],
+    status_code=status.HTTP_200_OK,
+    summary="Run several operations in one request",
+    description=(
+        "Execute an ordered list of project and task operations on one transaction. "
+        "With `atomic` (the default) the first failure rolls back the whole batch; "
+        "otherwise every operation succeeds or fails on its own. Each result carries "
+        "the status code the operation would have had as a single request."
+    ),
+)
+def run_batch(
+    batch: BatchRequest,
+    db: Session = Depends(get_db_session),
+) -> BaseResponse[BatchOutcome]:
+    """Execute a batch of operations."""
+    manager = create_todo_manager_with_session(db)
+    created_ids: CreatedIds = {}
+    steps = [_step(manager, index, operation, created_ids) for index, operation in enumerate(batch.operations)]
+
+    committed, outcomes = create_batch_executor(db).execute(steps, atomic=batch.atomic)
+
+    results = []
+    for index, (operation, outcome) in enumerate(zip(batch.operations, outcomes)):
+        if not outcome.executed:
+            status_code = status.HTTP_424_FAILED_DEPENDENCY
+            error = ErrorDetail(code="not_executed", message="Skipped because an earlier operation failed")
+        elif outcome.error is not None:
+            status_code, error = describe_exception(outcome.error)
+        else:
+            status_code, error = _OPERATIONS[operation.op][1], None
+        results.append(BatchOperationResult(
+            index=index, op=operation.op, status=status_code, data=outcome.value, error=error,
+        ))
+
+    return BaseResponse(
+        success=all(outcome.ok for outcome in outcomes),
+        data=BatchOutcome(committed=committed, results=results),
+    )
@@ -0,0 +1,100 @@
+"""Real-time task event endpoints (Server-Sent Events and WebSocket)."""
+
+import asyncio
+import uuid
+from typing import AsyncIterator
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from ...config.settings import settings
+from ...db.session import ReadOnlySessionLocal
+from ...events.broker import event_broker
+from ...events.publisher import TaskEvent
+from ...exceptions.repository import NotFoundError
+from ...factory import create_todo_manager_with_session
+
+router = APIRouter()
+
+
+def _project_exists(project_id: uuid.UUID) -> bool:
+    # A short-lived session: event streams stay open for a long time and must not hold a connection.
+    with ReadOnlySessionLocal() as session:
+        return create_todo_manager_with_session(session).get_project(project_id) is not None
+
+
+def _sse_message(task_event: TaskEvent) -> str:
+    return f"event: {task_event.type}\ndata: {task_event.to_json()}\n\n"
+
+
+async def _event_stream(project_id: uuid.UUID) -> AsyncIterator[str]:
+    async with event_broker.subscribe(str(project_id)) as subscription:
+        yield ": connected\n\n"
+        while True:
+            try:
+                task_event = await asyncio.wait_for(subscription.get(), settings.EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if task_event is None:
+                yield "event: dropped\ndata: {}\n\n"
+                return
+            yield _sse_message(task_event)
+
+
+@router.get(
+    "/projects/{project_id}/events",
+    status_code=status.HTTP_200_OK,
+    summary="Stream task events of a project",
+    description=(
+        "Server-Sent Events stream of task.created, task.updated, task.deleted and task.autoclosed "
+        "events for a project. A `dropped` event means the client fell behind and should reload the tasks."
+    ),
+    response_class=StreamingResponse,
+)
+async def stream_project_events(project_id: uuid.UUID) -> StreamingResponse:
+    """Stream task events of a project as Server-Sent Events."""
+    if not await run_in_threadpool(_project_exists, project_id):
+        raise NotFoundError("Project not found")
+
+    return StreamingResponse(
+        _event_stream(project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/projects/{project_id}/events/ws")
+async def project_events_websocket(websocket: WebSocket, project_id: uuid.UUID) -> None:
+    """Push task events of a project as JSON messages over a WebSocket."""
+    if not await run_in_threadpool(_project_exists, project_id):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Project not found")
+        return
+
+    await websocket.accept()
+    async with event_broker.subscribe(str(project_id)) as subscription:
+        # Incoming messages are ignored; reading them is how a client disconnect is noticed.
+        receiver = asyncio.create_task(websocket.receive_text())
+        getter = None
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.create_task(subscription.get())
+                done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+                if receiver in done:
+                    receiver.result()
+                    receiver = asyncio.create_task(websocket.receive_text())
+                if getter in done:
+                    task_event = getter.result()
+                    getter = None
+                    if task_event is None:
+                        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="dropped")
+                        return
+                    await websocket.send_text(task_event.to_json())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
+            if getter is not None:
+                getter.cancel()
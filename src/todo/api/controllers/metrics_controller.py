@@ -0,0 +1,19 @@
+"""Prometheus metrics endpoint controller."""
+
+from fastapi import APIRouter, Response
+
+from ...metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+    summary="Prometheus metrics",
+    description="Expose application metrics in Prometheus text format",
+)
+def metrics() -> Response:
+    """Metrics endpoint scraped by Prometheus."""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
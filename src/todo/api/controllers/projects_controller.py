@@ -1,48 +1,96 @@
 """Project endpoints controller."""
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+import uuid
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from ..controller_schemas.models import Project, BaseResponse
-from ...db.session import get_session
+from ..controller_schemas.converters import task_to_schema
+from ..controller_schemas.models import Project, ProjectListItem, BaseResponse
+from ..dependencies import (
+    PageParams,
+    etag,
+    get_db_session,
+    get_if_match_version,
+    includes,
+    keyset_page,
+    set_next_page_link,
+    sparse_fields,
+)
+from ...exceptions.service import ValidationError
 from ...factory import create_todo_manager_with_session
+from ...models.task_orm import TaskStatus
+from ...repositories.interfaces import PROJECT_ROW_FIELDS
 from ...services.todo_manager import ToDoListManager
 
 router = APIRouter()
 
+# Related resources that can be embedded in the project list with include=
+PROJECT_INCLUDES: tuple[str, ...] = ("tasks",)
+
 
-def get_todo_manager(db: Session = Depends(get_session)) -> ToDoListManager:
+def get_todo_manager(db: Session = Depends(get_db_session)) -> ToDoListManager:
     """FastAPI dependency for ToDoListManager."""
     return create_todo_manager_with_session(db)
 
 
 @router.get(
     "/projects",
-    response_model=BaseResponse[List[Project]],
+    response_model=BaseResponse[List[ProjectListItem]],
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     summary="List all projects",
-    description="Retrieve all projects with their task counts",
+    description=(
+        "Retrieve all projects with their task counts. Use `fields` to return a subset of attributes "
+        "and `include=tasks` to embed each project's tasks, optionally filtered by `status`. "
+        "With `limit` (and `after`) the list is paginated by id; a `Link` header points to the next page."
+    ),
 )
 def list_projects(
+    request: Request,
+    response: Response,
+    fields: tuple[str, ...] = Depends(sparse_fields(PROJECT_ROW_FIELDS)),
+    page: PageParams = Depends(keyset_page),
+    include: frozenset[str] = Depends(includes(PROJECT_INCLUDES)),
+    task_statuses: Optional[List[TaskStatus]] = Query(
+        default=None,
+        alias="status",
+        description="Only embed tasks with these statuses (repeatable, requires include=tasks)",
+    ),
     manager: ToDoListManager = Depends(get_todo_manager),
-) -> BaseResponse[List[Project]]:
+) -> BaseResponse[List[ProjectListItem]]:
     """List all projects."""
-    projects = manager.list_all_projects()
-    
-    # Convert ORM models to Pydantic models and add task counts
-    project_data = []
-    for project in projects:
-        task_count = len(manager.list_project_tasks(project.id))
-        project_dict = {
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "created_at": project.created_at,
-            "task_count": task_count,
-        }
-        project_data.append(Project(**project_dict))
-    
+    if "tasks" in include:
+        # Two queries in total: the projects, then the tasks of all of them
+        project_data = []
+        projects = manager.list_projects_with_tasks(task_statuses, page.after, page.limit)
+        for project, tasks, task_count in projects:
+            # task_count is the project's total, also when status= filters the embedded tasks
+            values = {
+                field: task_count if field == "task_count" else getattr(project, field)
+                for field in fields
+            }
+            project_data.append(
+                ProjectListItem(**values, tasks=[task_to_schema(task) for task in tasks])
+            )
+        if projects:
+            set_next_page_link(request, response, page, projects[-1][0].id, len(projects))
+        return BaseResponse(success=True, data=project_data)
+
+    if task_statuses:
+        raise ValidationError("The status filter requires include=tasks")
+
+    # The id is the page cursor, so it is selected even when not requested
+    selected = fields if page.limit is None or "id" in fields else (*fields, "id")
+    rows = manager.list_project_rows(selected, page.after, page.limit)
+
+    # Only the requested columns are set, so unrequested fields are left out of the response
+    project_data = [
+        ProjectListItem(**{field: getattr(row, field) for field in fields}) for row in rows
+    ]
+    if rows and page.limit is not None:
+        set_next_page_link(request, response, page, rows[-1].id, len(rows))
+
     return BaseResponse(success=True, data=project_data)
 
 
@@ -55,8 +103,9 @@ def list_projects(
 )
 def create_project(
     project: Project,
+    response: Response,
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> BaseResponse[Project]:
     """Create a new project."""
     try:
@@ -69,7 +118,9 @@ def create_project(
             description=created_project.description,
             created_at=created_project.created_at,
             task_count=0,
+            version=created_project.version,
         )
+        response.headers["ETag"] = etag(created_project.version)
         
         return BaseResponse(success=True, data=project_data)
     except Exception:
@@ -85,7 +136,8 @@ def create_project(
     description="Retrieve a single project by its unique identifier",
 )
 def get_project(
-    project_id: str,
+    project_id: uuid.UUID,
+    response: Response,
     manager: ToDoListManager = Depends(get_todo_manager),
 ) -> BaseResponse[Project]:
     """Get a project by ID."""
@@ -101,7 +153,9 @@ def get_project(
         description=project.description,
         created_at=project.created_at,
         task_count=task_count,
+        version=project.version,
     )
+    response.headers["ETag"] = etag(project.version)
     
     return BaseResponse(success=True, data=project_data)
 
@@ -111,18 +165,20 @@ def get_project(
     response_model=BaseResponse[Project],
     status_code=status.HTTP_200_OK,
     summary="Update a project",
-    description="Update an existing project's name and description",
+    description="Update an existing project's name and description. Send `If-Match` to reject stale updates.",
 )
 def update_project(
-    project_id: str,
+    project_id: uuid.UUID,
     project: Project,
+    response: Response,
+    expected_version: Optional[int] = Depends(get_if_match_version),
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> BaseResponse[Project]:
     """Update a project."""
     try:
         description = project.description if project.description else None
-        updated_project = manager.edit_project(project_id, project.name, description)
+        updated_project = manager.edit_project(project_id, project.name, description, expected_version)
         db.commit()
         
         task_count = len(manager.list_project_tasks(updated_project.id))
@@ -132,7 +188,9 @@ def update_project(
             description=updated_project.description,
             created_at=updated_project.created_at,
             task_count=task_count,
+            version=updated_project.version,
         )
+        response.headers["ETag"] = etag(updated_project.version)
         
         return BaseResponse(success=True, data=project_data)
     except Exception:
@@ -144,16 +202,17 @@ def update_project(
     "/projects/{project_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a project",
-    description="Delete a project and all its associated tasks (cascade delete)",
+    description="Delete a project and all its associated tasks (cascade delete). Send `If-Match` to reject stale deletes.",
 )
 def delete_project(
-    project_id: str,
+    project_id: uuid.UUID,
+    expected_version: Optional[int] = Depends(get_if_match_version),
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> None:
     """Delete a project."""
     try:
-        deleted = manager.delete_project(project_id)
+        deleted = manager.delete_project(project_id, expected_version)
         if not deleted:
             from ...exceptions.repository import NotFoundError
             raise NotFoundError("Project not found")
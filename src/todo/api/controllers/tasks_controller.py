@@ -1,18 +1,29 @@
 """Task endpoints controller."""
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+import uuid
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.orm import Session
 
+from ..controller_schemas.converters import task_to_schema
 from ..controller_schemas.models import Task, BaseResponse
-from ...db.session import get_session
+from ..dependencies import (
+    PageParams,
+    etag,
+    get_db_session,
+    get_if_match_version,
+    keyset_page,
+    set_next_page_link,
+    sparse_fields,
+)
 from ...factory import create_todo_manager_with_session
+from ...repositories.interfaces import TASK_ROW_FIELDS
 from ...services.todo_manager import ToDoListManager
 
 router = APIRouter()
 
 
-def get_todo_manager(db: Session = Depends(get_session)) -> ToDoListManager:
+def get_todo_manager(db: Session = Depends(get_db_session)) -> ToDoListManager:
     """FastAPI dependency for ToDoListManager."""
     return create_todo_manager_with_session(db)
 
@@ -21,31 +32,32 @@ def get_todo_manager(db: Session = Depends(get_session)) -> ToDoListManager:
     "/projects/{project_id}/tasks",
     response_model=BaseResponse[List[Task]],
     status_code=status.HTTP_200_OK,
+    response_model_exclude_unset=True,
     summary="List tasks in a project",
-    description="Retrieve all tasks belonging to a specific project",
+    description=(
+        "Retrieve all tasks belonging to a specific project. Use `fields` to return a subset of attributes. "
+        "With `limit` (and `after`) the list is paginated by id; a `Link` header points to the next page."
+    ),
 )
 def list_project_tasks(
-    project_id: str,
+    project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    fields: tuple[str, ...] = Depends(sparse_fields(TASK_ROW_FIELDS)),
+    page: PageParams = Depends(keyset_page),
     manager: ToDoListManager = Depends(get_todo_manager),
 ) -> BaseResponse[List[Task]]:
     """List all tasks for a project."""
-    tasks = manager.list_project_tasks(project_id)
-    
-    # Convert ORM models to Pydantic models
-    task_data = []
-    for task in tasks:
-        task_dict = {
-            "id": task.id,
-            "project_id": task.project_id,
-            "title": task.title,
-            "description": task.description,
-            "status": task.status,
-            "deadline": task.deadline,
-            "created_at": task.created_at,
-            "closed_at": task.closed_at,
-        }
-        task_data.append(Task(**task_dict))
-    
+    # The id is the page cursor, so it is selected even when not requested
+    selected = fields if page.limit is None or "id" in fields else (*fields, "id")
+    rows = manager.list_project_task_rows(project_id, selected, page.after, page.limit)
+
+    # Only the requested columns are set, so unrequested fields are left out of the response.
+    # Stored rows are not re-validated: a past deadline is only rejected on input.
+    task_data = [Task.model_construct(**{field: getattr(row, field) for field in fields}) for row in rows]
+    if rows and page.limit is not None:
+        set_next_page_link(request, response, page, rows[-1].id, len(rows))
+
     return BaseResponse(success=True, data=task_data)
 
 
@@ -57,10 +69,11 @@ def list_project_tasks(
     description="Create a new task within a specific project",
 )
 def create_task(
-    project_id: str,
+    project_id: uuid.UUID,
     task: Task,
+    response: Response,
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> BaseResponse[Task]:
     """Create a new task in a project."""
     try:
@@ -77,16 +90,8 @@ def create_task(
         )
         db.commit()
         
-        task_data = Task(
-            id=created_task.id,
-            project_id=created_task.project_id,
-            title=created_task.title,
-            description=created_task.description,
-            status=created_task.status,
-            deadline=created_task.deadline,
-            created_at=created_task.created_at,
-            closed_at=created_task.closed_at,
-        )
+        task_data = task_to_schema(created_task)
+        response.headers["ETag"] = etag(created_task.version)
         
         return BaseResponse(success=True, data=task_data)
     except Exception:
@@ -102,7 +107,8 @@ def create_task(
     description="Retrieve a single task by its unique identifier",
 )
 def get_task(
-    task_id: str,
+    task_id: uuid.UUID,
+    response: Response,
     manager: ToDoListManager = Depends(get_todo_manager),
 ) -> BaseResponse[Task]:
     """Get a task by ID."""
@@ -111,16 +117,8 @@ def get_task(
         from ...exceptions.repository import NotFoundError
         raise NotFoundError("Task not found")
     
-    task_data = Task(
-        id=task.id,
-        project_id=task.project_id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        deadline=task.deadline,
-        created_at=task.created_at,
-        closed_at=task.closed_at,
-    )
+    task_data = task_to_schema(task)
+    response.headers["ETag"] = etag(task.version)
     
     return BaseResponse(success=True, data=task_data)
 
@@ -130,50 +128,39 @@ def get_task(
     response_model=BaseResponse[Task],
     status_code=status.HTTP_200_OK,
     summary="Update a task",
-    description="Update an existing task's details (partial update supported)",
+    description="Update an existing task's details (partial update supported). Send `If-Match` to reject stale updates.",
+)
+@router.patch(
+    "/tasks/{task_id}",
+    response_model=BaseResponse[Task],
+    status_code=status.HTTP_200_OK,
+    summary="Partially update a task",
+    description="Update only the provided fields of a task in a single statement. Send `If-Match` to reject stale updates.",
 )
 def update_task(
-    task_id: str,
+    task_id: uuid.UUID,
     task: Task,
+    response: Response,
+    expected_version: Optional[int] = Depends(get_if_match_version),
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> BaseResponse[Task]:
     """Update a task."""
     try:
-        from ...models.task_orm import TaskStatus
-        
-        # Get existing task to preserve fields not provided
-        existing_task = manager.get_task(None, task_id)
-        if existing_task is None:
-            from ...exceptions.repository import NotFoundError
-            raise NotFoundError("Task not found")
-        
-        # Use provided values or keep existing ones
-        title = task.title if task.title is not None else existing_task.title
-        description = task.description if task.description is not None else existing_task.description
-        deadline = task.deadline if task.deadline is not None else existing_task.deadline
-        status_value = task.status if task.status is not None else existing_task.status
-        
+        # Fields that are not provided keep their current values
         updated_task = manager.edit_task(
             task_id,
-            title,
-            description,
-            deadline,
-            status_value,
+            task.title,
+            task.description,
+            task.deadline,
+            task.status,
+            expected_version,
         )
+        # Built from the RETURNING row before commit expires it, to avoid a reload
+        task_data = task_to_schema(updated_task)
+        response.headers["ETag"] = etag(updated_task.version)
         db.commit()
         
-        task_data = Task(
-            id=updated_task.id,
-            project_id=updated_task.project_id,
-            title=updated_task.title,
-            description=updated_task.description,
-            status=updated_task.status,
-            deadline=updated_task.deadline,
-            created_at=updated_task.created_at,
-            closed_at=updated_task.closed_at,
-        )
-        
         return BaseResponse(success=True, data=task_data)
     except Exception:
         db.rollback()
@@ -184,16 +171,17 @@ def update_task(
     "/tasks/{task_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a task",
-    description="Delete a task by its unique identifier",
+    description="Delete a task by its unique identifier. Send `If-Match` to reject stale deletes.",
 )
 def delete_task(
-    task_id: str,
+    task_id: uuid.UUID,
+    expected_version: Optional[int] = Depends(get_if_match_version),
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> None:
     """Delete a task."""
     try:
-        deleted = manager.delete_task(task_id)
+        deleted = manager.delete_task(task_id, expected_version)
         if not deleted:
             from ...exceptions.repository import NotFoundError
             raise NotFoundError("Task not found")
@@ -208,13 +196,15 @@ def delete_task(
     response_model=BaseResponse[Task],
     status_code=status.HTTP_200_OK,
     summary="Change task status",
-    description="Update only the status of a task",
+    description="Update only the status of a task. Send `If-Match` to reject stale updates.",
 )
 def change_task_status(
-    task_id: str,
+    task_id: uuid.UUID,
     task: Task,
+    response: Response,
+    expected_version: Optional[int] = Depends(get_if_match_version),
     manager: ToDoListManager = Depends(get_todo_manager),
-    db: Session = Depends(get_session),
+    db: Session = Depends(get_db_session),
 ) -> BaseResponse[Task]:
     """Change task status."""
     try:
@@ -222,20 +212,11 @@ def change_task_status(
             from ...exceptions.service import ValidationError
             raise ValidationError("Status is required")
         
-        updated_task = manager.change_task_status(task_id, task.status)
+        updated_task = manager.change_task_status(task_id, task.status, expected_version)
+        task_data = task_to_schema(updated_task)
+        response.headers["ETag"] = etag(updated_task.version)
         db.commit()
         
-        task_data = Task(
-            id=updated_task.id,
-            project_id=updated_task.project_id,
-            title=updated_task.title,
-            description=updated_task.description,
-            status=updated_task.status,
-            deadline=updated_task.deadline,
-            created_at=updated_task.created_at,
-            closed_at=updated_task.closed_at,
-        )
-        
         return BaseResponse(success=True, data=task_data)
     except Exception:
         db.rollback()
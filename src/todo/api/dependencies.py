@@ -0,0 +1,154 @@
+"""Shared FastAPI dependencies."""
+
+import uuid
+from typing import Any, Callable, Generator, NamedTuple, Optional, Sequence
+
+from fastapi import Header, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from ..config.settings import settings
+from ..db.session import SessionLocal, ReadOnlySessionLocal
+from ..exceptions.repository import PreconditionFailedError
+from ..exceptions.service import ValidationError
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def get_client_key(request: Request) -> str:
+    """Identify the calling client by its address.
+
+    Never taken from a header the client sets freely: the key scopes rate limits and
+    idempotency records. Behind a reverse proxy the server resolves the address from
+    ``X-Forwarded-For`` when the proxy is listed in ``SERVER_FORWARDED_ALLOW_IPS``.
+    """
+    return request.client.host if request.client else "anonymous"
+
+
+def get_db_session(request: Request) -> Generator[Session, None, None]:
+    """Provides a request-scoped database session.
+
+    Safe-method requests get a read-only session that runs without a transaction and
+    may be served by a replica; all other requests are bound to the primary.
+    """
+    factory = ReadOnlySessionLocal if request.method in READ_ONLY_METHODS else SessionLocal
+    session = factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def etag(version: int) -> str:
+    """Entity tag for a resource version."""
+    return f'"{version}"'
+
+
+def get_if_match_version(
+    if_match: Optional[str] = Header(
+        default=None,
+        description="ETag of the version the change applies to; the request fails with 412 if it is stale",
+    ),
+) -> Optional[int]:
+    """Parse the ``If-Match`` precondition into the expected resource version.
+
+    Returns None when the header is absent or ``*``. Weak tags are accepted, since
+    compression may weaken the ETag seen by clients. A tag that cannot be a version
+    of this API never matches.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip().removeprefix("W/")
+    if len(tag) >= 2 and tag[0] == tag[-1] == '"':
+        tag = tag[1:-1]
+    if not tag.isdigit():
+        raise PreconditionFailedError("If-Match does not match the current version")
+    return int(tag)
+
+
+def _parse_names(value: str, allowed: Sequence[str], label: str) -> tuple[str, ...]:
+    """Split a comma-separated query value into unique names, rejecting unknown ones."""
+    requested = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in allowed]
+    if not requested or unknown:
+        raise ValidationError(
+            f"Invalid {label}: {', '.join(unknown) or value!r}. Allowed: {', '.join(allowed)}"
+        )
+    return requested
+
+
+def sparse_fields(allowed: Sequence[str]) -> Callable[[Optional[str]], tuple[str, ...]]:
+    """Build a dependency parsing the ``fields=`` sparse-fieldset query parameter.
+
+    The dependency returns the requested field names in request order (all of
+    ``allowed`` when the parameter is absent) and rejects unknown names.
+    """
+    def dependency(
+        fields: Optional[str] = Query(
+            default=None,
+            description=f"Comma-separated fields to return (any of: {', '.join(allowed)})",
+        ),
+    ) -> tuple[str, ...]:
+        if fields is None:
+            return tuple(allowed)
+        return _parse_names(fields, allowed, "fields")
+
+    return dependency
+
+
+def includes(allowed: Sequence[str]) -> Callable[[Optional[str]], frozenset[str]]:
+    """Build a dependency parsing the ``include=`` query parameter for related resources.
+
+    The dependency returns the requested relation names (empty when the parameter is
+    absent) and rejects unknown names.
+    """
+    def dependency(
+        include: Optional[str] = Query(
+            default=None,
+            description=f"Comma-separated related resources to embed (any of: {', '.join(allowed)})",
+        ),
+    ) -> frozenset[str]:
+        if include is None:
+            return frozenset()
+        return frozenset(_parse_names(include, allowed, "include"))
+
+    return dependency
+
+
+class PageParams(NamedTuple):
+    """Keyset page request: up to ``limit`` items with ids greater than ``after``.
+
+    ``limit`` is None when the client asked for the whole (unpaginated) list.
+    """
+
+    after: Optional[uuid.UUID]
+    limit: Optional[int]
+
+
+def keyset_page(
+    after: Optional[uuid.UUID] = Query(
+        default=None,
+        description="Return only items after this id (the last id of the previous page)",
+    ),
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="Maximum number of items to return; enables keyset pagination ordered by id",
+    ),
+) -> PageParams:
+    """Parse the keyset pagination query parameters.
+
+    Without either parameter the full list is returned in creation order. ``after``
+    alone pages with the maximum page size.
+    """
+    if after is not None and limit is None:
+        limit = settings.MAX_PAGE_SIZE
+    return PageParams(after=after, limit=limit)
+
+
+def set_next_page_link(request: Request, response: Response, page: PageParams, last_id: Any, count: int) -> None:
+    """Add a ``Link: <...>; rel="next"`` header when the page came back full."""
+    if page.limit is None or count < page.limit:
+        return
+    next_url = request.url.include_query_params(after=str(last_id), limit=page.limit)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -5,64 +5,99 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
-from ..exceptions.repository import NotFoundError, DuplicateError
+from ..exceptions.repository import NotFoundError, DuplicateError, PreconditionFailedError
 from ..exceptions.service import ValidationError as ServiceValidationError, BusinessRuleError
 from .controller_schemas.models import ErrorResponse, ErrorDetail
+from ..metrics import HTTP_ERRORS
 
 
-async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
-    """Handle NotFoundError exceptions."""
+def error_response(
+    status_code: int, code: str, message: str, details: dict | None = None
+) -> JSONResponse:
+    """Build an error envelope response and count it by error code."""
+    HTTP_ERRORS.labels(code).inc()
     return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
+        status_code=status_code,
         content=ErrorResponse(
             success=False,
-            error=ErrorDetail(
-                code="resource_not_found",
-                message=str(exc) or "Resource not found",
-            ),
+            error=ErrorDetail(code=code, message=message, details=details),
         ).model_dump(),
     )
 
 
+def describe_exception(exc: Exception) -> tuple[int, ErrorDetail]:
+    """Map an exception to the status code and error detail of its error response.
+
+    Used where errors are reported inside a response body (batch operations) rather
+    than through the exception handlers below.
+    """
+    if isinstance(exc, NotFoundError):
+        return status.HTTP_404_NOT_FOUND, ErrorDetail(code="resource_not_found", message=str(exc) or "Resource not found")
+    if isinstance(exc, DuplicateError):
+        return status.HTTP_409_CONFLICT, ErrorDetail(code="duplicate_resource", message=str(exc) or "Resource already exists")
+    if isinstance(exc, PreconditionFailedError):
+        return status.HTTP_412_PRECONDITION_FAILED, ErrorDetail(
+            code="precondition_failed", message=str(exc) or "Precondition failed"
+        )
+    if isinstance(exc, ServiceValidationError):
+        return status.HTTP_400_BAD_REQUEST, ErrorDetail(code="validation_error", message=str(exc) or "Validation failed")
+    if isinstance(exc, BusinessRuleError):
+        return status.HTTP_400_BAD_REQUEST, ErrorDetail(
+            code="business_rule_violation", message=str(exc) or "Business rule violation"
+        )
+    if isinstance(exc, ValidationError):
+        return status.HTTP_422_UNPROCESSABLE_ENTITY, ErrorDetail(
+            code="request_validation_error",
+            message="Request validation failed",
+            details={"errors": [f"{err['loc']}: {err['msg']}" for err in exc.errors()]},
+        )
+    return status.HTTP_500_INTERNAL_SERVER_ERROR, ErrorDetail(
+        code="internal_server_error", message="An unexpected error occurred"
+    )
+
+
+async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
+    """Handle NotFoundError exceptions."""
+    return error_response(
+        status.HTTP_404_NOT_FOUND,
+        "resource_not_found",
+        str(exc) or "Resource not found",
+    )
+
+
 async def duplicate_error_handler(request: Request, exc: DuplicateError) -> JSONResponse:
     """Handle DuplicateError exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content=ErrorResponse(
-            success=False,
-            error=ErrorDetail(
-                code="duplicate_resource",
-                message=str(exc) or "Resource already exists",
-            ),
-        ).model_dump(),
+    return error_response(
+        status.HTTP_409_CONFLICT,
+        "duplicate_resource",
+        str(exc) or "Resource already exists",
+    )
+
+
+async def precondition_failed_handler(request: Request, exc: PreconditionFailedError) -> JSONResponse:
+    """Handle PreconditionFailedError exceptions (stale If-Match)."""
+    return error_response(
+        status.HTTP_412_PRECONDITION_FAILED,
+        "precondition_failed",
+        str(exc) or "Precondition failed",
     )
 
 
 async def validation_error_handler(request: Request, exc: ServiceValidationError) -> JSONResponse:
     """Handle service-level ValidationError exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=ErrorResponse(
-            success=False,
-            error=ErrorDetail(
-                code="validation_error",
-                message=str(exc) or "Validation failed",
-            ),
-        ).model_dump(),
+    return error_response(
+        status.HTTP_400_BAD_REQUEST,
+        "validation_error",
+        str(exc) or "Validation failed",
     )
 
 
 async def business_rule_error_handler(request: Request, exc: BusinessRuleError) -> JSONResponse:
     """Handle BusinessRuleError exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=ErrorResponse(
-            success=False,
-            error=ErrorDetail(
-                code="business_rule_violation",
-                message=str(exc) or "Business rule violation",
-            ),
-        ).model_dump(),
+    return error_response(
+        status.HTTP_400_BAD_REQUEST,
+        "business_rule_violation",
+        str(exc) or "Business rule violation",
     )
 
 
@@ -70,29 +105,19 @@ async def request_validation_error_handler(request: Request, exc: RequestValidat
     """Handle FastAPI request validation errors."""
     errors = exc.errors()
     error_messages = [f"{err['loc']}: {err['msg']}" for err in errors]
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ErrorResponse(
-            success=False,
-            error=ErrorDetail(
-                code="request_validation_error",
-                message="Request validation failed",
-                details={"errors": error_messages},
-            ),
-        ).model_dump(),
+    return error_response(
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+        "request_validation_error",
+        "Request validation failed",
+        details={"errors": error_messages},
     )
 
 
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handle unexpected exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            success=False,
-            error=ErrorDetail(
-                code="internal_server_error",
-                message="An unexpected error occurred",
-            ),
-        ).model_dump(),
+    return error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "internal_server_error",
+        "An unexpected error occurred",
     )
 
@@ -0,0 +1,535 @@
+"""ASGI middleware for the Web API."""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import math
+import time
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qsl
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config.settings import settings
+from ..db.instrumentation import track_queries
+from ..db.session import get_session_ctx, track_client_writes
+from ..db.types import utc_now
+from ..factory import create_idempotency_repository
+from ..metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS, HTTP_THROTTLED_REQUESTS
+from ..models.idempotency_key_orm import IdempotencyKeyORM
+from .dependencies import get_client_key
+from .exception_handlers import error_response
+from .rate_limit import (
+    RateLimitBackend,
+    get_rate_limit_key,
+    retry_after_header,
+    route_group_limit,
+)
+
+# Operational endpoints that are never throttled, so monitoring keeps working under load.
+UNTHROTTLED_PATHS = frozenset({"/metrics", "/api/v1/health", "/docs", "/redoc", "/openapi.json"})
+
+
+class QueryTimingMiddleware:
+    """Count SQL statements per request and report them in a ``Server-Timing`` header."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(endpoint=f"{scope['method']} {scope['path']}") as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.SERVER_TIMING_ENABLED:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+
+# Cookie carrying the time (Unix seconds) of the client's last committed write.
+LAST_WRITE_COOKIE = "todo_last_write"
+
+
+def _parse_last_write(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client's reads to the primary for a while after it wrote (read replicas only).
+
+    A request that commits a write sets the ``todo_last_write`` cookie; while it is recent,
+    the client's reads skip the replicas. The state travels with the client, so it holds
+    across worker processes and servers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        last_write_at = _parse_last_write(Request(scope).cookies.get(LAST_WRITE_COOKIE))
+        with track_client_writes(last_write_at) as writes:
+            async def send_with_cookie(message: Message) -> None:
+                if message["type"] == "http.response.start" and writes.wrote_at is not None:
+                    response = Response()
+                    response.set_cookie(
+                        LAST_WRITE_COOKIE,
+                        f"{writes.wrote_at:.3f}",
+                        max_age=math.ceil(settings.DATABASE_REPLICA_STICKINESS_SECONDS),
+                        httponly=True,
+                        samesite="lax",
+                    )
+                    headers = MutableHeaders(scope=message)
+                    for name, value in response.raw_headers:
+                        headers.append(name.decode("latin-1"), value.decode("latin-1"))
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
+
+
+class MetricsMiddleware:
+    """Record request latency per route and the number of in-flight requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # Label by route template (not the concrete path) to keep cardinality bounded.
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(method, route_path, str(status_code)).observe(
+                time.perf_counter() - start
+            )
+
+
+def _compress_gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+# Available encoders in server preference order (used to break ties between equal q-values).
+_ENCODERS: dict[str, Callable[[bytes], bytes]] = {}
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+else:
+    def _compress_zstd(body: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(body)
+
+    _ENCODERS["zstd"] = _compress_zstd
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+else:
+    def _compress_brotli(body: bytes) -> bytes:
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    _ENCODERS["br"] = _compress_brotli
+
+_ENCODERS["gzip"] = _compress_gzip
+
+_COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best available content coding for an ``Accept-Encoding`` header value."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in _ENCODERS:
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith("text/") or media_type in _COMPRESSIBLE_TYPES or media_type.endswith("+json")
+
+
+class CompressionMiddleware:
+    """Compress responses with the best coding the client accepts (zstd, br or gzip).
+
+    Brotli and zstd are used when the optional ``brotli``/``zstandard`` packages are
+    installed. Only complete (single-message) responses of a compressible type and at
+    least ``COMPRESSION_MINIMUM_SIZE`` bytes are compressed; streamed responses such as
+    server-sent events pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or not _is_compressible(headers.get("content-type", ""))
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            if len(body) >= settings.COMPRESSION_MINIMUM_SIZE:
+                body = _ENCODERS[coding](body)
+                headers["Content-Encoding"] = coding
+                headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _strip_nulls(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _strip_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_strip_nulls(item) for item in value]
+    return value
+
+
+class CompactJSONMiddleware:
+    """Drop null-valued fields from JSON responses when the request has ``compact=1``."""
+
+    _ENABLED_VALUES = frozenset({"1", "true", "yes", "on"})
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compact(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            body = message.get("body", b"")
+            media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+            if message.get("more_body", False) or media_type != "application/json" or not body:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            body = json.dumps(
+                _strip_nulls(json.loads(body)), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            headers["Content-Length"] = str(len(body))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compact)
+
+    def _is_requested(self, scope: Scope) -> bool:
+        query = scope.get("query_string", b"").decode("latin-1")
+        return any(
+            name == "compact" and value.lower() in self._ENABLED_VALUES
+            for name, value in parse_qsl(query)
+        )
+
+
+def _claim_idempotency_key(client_key: str, key: str, fingerprint: str) -> Optional[IdempotencyKeyORM]:
+    """Claim a key for this request, or return the record of an earlier request that holds it.
+
+    The claim expires after ``IDEMPOTENCY_CLAIM_TIMEOUT_SECONDS``, so a request whose worker died
+    before storing a response blocks retries only that long; completing it extends the record
+    to the full TTL.
+    """
+    expires_at = utc_now() + datetime.timedelta(seconds=settings.IDEMPOTENCY_CLAIM_TIMEOUT_SECONDS)
+    with get_session_ctx() as session:
+        repository = create_idempotency_repository(session)
+        # A concurrent request may claim the key between the lookup and the claim; look again then.
+        for _ in range(2):
+            record = repository.get(client_key, key)
+            if record is not None:
+                return record
+            if repository.claim(client_key, key, fingerprint, expires_at):
+                session.commit()
+                return None
+        raise RuntimeError(f"Could not claim idempotency key {key!r}")
+
+
+def _finish_idempotency_key(
+    client_key: str, key: str, status_code: Optional[int], content_type: Optional[str], body: bytes
+) -> None:
+    """Store the response for a claimed key, or release the key when there is nothing to replay."""
+    with get_session_ctx() as session:
+        repository = create_idempotency_repository(session)
+        if status_code is None or status_code >= 500:
+            repository.release(client_key, key)
+        else:
+            expires_at = utc_now() + datetime.timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+            repository.complete(client_key, key, status_code, content_type, body, expires_at)
+        session.commit()
+
+
+class IdempotencyMiddleware:
+    """Replay stored responses for POST requests that repeat an ``Idempotency-Key`` header.
+
+    The first request with a key claims it, runs normally and has its response saved for
+    ``IDEMPOTENCY_TTL_SECONDS``. Later requests from the same client with the same key get
+    the saved response (marked with ``Idempotent-Replayed: true``) without running the
+    endpoint again. Reusing a key for a different request is rejected with 422, and a retry
+    that arrives while the first request is still running gets 409. Server errors (5xx) are
+    not saved, so the request can be retried.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        key = Headers(scope=scope).get("idempotency-key")
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > 255:
+            response = error_response(
+                400, "invalid_idempotency_key", "Idempotency-Key must be 1-255 characters"
+            )
+            await response(scope, receive, send)
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        client_key = get_client_key(Request(scope))
+        fingerprint = hashlib.sha256(
+            b"\0".join((scope["method"].encode(), scope["path"].encode(), scope.get("query_string", b""), body))
+        ).hexdigest()
+
+        record = await run_in_threadpool(_claim_idempotency_key, client_key, key, fingerprint)
+        if record is not None:
+            await self._respond_with_record(record, fingerprint, scope, receive, send)
+            return
+
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code: Optional[int] = None
+        content_type: Optional[str] = None
+        chunks: list[bytes] = []
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status_code, content_type
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                content_type = Headers(raw=message.get("headers", [])).get("content-type")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_body, send_and_capture)
+        except BaseException:
+            await run_in_threadpool(_finish_idempotency_key, client_key, key, None, None, b"")
+            raise
+        await run_in_threadpool(
+            _finish_idempotency_key, client_key, key, status_code, content_type, b"".join(chunks)
+        )
+
+    @staticmethod
+    async def _respond_with_record(
+        record: IdempotencyKeyORM, fingerprint: str, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if record.fingerprint != fingerprint:
+            response = error_response(
+                422,
+                "idempotency_key_mismatch",
+                "Idempotency-Key was already used for a different request",
+            )
+        elif not record.is_completed:
+            response = error_response(
+                409,
+                "idempotency_key_in_progress",
+                "A request with this Idempotency-Key is still being processed",
+            )
+            response.headers["Retry-After"] = "1"
+        else:
+            response = Response(
+                content=record.body,
+                status_code=record.status_code,
+                media_type=record.content_type,
+                headers={"Idempotent-Replayed": "true"},
+            )
+        await response(scope, receive, send)
+
+
+class RateLimitMiddleware:
+    """Token-bucket rate limits per client and route group (reads vs writes).
+
+    Clients are identified by their ``X-API-Key`` header when it is one of
+    ``RATE_LIMIT_API_KEYS``, otherwise by their address.
+    Requests over the limit get 429 with ``Retry-After``.
+    """
+
+    def __init__(self, app: ASGIApp, backend: RateLimitBackend) -> None:
+        self.app = app
+        self.backend = backend
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in UNTHROTTLED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        group, limit = route_group_limit(scope["method"])
+        principal = get_rate_limit_key(request.headers.get("x-api-key"), get_client_key(request))
+        wait = await self.backend.acquire(f"{group}:{principal}", limit)
+        if wait > 0:
+            HTTP_THROTTLED_REQUESTS.labels("rate_limited", group).inc()
+            response = error_response(429, "rate_limited", "Too many requests, slow down")
+            response.headers["Retry-After"] = retry_after_header(wait)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class LoadSheddingMiddleware:
+    """Reject requests with 503 once ``max_in_flight`` are already being served by this worker.
+
+    Event streams (``.../events``) are exempt. Shedding early keeps excess requests from queueing on the database pool, where they
+    would time out anyway after holding a worker thread.
+    """
+
+    def __init__(self, app: ASGIApp, max_in_flight: int) -> None:
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Event streams stay open indefinitely without using the database, so they are not counted.
+        if scope["type"] != "http" or scope["path"] in UNTHROTTLED_PATHS or scope["path"].endswith("/events"):
+            await self.app(scope, receive, send)
+            return
+
+        if self.in_flight >= self.max_in_flight:
+            group, _ = route_group_limit(scope["method"])
+            HTTP_THROTTLED_REQUESTS.labels("overloaded", group).inc()
+            response = error_response(503, "overloaded", "Server is busy, retry shortly")
+            response.headers["Retry-After"] = "1"
+            await response(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,130 @@
+"""Token-bucket rate limiting state, kept per worker or shared through Redis."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from ..config.settings import settings
+from .dependencies import READ_ONLY_METHODS
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained rate (tokens per second) and burst capacity of a bucket."""
+    rate: float
+    burst: int
+
+
+class RateLimitBackend(ABC):
+    """Storage for token buckets."""
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        """Take one token from ``key``'s bucket.
+
+        Returns:
+            0 when the request is allowed, otherwise the seconds until a token is available
+        """
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Token buckets held in this worker process (limits apply per worker)."""
+
+    def __init__(self, max_buckets: int = 100_000) -> None:
+        self.max_buckets = max_buckets
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (float(limit.burst), now))
+            tokens = min(float(limit.burst), tokens + (now - updated) * limit.rate)
+            if tokens >= 1.0:
+                self._buckets[key] = (tokens - 1.0, now)
+                allowed = True
+            else:
+                self._buckets[key] = (tokens, now)
+                allowed = False
+            if len(self._buckets) > self.max_buckets:
+                self._evict_full_buckets(now, limit)
+        return 0.0 if allowed else (1.0 - tokens) / limit.rate
+
+    def _evict_full_buckets(self, now: float, limit: RateLimit) -> None:
+        # A bucket idle long enough to refill completely is equivalent to a missing one.
+        idle = limit.burst / limit.rate
+        for key in [k for k, (_, updated) in self._buckets.items() if now - updated >= idle]:
+            del self._buckets[key]
+
+
+# Atomically refill and take a token; returns the wait in milliseconds (0 when allowed).
+_REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = redis.call('TIME')
+now = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - updated) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return wait
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Token buckets shared by all workers through Redis (requires the ``redis`` package)."""
+
+    def __init__(self, url: str, prefix: str = "todo:ratelimit:") -> None:
+        import redis.asyncio
+
+        self.prefix = prefix
+        self._client = redis.asyncio.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        wait_ms = await self._script(keys=[self.prefix + key], args=[limit.rate, limit.burst])
+        return int(wait_ms) / 1000
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    """Create the configured rate limit backend (Redis when ``RATE_LIMIT_REDIS_URL`` is set)."""
+    if settings.RATE_LIMIT_REDIS_URL:
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    return InMemoryRateLimitBackend()
+
+
+def retry_after_header(wait: float) -> str:
+    """Format a wait in seconds as a ``Retry-After`` value (whole seconds, at least 1)."""
+    return str(max(1, math.ceil(wait)))
+
+
+def route_group_limit(method: str) -> tuple[str, RateLimit]:
+    """Route group ("read" or "write") and its limit for an HTTP method."""
+    if method in READ_ONLY_METHODS:
+        return "read", RateLimit(settings.RATE_LIMIT_READS_PER_SECOND, settings.RATE_LIMIT_READ_BURST)
+    return "write", RateLimit(settings.RATE_LIMIT_WRITES_PER_SECOND, settings.RATE_LIMIT_WRITE_BURST)
+
+
+def get_rate_limit_key(api_key: Optional[str], client_key: str) -> str:
+    """Identify the rate-limited principal: a configured API key, otherwise the client.
+
+    Keys are not otherwise authenticated, so an unknown key is ignored; trusting it would
+    let a client get a fresh bucket on every request by sending a new key each time.
+    """
+    if api_key and api_key in settings.RATE_LIMIT_API_KEYS:
+        return f"key:{api_key}"
+    return f"client:{client_key}"
@@ -2,7 +2,15 @@
 
 from fastapi import APIRouter
 
-from .controllers import health_controller, projects_controller, tasks_controller
+from ..config.settings import settings
+
+from .controllers import (
+    health_controller,
+    projects_controller,
+    tasks_controller,
+    batch_controller,
+    events_controller,
+)
 
 # Create main API router
 api_router = APIRouter()
@@ -11,4 +19,7 @@ api_router = APIRouter()
 api_router.include_router(health_controller.router, tags=["health"])
 api_router.include_router(projects_controller.router, tags=["projects"])
 api_router.include_router(tasks_controller.router, tags=["tasks"])
+api_router.include_router(batch_controller.router, tags=["batch"])
+if settings.EVENTS_ENABLED:
+    api_router.include_router(events_controller.router, tags=["events"])
 
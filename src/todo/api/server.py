@@ -0,0 +1,69 @@
+"""Production server: multi-worker uvicorn with uvloop and httptools."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+from typing import Optional
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Import string of the ASGI app: each worker process imports it on its own.
+APP = "src.todo.api.app:app"
+
+
+def _implementation(module: str, fallback: str) -> str:
+    """Use ``module`` when installed (it ships with ``uvicorn[standard]``), else ``fallback``."""
+    if importlib.util.find_spec(module) is None:
+        logger.warning(f"{module} is not installed; falling back to {fallback}")
+        return fallback
+    return module
+
+
+def run_server(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> None:
+    """Serve the API until SIGINT/SIGTERM.
+
+    Arguments default to the ``SERVER_*`` settings; the worker count defaults to
+    the CPU count. With in-memory storage or idempotency records a single worker is
+    used, since each worker process would hold its own copy. On shutdown each worker stops accepting connections and waits
+    up to ``SERVER_GRACEFUL_SHUTDOWN_SECONDS`` for in-flight requests before the
+    app's lifespan releases the connection pools.
+    """
+    import uvicorn
+
+    workers = max(1, workers or settings.SERVER_WORKERS or os.cpu_count() or 1)
+    per_process = [
+        name for name, backend in (
+            ("STORAGE_BACKEND", settings.STORAGE_BACKEND),
+            ("IDEMPOTENCY_BACKEND", settings.IDEMPOTENCY_BACKEND),
+        )
+        if backend == "memory"
+    ]
+    if per_process and workers > 1:
+        logger.warning(
+            f"Running 1 worker instead of {workers}: {' and '.join(per_process)} = memory "
+            f"keeps data per process, so workers would not see each other's changes"
+        )
+        workers = 1
+    uvicorn.run(
+        APP,
+        host=host or settings.SERVER_HOST,
+        port=port or settings.SERVER_PORT,
+        workers=workers,
+        loop=_implementation("uvloop", "asyncio"),
+        http=_implementation("httptools", "h11"),
+        lifespan="on",
+        # Client addresses (rate limits, idempotency scope) come from X-Forwarded-For
+        # only when the request arrives through one of these proxies
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        reload=False,
+    )
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional
+import uuid
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy.orm import Session
-
-from ..db import get_session_ctx
-from ..models.task_orm import TaskStatus
-from ..factory import create_todo_manager_with_session
-from ..services import ToDoListManager
 from ..exceptions.service import BusinessRuleError, ValidationError
 from ..exceptions.repository import NotFoundError
-from ..commands import autoclose_overdue_tasks
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from ..services import ToDoListManager
+
+# SQLAlchemy, the models and the service graph are imported on first database
+# access, so the menu comes up without waiting for them.
 
 
 class ToDoCLI:
@@ -21,15 +23,42 @@ class ToDoCLI:
     The CLI may be removed in a future version.
     """
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Optional[Session] = None):
         """Initialize CLI with a database session.
-        
+
+        Without a session, one is opened on first database access and closed when
+        ``run`` returns.
+
         DEPRECATED: Use the Web API instead.
         """
-        self.session = session
-        self.manager = create_todo_manager_with_session(session)
+        self._session = session
+        self._owns_session = session is None
+        self._manager: Optional[ToDoListManager] = None
         self.running = True
 
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            from ..db.session import SessionLocal
+
+            self._session = SessionLocal()
+        return self._session
+
+    @property
+    def manager(self) -> ToDoListManager:
+        if self._manager is None:
+            from ..factory import create_todo_manager_with_session
+
+            self._manager = create_todo_manager_with_session(self.session)
+        return self._manager
+
+    def close(self) -> None:
+        """Close the session if this CLI opened it."""
+        if self._owns_session and self._session is not None:
+            self._session.close()
+            self._session = None
+            self._manager = None
+
     def run(self) -> None:
         """Run the CLI interface.
         
@@ -38,10 +67,13 @@ class ToDoCLI:
         print("Welcome to My Awesome ToDo List Application!")
         print("=" * 40)
 
-        while self.running:
-            self._display_menu()
-            choice = input("\nEnter your choice (0-10): ").strip()
-            self._handle_choice(choice)
+        try:
+            while self.running:
+                self._display_menu()
+                choice = input("\nEnter your choice (0-10): ").strip()
+                self._handle_choice(choice)
+        finally:
+            self.close()
 
     def _display_menu(self) -> None:
         print("\n" + "=" * 40)
@@ -97,6 +129,18 @@ class ToDoCLI:
             print("\n\nExiting...")
             self.running = False
     
+    def _read_id(self, label: str) -> Optional[uuid.UUID]:
+        """Prompt for a project or task ID; print an error and return None if it is missing or malformed."""
+        value = input(f"Enter {label.lower()} ID: ").strip()
+        if not value:
+            print(f"Error: {label} ID is required.")
+            return None
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            print(f"Error: Invalid {label.lower()} ID.")
+            return None
+
     def _create_project(self) -> None:
         print("\n--- Create Project ---")
         name = input("Enter project name: ").strip()
@@ -116,10 +160,8 @@ class ToDoCLI:
     
     def _edit_project(self) -> None:
         print("\n--- Edit Project ---")
-        project_id = input("Enter project ID: ").strip()
-
-        if not project_id:
-            print("Error: Project ID is required.")
+        project_id = self._read_id("Project")
+        if project_id is None:
             return
         
         project = self.manager.get_project(project_id)
@@ -146,10 +188,8 @@ class ToDoCLI:
 
     def _delete_project(self) -> None:
         print("\n--- Delete Project ---")
-        project_id = input("Enter project ID: ").strip()
-
-        if not project_id:
-            print("Error: Project ID is required.")
+        project_id = self._read_id("Project")
+        if project_id is None:
             return
 
         project = self.manager.get_project(project_id)
@@ -173,10 +213,8 @@ class ToDoCLI:
 
     def _add_task(self) -> None:
         print("\n--- Add Task to Project ---")
-        project_id = input("Enter project ID: ").strip()
-
-        if not project_id:
-            print("Error: Project ID is required.")
+        project_id = self._read_id("Project")
+        if project_id is None:
             return
 
         project = self.manager.get_project(project_id)
@@ -210,12 +248,12 @@ class ToDoCLI:
 
     def _change_task_status(self) -> None:
         print("\n--- Change Task Status ---")
-        task_id = input("Enter task ID: ").strip()
-
-        if not task_id:
-            print("Error: Task ID is required.")
+        task_id = self._read_id("Task")
+        if task_id is None:
             return
 
+        from ..models.task_orm import TaskStatus
+
         status_map: dict[str, TaskStatus] = {str(i): status for i, status in enumerate(TaskStatus)}  # NOQA
         print("Available statuses:")
         for i, status in status_map.items():
@@ -237,10 +275,8 @@ class ToDoCLI:
     
     def _edit_task(self) -> None:
         print("\n--- Edit Task ---")
-        task_id = input("Enter task ID: ").strip()
-
-        if not task_id:
-            print("Error: Task ID is required.")
+        task_id = self._read_id("Task")
+        if task_id is None:
             return
 
         task = self.manager.get_task(None, task_id)
@@ -262,6 +298,8 @@ class ToDoCLI:
                 print("Error: Invalid date format. Use YYYY-MM-DD")
                 return
 
+        from ..models.task_orm import TaskStatus
+
         status_map: dict[str, TaskStatus] = {str(i): status for i, status in enumerate(TaskStatus)}  # NOQA
         print("Available statuses:")
         for i, status in status_map.items():
@@ -289,10 +327,8 @@ class ToDoCLI:
 
     def _delete_task(self) -> None:
         print("\n--- Delete Task ---")
-        task_id = input("Enter task ID: ").strip()
-
-        if not task_id:
-            print("Error: Task ID is required.")
+        task_id = self._read_id("Task")
+        if task_id is None:
             return
 
         task = self.manager.get_task(None, task_id)
@@ -333,10 +369,8 @@ class ToDoCLI:
 
     def _list_project_tasks(self) -> None:
         print("\n--- Project Tasks ---")
-        project_id = input("Enter project ID: ").strip()
-
-        if not project_id:
-            print("Error: Project ID is required.")
+        project_id = self._read_id("Project")
+        if project_id is None:
             return
 
         try:
@@ -366,6 +400,8 @@ class ToDoCLI:
     def _autoclose_overdue(self) -> None:
         """Auto-close overdue tasks."""
         print("\n--- Auto-close Overdue Tasks ---")
+        from ..commands.autoclose_overdue import autoclose_overdue_tasks
+
         try:
             count = autoclose_overdue_tasks(self.session)
             if count > 0:
@@ -0,0 +1,488 @@
+"""Non-interactive CLI: one subcommand per change, plus a batch mode.
+
+Every command prints JSON to stdout, one document per line, and exits with a
+non-zero status on failure, so it can be driven from scripts::
+
+    todo project add "Home" --description "Chores"
+    todo task add --project <id> --title "Buy milk" --deadline 2030-01-31
+    todo task status <task id> DONE
+    todo batch changes.ndjson
+
+A batch file holds one operation per line, named like the subcommands
+(``project.add``, ``task.status``, ...) with the same parameters as JSON keys::
+
+    {"op": "project.add", "name": "Home"}
+    {"op": "task.add", "project": "$0", "title": "Buy milk"}
+
+``$N`` refers to the id created by operation N. The whole file is checked
+first; then all operations run on one session and are committed once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import sys
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Collection, NamedTuple, Optional, TextIO, Union
+
+from ..config.settings import settings
+from ..exceptions.repository import NotFoundError
+from ..exceptions.service import ValidationError
+
+if TYPE_CHECKING:
+    from ..models.project_orm import ProjectORM
+    from ..models.task_orm import TaskORM
+    from ..services import ToDoListManager
+
+Params = dict[str, Any]
+# Ids created by earlier operations of a batch, by operation index.
+CreatedIds = dict[int, uuid.UUID]
+
+
+def _isoformat(value: Optional[datetime.datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _project_json(project: ProjectORM) -> dict[str, Any]:
+    return {
+        "id": str(project.id),
+        "name": project.name,
+        "description": project.description,
+        "created_at": _isoformat(project.created_at),
+        "version": project.version,
+    }
+
+
+def _task_json(task: TaskORM) -> dict[str, Any]:
+    return {
+        "id": str(task.id),
+        "project_id": str(task.project_id),
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "deadline": _isoformat(task.deadline),
+        "created_at": _isoformat(task.created_at),
+        "closed_at": _isoformat(task.closed_at),
+        "version": task.version,
+    }
+
+
+def _error_json(exc: Exception) -> dict[str, Any]:
+    """Error code and message, as the Web API reports them."""
+    from ..api.exception_handlers import describe_exception
+
+    _, detail = describe_exception(exc)
+    return detail.model_dump(exclude_none=True)
+
+
+class _Ref(NamedTuple):
+    """Id created by an earlier operation of a batch (``$N``), known only once it has run."""
+
+    index: int
+
+
+def _id(params: Params, key: str, add_indexes: Collection[int]) -> Union[uuid.UUID, _Ref]:
+    """Parse an id parameter; ``$N`` must name an earlier add operation of the batch."""
+    value = params.get(key)
+    if value is None:
+        raise ValidationError(f"{key} is required")
+    value = str(value)
+    if value.startswith("$"):
+        try:
+            index = int(value[1:])
+        except ValueError:
+            raise ValidationError(f"Invalid reference: {value!r}") from None
+        if index not in add_indexes:
+            raise ValidationError(f"Reference {value!r} does not point to an earlier add operation")
+        return _Ref(index)
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValidationError(f"Invalid {key}: {value!r}") from None
+
+
+def _resolve(value: Union[uuid.UUID, _Ref], created_ids: CreatedIds) -> uuid.UUID:
+    """The id behind a parsed id parameter."""
+    if not isinstance(value, _Ref):
+        return value
+    if value.index not in created_ids:
+        raise ValidationError(f"Reference '${value.index}' points to an add operation that failed")
+    return created_ids[value.index]
+
+
+def _text(
+    params: Params, key: str, max_length: int, min_length: int = 0, required: bool = False
+) -> Optional[str]:
+    value = params.get(key)
+    if value is None:
+        if required:
+            raise ValidationError(f"{key} is required")
+        return None
+    value = str(value)
+    if not min_length <= len(value) <= max_length:
+        raise ValidationError(f"{key} must be {min_length}-{max_length} characters")
+    return value
+
+
+def _deadline(params: Params) -> Optional[datetime.datetime]:
+    value = params.get("deadline")
+    if value is None:
+        return None
+    try:
+        deadline = datetime.datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ValidationError(f"Invalid deadline: {value!r} (use YYYY-MM-DD or ISO 8601)") from None
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=datetime.timezone.utc)
+    if deadline < datetime.datetime.now(datetime.timezone.utc):
+        raise ValidationError("Deadline cannot be in the past")
+    return deadline
+
+
+def _status(params: Params, required: bool = False):
+    from ..models.task_orm import TaskStatus
+
+    value = params.get("status")
+    if value is None:
+        if required:
+            raise ValidationError("status is required")
+        return None
+    try:
+        return TaskStatus(str(value).upper())
+    except ValueError:
+        raise ValidationError(
+            f"Invalid status: {value!r}. Allowed: {', '.join(status.value for status in TaskStatus)}"
+        ) from None
+
+
+def _if_match(params: Params) -> Optional[int]:
+    value = params.get("if_match")
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid if_match: {value!r}") from None
+
+
+# Each operation has a parser, which checks and converts the parameters without touching
+# storage, and a runner, which applies the parsed arguments through the manager.
+
+def _parse_project_add(params: Params, add_indexes: Collection[int]) -> Params:
+    return {
+        "name": _text(params, "name", settings.MAX_PROJECT_NAME_LENGTH, min_length=1, required=True),
+        "description": _text(params, "description", settings.MAX_PROJECT_DESCRIPTION_LENGTH) or "",
+    }
+
+
+def _project_add(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    return _project_json(manager.create_project(args["name"], args["description"]))
+
+
+def _parse_project_edit(params: Params, add_indexes: Collection[int]) -> Params:
+    return {
+        "id": _id(params, "id", add_indexes),
+        "name": _text(params, "name", settings.MAX_PROJECT_NAME_LENGTH, min_length=1),
+        "description": _text(params, "description", settings.MAX_PROJECT_DESCRIPTION_LENGTH),
+        "if_match": _if_match(params),
+    }
+
+
+def _project_edit(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    project_id = _resolve(args["id"], created_ids)
+    name = args["name"]
+    if name is None:
+        project = manager.get_project(project_id)
+        if project is None:
+            raise NotFoundError("Project not found")
+        name = project.name
+    return _project_json(manager.edit_project(project_id, name, args["description"], args["if_match"]))
+
+
+def _parse_delete(params: Params, add_indexes: Collection[int]) -> Params:
+    return {"id": _id(params, "id", add_indexes), "if_match": _if_match(params)}
+
+
+def _project_delete(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    project_id = _resolve(args["id"], created_ids)
+    if not manager.delete_project(project_id, args["if_match"]):
+        raise NotFoundError("Project not found")
+    return {"id": str(project_id), "deleted": True}
+
+
+def _parse_project_list(params: Params, add_indexes: Collection[int]) -> Params:
+    return {}
+
+
+def _project_list(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> list[dict[str, Any]]:
+    return [_project_json(project) for project in manager.list_all_projects()]
+
+
+def _parse_task_add(params: Params, add_indexes: Collection[int]) -> Params:
+    return {
+        "project": _id(params, "project", add_indexes),
+        "title": _text(params, "title", settings.MAX_TASK_TITLE_LENGTH, min_length=1, required=True),
+        "description": _text(params, "description", settings.MAX_TASK_DESCRIPTION_LENGTH) or "",
+        "deadline": _deadline(params),
+    }
+
+
+def _task_add(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    project_id = _resolve(args["project"], created_ids)
+    return _task_json(manager.add_task_to_project(project_id, args["title"], args["description"], args["deadline"]))
+
+
+def _parse_task_status(params: Params, add_indexes: Collection[int]) -> Params:
+    return {
+        "id": _id(params, "id", add_indexes),
+        "status": _status(params, required=True),
+        "if_match": _if_match(params),
+    }
+
+
+def _task_status(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    task_id = _resolve(args["id"], created_ids)
+    return _task_json(manager.change_task_status(task_id, args["status"], args["if_match"]))
+
+
+def _parse_task_edit(params: Params, add_indexes: Collection[int]) -> Params:
+    # Parameters left out are None and keep their current values
+    return {
+        "id": _id(params, "id", add_indexes),
+        "title": _text(params, "title", settings.MAX_TASK_TITLE_LENGTH, min_length=1),
+        "description": _text(params, "description", settings.MAX_TASK_DESCRIPTION_LENGTH),
+        "deadline": _deadline(params),
+        "status": _status(params),
+        "if_match": _if_match(params),
+    }
+
+
+def _task_edit(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    task = manager.edit_task(
+        _resolve(args["id"], created_ids),
+        args["title"],
+        args["description"],
+        args["deadline"],
+        args["status"],
+        args["if_match"],
+    )
+    return _task_json(task)
+
+
+def _task_delete(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> dict[str, Any]:
+    task_id = _resolve(args["id"], created_ids)
+    if not manager.delete_task(task_id, args["if_match"]):
+        raise NotFoundError("Task not found")
+    return {"id": str(task_id), "deleted": True}
+
+
+def _parse_task_list(params: Params, add_indexes: Collection[int]) -> Params:
+    return {"project": _id(params, "project", add_indexes)}
+
+
+def _task_list(manager: ToDoListManager, args: Params, created_ids: CreatedIds) -> list[dict[str, Any]]:
+    return [_task_json(task) for task in manager.list_project_tasks(_resolve(args["project"], created_ids))]
+
+
+class Operation(NamedTuple):
+    parse: Callable[[Params, Collection[int]], Params]
+    run: Callable[["ToDoListManager", Params, CreatedIds], Any]
+
+
+# Operations by name; the name is also the subcommand path ("task.add" is "todo task add").
+OPERATIONS: dict[str, Operation] = {
+    "project.add": Operation(_parse_project_add, _project_add),
+    "project.edit": Operation(_parse_project_edit, _project_edit),
+    "project.delete": Operation(_parse_delete, _project_delete),
+    "project.list": Operation(_parse_project_list, _project_list),
+    "task.add": Operation(_parse_task_add, _task_add),
+    "task.status": Operation(_parse_task_status, _task_status),
+    "task.edit": Operation(_parse_task_edit, _task_edit),
+    "task.delete": Operation(_parse_delete, _task_delete),
+    "task.list": Operation(_parse_task_list, _task_list),
+}
+
+# Operations that only read; everything else may run in a batch.
+READ_OPERATIONS = frozenset({"project.list", "task.list"})
+
+
+def _print(document: Any, out: TextIO) -> None:
+    out.write(json.dumps(document, separators=(",", ":")) + "\n")
+
+
+def _run_single(op: str, params: Params, out: TextIO) -> int:
+    from ..db.session import get_session_ctx
+    from ..factory import create_todo_manager_with_session
+
+    operation = OPERATIONS[op]
+    try:
+        args = operation.parse(params, ())
+    except ValidationError as exc:
+        _print({"ok": False, "op": op, "error": _error_json(exc)}, out)
+        return 1
+
+    with get_session_ctx() as session:
+        manager = create_todo_manager_with_session(session)
+        try:
+            # Build the output before committing: commit expires the ORM objects
+            result = operation.run(manager, args, {})
+            if op not in READ_OPERATIONS:
+                session.commit()
+        except Exception as exc:
+            session.rollback()
+            _print({"ok": False, "op": op, "error": _error_json(exc)}, out)
+            return 1
+    _print({"ok": True, "op": op, "data": result}, out)
+    return 0
+
+
+def _read_batch(source: TextIO) -> list[tuple[str, Params]]:
+    """Parse an NDJSON batch into (op, parsed arguments) pairs.
+
+    Every line is checked before anything runs: the JSON, the op name, the parameters
+    and the ``$N`` references. Any invalid line rejects the whole file.
+    """
+    operations: list[tuple[str, Params]] = []
+    add_indexes: set[int] = set()
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            params = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValidationError(f"Line {line_number}: invalid JSON ({exc.msg})") from None
+        if not isinstance(params, dict):
+            raise ValidationError(f"Line {line_number}: expected a JSON object")
+        op = params.pop("op", None)
+        if op not in OPERATIONS or op in READ_OPERATIONS:
+            writable = ", ".join(name for name in OPERATIONS if name not in READ_OPERATIONS)
+            raise ValidationError(f"Line {line_number}: unknown op {op!r}. Allowed: {writable}")
+        try:
+            args = OPERATIONS[op].parse(params, add_indexes)
+        except ValidationError as exc:
+            raise ValidationError(f"Line {line_number}: {exc}") from None
+        if op.endswith(".add"):
+            add_indexes.add(len(operations))
+        operations.append((op, args))
+    if not operations:
+        raise ValidationError("The batch contains no operations")
+    return operations
+
+
+def _run_batch(path: str, atomic: bool, out: TextIO) -> int:
+    try:
+        if path == "-":
+            operations = _read_batch(sys.stdin)
+        else:
+            with open(path, encoding="utf-8") as source:
+                operations = _read_batch(source)
+    except ValidationError as exc:
+        _print({"ok": False, "op": "batch", "error": _error_json(exc)}, out)
+        return 1
+    except OSError as exc:
+        error = {"code": "file_error", "message": f"Cannot read {path}: {exc.strerror or exc}"}
+        _print({"ok": False, "op": "batch", "error": error}, out)
+        return 1
+
+    from ..db.session import get_session_ctx
+    from ..factory import create_batch_executor, create_todo_manager_with_session
+
+    created_ids: CreatedIds = {}
+
+    def step(index: int, op: str, args: Params) -> Callable[[], Any]:
+        def run() -> Any:
+            result = OPERATIONS[op].run(manager, args, created_ids)
+            if op.endswith(".add"):
+                created_ids[index] = uuid.UUID(result["id"])
+            return result
+        return run
+
+    with get_session_ctx() as session:
+        manager = create_todo_manager_with_session(session)
+        steps = [step(index, op, args) for index, (op, args) in enumerate(operations)]
+        try:
+            committed, outcomes = create_batch_executor(session).execute(steps, atomic=atomic)
+        except Exception as exc:
+            # Unsupported mode, or the final commit failed (the executor has rolled back)
+            _print({"ok": False, "op": "batch", "error": _error_json(exc)}, out)
+            return 1
+
+    for index, ((op, _), outcome) in enumerate(zip(operations, outcomes)):
+        if not outcome.executed:
+            error = {"code": "not_executed", "message": "Skipped because an earlier operation failed"}
+            _print({"index": index, "ok": False, "op": op, "error": error}, out)
+        elif outcome.error is not None:
+            _print({"index": index, "ok": False, "op": op, "error": _error_json(outcome.error)}, out)
+        else:
+            _print({"index": index, "ok": True, "op": op, "data": outcome.value}, out)
+    succeeded = sum(outcome.ok for outcome in outcomes)
+    _print({"committed": committed, "operations": len(outcomes), "succeeded": succeeded}, out)
+    return 0 if succeeded == len(outcomes) else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="todo",
+        description="Manage projects and tasks. Run without arguments for the interactive menu (deprecated).",
+    )
+    commands = parser.add_subparsers(dest="resource", required=True, metavar="{project,task,batch}")
+
+    project = commands.add_parser("project", help="Create, change and list projects")
+    project_commands = project.add_subparsers(dest="action", required=True)
+    add = project_commands.add_parser("add", help="Create a project")
+    add.add_argument("name")
+    add.add_argument("--description")
+    edit = project_commands.add_parser("edit", help="Rename a project or change its description")
+    edit.add_argument("id")
+    edit.add_argument("--name")
+    edit.add_argument("--description")
+    edit.add_argument("--if-match", type=int, help="Only apply to this version")
+    delete = project_commands.add_parser("delete", help="Delete a project and its tasks")
+    delete.add_argument("id")
+    delete.add_argument("--if-match", type=int, help="Only apply to this version")
+    project_commands.add_parser("list", help="List all projects")
+
+    task = commands.add_parser("task", help="Create, change and list tasks")
+    task_commands = task.add_subparsers(dest="action", required=True)
+    add = task_commands.add_parser("add", help="Add a task to a project")
+    add.add_argument("--project", required=True, help="Project id")
+    add.add_argument("--title", required=True)
+    add.add_argument("--description")
+    add.add_argument("--deadline", help="YYYY-MM-DD or ISO 8601 (UTC unless an offset is given)")
+    status = task_commands.add_parser("status", help="Change the status of a task")
+    status.add_argument("id")
+    status.add_argument("status", help="TODO, DOING or DONE")
+    status.add_argument("--if-match", type=int, help="Only apply to this version")
+    edit = task_commands.add_parser("edit", help="Change a task; options left out keep their values")
+    edit.add_argument("id")
+    edit.add_argument("--title")
+    edit.add_argument("--description")
+    edit.add_argument("--deadline", help="YYYY-MM-DD or ISO 8601 (UTC unless an offset is given)")
+    edit.add_argument("--status", help="TODO, DOING or DONE")
+    edit.add_argument("--if-match", type=int, help="Only apply to this version")
+    delete = task_commands.add_parser("delete", help="Delete a task")
+    delete.add_argument("id")
+    delete.add_argument("--if-match", type=int, help="Only apply to this version")
+    listing = task_commands.add_parser("list", help="List the tasks of a project")
+    listing.add_argument("--project", required=True, help="Project id")
+
+    batch = commands.add_parser("batch", help="Apply an NDJSON file of operations with one commit")
+    batch.add_argument("file", help="NDJSON file, or - for standard input")
+    batch.add_argument(
+        "--no-atomic",
+        dest="atomic",
+        action="store_false",
+        help="Keep the operations that succeed instead of rolling back the whole batch on the first failure",
+    )
+    return parser
+
+
+def run_command(argv: list[str], out: TextIO = sys.stdout) -> int:
+    """Run one CLI subcommand and return the process exit status."""
+    args = build_parser().parse_args(argv)
+    if args.resource == "batch":
+        return _run_batch(args.file, args.atomic, out)
+    params = {key: value for key, value in vars(args).items() if key not in ("resource", "action")}
+    return _run_single(f"{args.resource}.{args.action}", params, out)
@@ -1,7 +1,28 @@
-"""Commands for the ToDo application."""
+"""Commands for the ToDo application.
 
-from .autoclose_overdue import autoclose_overdue_tasks
-from .scheduler import start_scheduler, run_scheduler_once
+Each command is imported on first access, so running one command does not load
+the dependencies of the others (e.g. the scheduler's metrics and job runner).
+"""
 
-__all__ = ["autoclose_overdue_tasks", "start_scheduler", "run_scheduler_once"]
+from importlib import import_module
+from typing import Any
 
+_EXPORTS = {
+    "autoclose_overdue_tasks": ".autoclose_overdue",
+    "ensure_task_partitions": ".task_partitions",
+    "detach_old_task_partitions": ".task_partitions",
+    "seed_dataset": ".seed_dataset",
+    "purge_idempotency_keys": ".purge_idempotency_keys",
+    "start_scheduler": ".scheduler",
+    "run_scheduler_once": ".scheduler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from sqlalchemy.orm import Session
 
-from ..factory import create_task_repository
+from ..events.publisher import TaskEvent, TASK_AUTOCLOSED
+from ..factory import create_task_repository, create_event_publisher
 from ..models.task_orm import TaskStatus
 
 
@@ -15,7 +16,8 @@ def autoclose_overdue_tasks(session: Session) -> int:
     - deadline < now
     - status != DONE
 
-    Marks them as DONE and sets closed_at timestamp.
+    Marks them as DONE, sets closed_at timestamp and publishes a ``task.autoclosed``
+    event for each of them.
 
     Args:
         session: Database session
@@ -24,6 +26,7 @@ def autoclose_overdue_tasks(session: Session) -> int:
         Number of tasks that were closed
     """
     task_repo = create_task_repository(session)
+    event_publisher = create_event_publisher(session)
     overdue_tasks = task_repo.get_overdue_tasks()
 
     closed_count = 0
@@ -31,6 +34,8 @@ def autoclose_overdue_tasks(session: Session) -> int:
         if task.status != TaskStatus.DONE:
             task.update_status(TaskStatus.DONE)
             task_repo.update(task)
+            if event_publisher is not None:
+                event_publisher.publish(TaskEvent.from_task(TASK_AUTOCLOSED, task))
             closed_count += 1
 
     if closed_count > 0:
@@ -0,0 +1,21 @@
+"""Command to delete expired idempotency keys."""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from ..factory import create_idempotency_repository
+
+
+def purge_idempotency_keys(session: Session) -> int:
+    """Delete stored idempotent responses whose TTL has passed.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Number of records that were deleted
+    """
+    purged = create_idempotency_repository(session).purge_expired()
+    session.commit()
+    return purged
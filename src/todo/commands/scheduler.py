@@ -10,7 +10,10 @@ import schedule
 
 from ..db import get_session_ctx
 from ..config.settings import settings
+from ..metrics import AUTOCLOSE_JOB_DURATION, AUTOCLOSE_TASKS_CLOSED
 from .autoclose_overdue import autoclose_overdue_tasks
+from .task_partitions import ensure_task_partitions, detach_old_task_partitions
+from .purge_idempotency_keys import purge_idempotency_keys
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +21,9 @@ logger = logging.getLogger(__name__)
 def run_autoclose_job() -> None:
     """Job function to run auto-close overdue tasks."""
     try:
-        with get_session_ctx() as session:
+        with AUTOCLOSE_JOB_DURATION.time(), get_session_ctx() as session:
             count = autoclose_overdue_tasks(session)
+            AUTOCLOSE_TASKS_CLOSED.inc(count)
             if count > 0:
                 logger.info(f"Auto-closed {count} overdue task(s)")
             else:
@@ -28,6 +32,31 @@ def run_autoclose_job() -> None:
         logger.error(f"Error running auto-close job: {e}", exc_info=True)
 
 
+def run_partition_maintenance_job() -> None:
+    """Job function to provision upcoming and detach expired task partitions."""
+    try:
+        with get_session_ctx() as session:
+            created = ensure_task_partitions(session)
+            detached = detach_old_task_partitions(session)
+            if created:
+                logger.info(f"Created task partition(s): {', '.join(created)}")
+            if detached:
+                logger.info(f"Detached task partition(s): {', '.join(detached)}")
+    except Exception as e:
+        logger.error(f"Error running partition maintenance job: {e}", exc_info=True)
+
+
+def run_idempotency_purge_job() -> None:
+    """Job function to delete expired idempotency keys."""
+    try:
+        with get_session_ctx() as session:
+            purged = purge_idempotency_keys(session)
+            if purged:
+                logger.info(f"Purged {purged} expired idempotency key(s)")
+    except Exception as e:
+        logger.error(f"Error running idempotency purge job: {e}", exc_info=True)
+
+
 def start_scheduler(interval_minutes: Optional[int] = None) -> None:
     """Start the scheduler to run auto-close overdue tasks periodically.
 
@@ -36,6 +65,9 @@ def start_scheduler(interval_minutes: Optional[int] = None) -> None:
     """
     interval = interval_minutes or settings.AUTOCLOSE_INTERVAL_MINUTES
     schedule.every(interval).minutes.do(run_autoclose_job)
+    schedule.every().day.do(run_partition_maintenance_job)
+    schedule.every().hour.do(run_idempotency_purge_job)
+    run_partition_maintenance_job()
     
     logger.info(f"Scheduler started: auto-close overdue tasks every {interval} minutes")
     
@@ -0,0 +1,220 @@
+"""Command to bulk-generate a synthetic dataset for performance testing."""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import io
+import math
+import multiprocessing
+import os
+import random
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from ..config.settings import settings
+from ..db.ids import uuid7
+from ..db.sqlite import configure_sqlite
+from ..models.project_orm import ProjectORM
+from ..models.task_orm import TaskORM, TaskStatus
+from .task_partitions import ensure_task_partitions
+
+PROJECT_COLUMNS = ("id", "name", "description", "created_at")
+TASK_COLUMNS = ("id", "project_id", "title", "description", "status", "deadline", "created_at", "closed_at")
+
+# Share of tasks per status, and of tasks without a deadline.
+STATUS_WEIGHTS = {TaskStatus.TODO: 0.45, TaskStatus.DOING: 0.20, TaskStatus.DONE: 0.35}
+NO_DEADLINE_RATIO = 0.3
+
+
+@dataclass
+class SeedResult:
+    """Outcome of a seeding run."""
+    projects: int
+    tasks: int
+    seconds: float
+
+
+@dataclass
+class _Shard:
+    index: int
+    first_project: int
+    projects: int
+
+
+def _random_time(rng: random.Random, start: datetime.datetime, end: datetime.datetime) -> datetime.datetime:
+    return start + (end - start) * rng.random()
+
+
+def _generate_task(
+    rng: random.Random, project_id: str, project_created_at: datetime.datetime, now: datetime.datetime
+) -> dict[str, Any]:
+    created_at = _random_time(rng, project_created_at, now)
+    status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    deadline = None
+    if rng.random() >= NO_DEADLINE_RATIO:
+        deadline = created_at + datetime.timedelta(days=rng.uniform(1, 60))
+    closed_at = None
+    if status == TaskStatus.DONE:
+        closed_at = _random_time(rng, created_at, min(now, created_at + datetime.timedelta(days=30)))
+    return {
+        "id": str(uuid7()),
+        "project_id": project_id,
+        "title": f"Task {rng.randrange(1_000_000):06d}"[:settings.MAX_TASK_TITLE_LENGTH],
+        "description": f"Synthetic task {rng.randrange(1_000_000_000)}"[:settings.MAX_TASK_DESCRIPTION_LENGTH],
+        "status": status,
+        "deadline": deadline,
+        "created_at": created_at,
+        "closed_at": closed_at,
+    }
+
+
+def _copy_rows(connection: Connection, table: str, columns: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+    """Load rows with PostgreSQL COPY through the psycopg2 cursor."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            "" if row[column] is None
+            else row[column].isoformat() if isinstance(row[column], datetime.datetime)
+            else row[column].value if isinstance(row[column], TaskStatus)
+            else row[column]
+            for column in columns
+        ])
+    buffer.seek(0)
+    # Empty unquoted CSV fields are NULL; text columns are never NULL, so read them as empty strings.
+    not_null = ", ".join(column for column in ("name", "title", "description") if column in columns)
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL ({not_null}))",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _write_rows(connection: Connection, model: type, columns: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        _copy_rows(connection, model.__tablename__, columns, rows)
+    else:
+        connection.execute(insert(model), rows)
+
+
+def _seed_shard(
+    database_url: str, shard: _Shard, tasks_per_project: int, days: int, batch_size: int, seed: int, run_id: str
+) -> tuple[int, int]:
+    """Generate and insert one shard of projects with their tasks (runs in a worker process)."""
+    rng = random.Random(f"{seed}-{shard.index}")
+    engine = create_engine(database_url, poolclass=NullPool)
+    configure_sqlite(engine)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    oldest = now - datetime.timedelta(days=days)
+    project_count = task_count = 0
+
+    try:
+        projects: list[dict[str, Any]] = []
+        tasks: list[dict[str, Any]] = []
+
+        def flush() -> None:
+            with engine.begin() as connection:
+                _write_rows(connection, ProjectORM, PROJECT_COLUMNS, projects)
+                _write_rows(connection, TaskORM, TASK_COLUMNS, tasks)
+            projects.clear()
+            tasks.clear()
+
+        for number in range(shard.first_project, shard.first_project + shard.projects):
+            project = {
+                "id": str(uuid7()),
+                "name": f"seed-{run_id}-{number}"[:settings.MAX_PROJECT_NAME_LENGTH],
+                "description": f"Synthetic project {number}"[:settings.MAX_PROJECT_DESCRIPTION_LENGTH],
+                "created_at": _random_time(rng, oldest, now),
+            }
+            projects.append(project)
+            project_count += 1
+            # Task counts vary per project around the requested mean.
+            for _ in range(rng.randint(0, 2 * tasks_per_project)):
+                tasks.append(_generate_task(rng, project["id"], project["created_at"], now))
+                task_count += 1
+            if len(projects) + len(tasks) >= batch_size:
+                flush()
+        flush()
+    finally:
+        engine.dispose()
+
+    return project_count, task_count
+
+
+def seed_dataset(
+    projects: int,
+    tasks_per_project: int,
+    workers: Optional[int] = None,
+    days: int = 365,
+    batch_size: int = 10_000,
+    seed: int = 0,
+    database_url: Optional[str] = None,
+) -> SeedResult:
+    """Bulk-generate projects and tasks directly in the database.
+
+    Rows are written with COPY on PostgreSQL (psycopg2) and multi-row INSERTs elsewhere,
+    by parallel worker processes that each own a shard of the projects. On a partitioned
+    ``tasks`` table the monthly partitions for the seeded period are created first. Business rules
+    such as MAX_NUMBER_OF_PROJECTS/MAX_NUMBER_OF_TASKS are not applied.
+
+    Args:
+        projects: Number of projects to create
+        tasks_per_project: Mean number of tasks per project (each gets 0 to 2x this many)
+        workers: Worker processes (defaults to the CPU count)
+        days: Creation timestamps are spread over this many past days
+        batch_size: Rows written per transaction
+        seed: Random seed, for reproducible distributions
+        database_url: Target database (defaults to settings value)
+
+    Returns:
+        Number of created projects and tasks, and the elapsed time
+    """
+    database_url = database_url or settings.DATABASE_URL
+    workers = max(1, workers or os.cpu_count() or 1)
+    run_id = uuid.uuid4().hex[:6]
+
+    shard_size = max(1, math.ceil(projects / (workers * 4)))
+    shards = [
+        _Shard(index, first, min(shard_size, projects - first))
+        for index, first in enumerate(range(0, projects, shard_size))
+    ]
+
+    # Closed tasks get closed_at dates over the whole range: create those months' partitions
+    # first, otherwise every seeded DONE task lands in the default partition.
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        with Session(engine) as session:
+            oldest = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
+            ensure_task_partitions(session, since=oldest.date())
+    finally:
+        engine.dispose()
+
+    start = time.perf_counter()
+    total_projects = total_tasks = 0
+    # Spawned workers start without the parent's engine or open sockets.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(_seed_shard, database_url, shard, tasks_per_project, days, batch_size, seed, run_id)
+            for shard in shards
+        ]
+        for future in futures:
+            shard_projects, shard_tasks = future.result()
+            total_projects += shard_projects
+            total_tasks += shard_tasks
+
+    return SeedResult(projects=total_projects, tasks=total_tasks, seconds=time.perf_counter() - start)
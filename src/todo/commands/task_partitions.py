@@ -0,0 +1,172 @@
+"""Commands to maintain the monthly partitions of closed tasks."""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import re
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..config.settings import settings
+from ..models.task_orm import TaskORM
+
+logger = logging.getLogger(__name__)
+
+_PARENT_TABLE = "tasks_closed"
+_DEFAULT_PARTITION = "tasks_closed_default"
+_PARTITION_NAME = re.compile(r"^tasks_closed_(\d{4})_(\d{2})$")
+
+
+def _add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + (month.month - 1) + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_name(month: datetime.date) -> str:
+    return f"{_PARENT_TABLE}_{month:%Y_%m}"
+
+
+def _is_partitioned(session: Session) -> bool:
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return session.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+        ),
+        {"name": _PARENT_TABLE},
+    ).first() is not None
+
+
+def _attached_months(session: Session) -> set[datetime.date]:
+    rows = session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :name AND pg_table_is_visible(parent.oid)"
+        ),
+        {"name": _PARENT_TABLE},
+    ).scalars()
+    months = set()
+    for name in rows:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.add(datetime.date(int(match.group(1)), int(match.group(2)), 1))
+    return months
+
+
+def _month_bounds(month: datetime.date) -> tuple[str, str]:
+    return f"{month:%Y-%m-%d} 00:00:00+00", f"{_add_months(month, 1):%Y-%m-%d} 00:00:00+00"
+
+
+def _create_month_partition(session: Session, month: datetime.date) -> str:
+    """Create a month's partition, moving any of its rows out of the default partition first.
+
+    PostgreSQL refuses to create a partition whose range already has rows in the default
+    partition (e.g. after the job missed a month). In that case the default partition is
+    detached, the month created, the rows moved, and the default attached again.
+    """
+    name = _partition_name(month)
+    lower, upper = _month_bounds(month)
+    in_month = f"closed_at >= '{lower}' AND closed_at < '{upper}'"
+    stray = session.execute(text(f"SELECT 1 FROM {_DEFAULT_PARTITION} WHERE {in_month} LIMIT 1")).first()
+
+    if stray is not None:
+        session.execute(text(f"ALTER TABLE {_PARENT_TABLE} DETACH PARTITION {_DEFAULT_PARTITION}"))
+    session.execute(text(
+        f"CREATE TABLE {name} PARTITION OF {_PARENT_TABLE} "
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    ))
+    session.execute(text(f"ALTER TABLE {name} ADD PRIMARY KEY (id)"))
+    if stray is not None:
+        columns = ", ".join(TaskORM.__table__.columns.keys())
+        moved = session.execute(text(
+            f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} WHERE {in_month} RETURNING {columns}) "
+            f"INSERT INTO {name} ({columns}) SELECT {columns} FROM moved"
+        )).rowcount
+        session.execute(text(f"ALTER TABLE {_PARENT_TABLE} ATTACH PARTITION {_DEFAULT_PARTITION} DEFAULT"))
+        logger.info(f"Moved {moved} task(s) from {_DEFAULT_PARTITION} into {name}")
+    return name
+
+
+def ensure_task_partitions(
+    session: Session,
+    months_ahead: Optional[int] = None,
+    since: Optional[datetime.date] = None,
+) -> list[str]:
+    """Create the monthly closed-task partitions up to ``months_ahead`` months from now.
+
+    Partitions should exist before tasks are closed in that month, otherwise rows land
+    in ``tasks_closed_default`` and have to be moved when the month is created. A month
+    that cannot be created is logged and skipped, so the other months are still provisioned.
+
+    Args:
+        session: Database session
+        months_ahead: Number of future months to provision (defaults to settings value)
+        since: Also provision the past months from this date's month on (e.g. before
+            loading historical data); defaults to the current month
+
+    Returns:
+        Names of the partitions that were created (empty when tasks is not partitioned)
+    """
+    if not _is_partitioned(session):
+        return []
+
+    ahead = settings.TASKS_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    current = datetime.datetime.now(datetime.timezone.utc).date().replace(day=1)
+    first = min(current, since.replace(day=1)) if since is not None else current
+    months_back = (current.year - first.year) * 12 + current.month - first.month
+    existing = _attached_months(session)
+
+    created = []
+    for offset in range(-months_back, ahead + 1):
+        month = _add_months(current, offset)
+        if month in existing:
+            continue
+        try:
+            with session.begin_nested():
+                created.append(_create_month_partition(session, month))
+        except SQLAlchemyError as e:
+            logger.error(f"Could not create task partition {_partition_name(month)}: {e}")
+
+    session.commit()
+    return created
+
+
+def detach_old_task_partitions(session: Session, retention_months: Optional[int] = None) -> list[str]:
+    """Detach closed-task partitions older than the retention window.
+
+    Detaching is a catalog-only operation: the month's rows disappear from ``tasks``
+    instantly and remain available in a standalone table that can be archived or dropped.
+
+    Args:
+        session: Database session
+        retention_months: Number of past months to keep attached (defaults to settings value,
+            0 keeps everything)
+
+    Returns:
+        Names of the partitions that were detached
+    """
+    retention = settings.TASKS_PARTITION_RETENTION_MONTHS if retention_months is None else retention_months
+    if retention <= 0 or not _is_partitioned(session):
+        return []
+
+    current = datetime.datetime.now(datetime.timezone.utc).date().replace(day=1)
+    cutoff = _add_months(current, -retention)
+
+    detached = []
+    for month in sorted(_attached_months(session)):
+        if month >= cutoff:
+            continue
+        name = _partition_name(month)
+        session.execute(text(f"ALTER TABLE {_PARENT_TABLE} DETACH PARTITION {name}"))
+        detached.append(name)
+
+    session.commit()
+    return detached
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal, Optional
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,13 +18,89 @@ class AppSettings(BaseSettings):
     MAX_TASK_TITLE_LENGTH: int = 30
     MAX_TASK_DESCRIPTION_LENGTH: int = 150
 
+    # Storage backend: "sqlalchemy" (database) or "memory" (ephemeral, per process)
+    STORAGE_BACKEND: Literal["sqlalchemy", "memory"] = "sqlalchemy"
+
     # Database configuration
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_STICKINESS_SECONDS: float = 5.0
+    DATABASE_POOL_WARMUP_CONNECTIONS: int = 5
+    # psycopg 3 only: executions of a query before it becomes a server-side prepared statement
+    # (None disables; needed behind PgBouncer in transaction pooling mode)
+    DATABASE_PREPARE_THRESHOLD: Optional[int] = 5
+
+    # SQLite tuning (used when DATABASE_URL is a sqlite:// URL)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_POOL_SIZE: int = 40
+
+    # Query instrumentation
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SERVER_TIMING_ENABLED: bool = True
+
+    # Idempotency keys for POST requests
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_BACKEND: Literal["database", "memory"] = "database"
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    # How long a claim without a stored response blocks retries (e.g. after a worker crash)
+    IDEMPOTENCY_CLAIM_TIMEOUT_SECONDS: int = 60
+    IDEMPOTENCY_MAX_ENTRIES: int = 10000
+
+    # Batch endpoint
+    MAX_BATCH_OPERATIONS: int = 100
+
+    # Keyset pagination of list endpoints
+    MAX_PAGE_SIZE: int = 500
+
+    # Real-time task events (SSE / WebSocket)
+    EVENTS_ENABLED: bool = True
+    EVENTS_KEEPALIVE_SECONDS: float = 15.0
+
+    # Rate limiting and load shedding
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_READS_PER_SECOND: float = 20.0
+    RATE_LIMIT_READ_BURST: int = 40
+    RATE_LIMIT_WRITES_PER_SECOND: float = 5.0
+    RATE_LIMIT_WRITE_BURST: int = 10
+    RATE_LIMIT_REDIS_URL: Optional[str] = None
+    # X-API-Key values that get their own buckets; other requests are limited per client
+    RATE_LIMIT_API_KEYS: list[str] = []
+    MAX_IN_FLIGHT_REQUESTS: int = 15
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Prometheus metrics
+    METRICS_ENABLED: bool = True
+
+    # Production server (server_main.py)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    # Comma-separated proxy addresses trusted to set X-Forwarded-For ("*" trusts any peer)
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
 
     # Scheduler configuration
     AUTOCLOSE_INTERVAL_MINUTES: int = 60
 
+    # Task partitioning configuration (PostgreSQL only)
+    TASKS_PARTITION_MONTHS_AHEAD: int = 3
+    TASKS_PARTITION_RETENTION_MONTHS: int = 0
+
+    @field_validator("DATABASE_PREPARE_THRESHOLD", mode="before")
+    @classmethod
+    def empty_prepare_threshold_disables(cls, v: object) -> object:
+        """``DATABASE_PREPARE_THRESHOLD=`` (empty) means None: never prepare statements."""
+        if isinstance(v, str) and not v.strip():
+            return None
+        return v
+
     model_config = SettingsConfigDict(
         env_file=_ENV_PATH,
         env_file_encoding="utf-8",
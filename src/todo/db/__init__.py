@@ -1,7 +1,28 @@
-"""Database configuration and session management."""
+"""Database configuration and session management.
 
-from .base import Base
-from .session import get_session_ctx, SessionLocal
+Exports are resolved on first access, so importing a submodule such as
+``db.ids`` or ``db.types`` does not create sessions or load settings.
+"""
 
-__all__ = ["Base", "get_session_ctx", "SessionLocal"]
+from importlib import import_module
+from typing import Any
 
+_EXPORTS = {
+    "Base": ".base",
+    "get_session_ctx": ".session",
+    "SessionLocal": ".session",
+    "ReadOnlySessionLocal": ".session",
+    "QueryStats": ".instrumentation",
+    "track_queries": ".instrumentation",
+    "assert_max_queries": ".instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,48 @@
+"""Time-ordered primary key generation."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def _uuid7() -> uuid.UUID:
+    """UUID version 7 (RFC 9562): 48-bit Unix milliseconds, then a counter and random bits.
+
+    The 12 ``rand_a`` bits hold a counter seeded randomly at each new millisecond
+    and incremented within it, so ids generated by one process are strictly
+    increasing even when many are created in the same millisecond.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Counter exhausted: borrow the next millisecond
+                _last_ms += 1
+                _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+# Python 3.14+ ships a monotonic uuid7; use it when available.
+uuid7 = getattr(uuid, "uuid7", _uuid7)
@@ -0,0 +1,98 @@
+"""SQL statement instrumentation: per-request counts, durations and slow-query logging."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within a tracked scope."""
+    endpoint: Optional[str] = None
+    count: int = 0
+    duration: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+
+    def server_timing(self) -> str:
+        """Render the stats as a ``Server-Timing`` header value."""
+        return f'db;desc="{self.count} queries";dur={self.duration * 1000:.2f}'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# Collectors that see statements from every thread (used by assert_max_queries).
+_global_collectors: list[QueryStats] = []
+_global_collectors_lock = threading.Lock()
+
+
+@contextmanager
+def track_queries(endpoint: Optional[str] = None) -> Iterator[QueryStats]:
+    """Count statements executed in the current context (propagates into threadpool calls)."""
+    stats = QueryStats(endpoint=endpoint)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, endpoint: Optional[str] = None) -> Iterator[QueryStats]:
+    """Fail with AssertionError if more than ``max_queries`` statements run inside the block.
+
+    Statements are counted across all threads, so the helper works around in-process
+    test clients that run the application in a separate thread::
+
+        with assert_max_queries(2, "GET /api/v1/projects"):
+            client.get("/api/v1/projects")
+    """
+    stats = QueryStats(endpoint=endpoint)
+    with _global_collectors_lock:
+        _global_collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        with _global_collectors_lock:
+            _global_collectors.remove(stats)
+    if stats.count > max_queries:
+        raise AssertionError(
+            f"{endpoint or 'Block'} executed {stats.count} queries, expected at most {max_queries}"
+        )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _stop_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(elapsed)
+    if _global_collectors:
+        with _global_collectors_lock:
+            for collector in _global_collectors:
+                collector.record(elapsed)
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        endpoint = stats.endpoint if stats is not None and stats.endpoint else "-"
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms) from {endpoint}: {statement}")
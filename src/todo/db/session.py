@@ -1,26 +1,252 @@
-"""Database session factory and management."""
+"""Database session factory and management.
 
+Engines are created on first database access rather than at import time, so code
+paths that never touch the database do not pay for dialect imports and pool setup.
+"""
+
+import os
+import random
+import time
 from contextlib import contextmanager
-from typing import Generator
-from sqlalchemy import create_engine
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Generator, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool, SingletonThreadPool
 
 from ..config.settings import settings
 from .base import Base
+from .sqlite import configure_sqlite, is_sqlite
 
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+def _create_engine(url: str) -> Engine:
+    """Create an engine with the application's pool configuration."""
+    if is_sqlite(url):
+        # One connection per thread: SQLite serializes writers anyway, and reusing a
+        # thread's connection keeps its page cache warm.
+        sqlite_engine = create_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            poolclass=SingletonThreadPool,
+            pool_size=settings.SQLITE_POOL_SIZE,
+        )
+        configure_sqlite(sqlite_engine)
+        return sqlite_engine
+    connect_args = {}
+    if make_url(url).get_driver_name() == "psycopg":
+        # psycopg 3 prepares a query server-side once it has run this many times on a connection
+        connect_args["prepare_threshold"] = settings.DATABASE_PREPARE_THRESHOLD
+    return create_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        connect_args=connect_args,
+    )
+
+
+def _read_only_engine(bind: Engine) -> Engine:
+    """Derive an engine sharing ``bind``'s pool whose connections run reads without a transaction."""
+    options = {"isolation_level": "AUTOCOMMIT"}
+    if bind.dialect.name == "postgresql":
+        options["postgresql_readonly"] = True
+    return bind.execution_options(**options)
+
+
+@cache
+def get_engine() -> Engine:
+    """The primary database engine, created on first use."""
+    return _create_engine(settings.DATABASE_URL)
+
+
+@cache
+def get_replica_engines() -> tuple[Engine, ...]:
+    """Engines for the configured read replicas, created on first use."""
+    return tuple(_create_engine(url) for url in settings.DATABASE_REPLICA_URLS)
+
+
+@cache
+def get_read_only_engine() -> Engine:
+    """Read-only (autocommit) view of the primary engine."""
+    return _read_only_engine(get_engine())
+
+
+@cache
+def get_read_only_replica_engines() -> tuple[Engine, ...]:
+    """Read-only (autocommit) views of the replica engines."""
+    return tuple(_read_only_engine(replica) for replica in get_replica_engines())
+
+
+def _created_engines() -> list[Engine]:
+    """Engines that have been created so far (their read-only views share their pools)."""
+    engines = []
+    if get_engine.cache_info().currsize:
+        engines.append(get_engine())
+    if get_replica_engines.cache_info().currsize:
+        engines.extend(get_replica_engines())
+    return engines
+
+
+def _reset_pools_after_fork() -> None:
+    # A forked child must not reuse the parent's sockets: drop the inherited pool
+    # without closing its connections (the parent still owns them).
+    for created in _created_engines():
+        created.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def warm_pool(bind: Engine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections ahead of traffic.
+
+    Only queue pools are warmed (at most their ``pool_size``); SQLite's per-thread
+    connections cannot be opened in advance. Returns the number of connections opened.
+    """
+    if not isinstance(bind.pool, QueuePool):
+        return 0
+    opened = []
+    try:
+        for _ in range(min(connections, bind.pool.size())):
+            connection = bind.connect()
+            opened.append(connection)
+            connection.exec_driver_sql("SELECT 1")
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+def dispose_engines() -> None:
+    """Close the pooled connections of every created engine (on shutdown)."""
+    for created in _created_engines():
+        created.dispose()
+
+
+_LAZY_ENGINES = {
+    "engine": get_engine,
+    "replica_engines": get_replica_engines,
+    "read_only_engine": get_read_only_engine,
+    "read_only_replica_engines": get_read_only_replica_engines,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``from ...db.session import engine`` working; the engine is created on first access.
+    if name in _LAZY_ENGINES:
+        return _LAZY_ENGINES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@dataclass
+class ClientWrites:
+    """Read-your-writes state of one request.
 
+    The client carries the time (Unix seconds) of its last committed write, e.g. in a
+    cookie, so the state holds whichever worker process serves its next request.
+    """
+    last_write_at: Optional[float] = None
+    # Set when this request commits a write; to be sent back to the client
+    wrote_at: Optional[float] = None
+
+
+_current_writes: ContextVar[Optional[ClientWrites]] = ContextVar("client_writes", default=None)
+
+
+@contextmanager
+def track_client_writes(last_write_at: Optional[float] = None) -> Generator[ClientWrites, None, None]:
+    """Route the reads of the current context by ``last_write_at`` and record its writes.
+
+    Propagates into threadpool calls, like ``track_queries``.
+    """
+    writes = ClientWrites(last_write_at=last_write_at)
+    token = _current_writes.set(writes)
+    try:
+        yield writes
+    finally:
+        _current_writes.reset(token)
+
+
+def has_recent_write(last_write_at: Optional[float]) -> bool:
+    """Check whether a write at ``last_write_at`` is within the stickiness window."""
+    if last_write_at is None:
+        return False
+    age = time.time() - last_write_at
+    # A time in the future is not trusted (it would pin the client to the primary indefinitely)
+    return -1.0 <= age < settings.DATABASE_REPLICA_STICKINESS_SECONDS
+
+
+class RoutingSession(Session):
+    """Session that routes read-only work to a replica and everything else to the primary.
+
+    A session is read-only when created with ``info={"read_only": True}`` (see
+    ``ReadOnlySessionLocal``). Its statements run in autocommit mode on a read-only
+    connection, so no transaction is held open between them. Reads go to one replica
+    chosen per session, unless the current request's client wrote recently (see
+    ``track_client_writes``). Flushes always go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or not self.info.get("read_only"):
+            return get_engine()
+        replicas = get_read_only_replica_engines()
+        writes = _current_writes.get()
+        if not replicas or (writes is not None and has_recent_write(writes.last_write_at)):
+            return get_read_only_engine()
+        replica = self.info.get("replica")
+        if replica is None:
+            replica = self.info["replica"] = random.choice(replicas)
+        return replica
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise InvalidRequestError("Cannot flush changes in a read-only session")
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _track_flush_write(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _track_statement_write(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _record_write_after_commit(session: Session) -> None:
+    writes = _current_writes.get()
+    if session.info.pop("wrote", False) and writes is not None:
+        writes.wrote_at = writes.last_write_at = time.time()
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _reset_write_after_rollback(session: Session) -> None:
+    session.info.pop("wrote", None)
+
+
+# No ``bind``: RoutingSession.get_bind picks (and lazily creates) the engine per statement.
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Sessions for read-only work: nothing is flushed, so autoflush bookkeeping is skipped and
+# loaded objects stay usable after the session ends.
+ReadOnlySessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine,
+    expire_on_commit=False,
+    info={"read_only": True},
 )
 
 
@@ -38,4 +264,4 @@ get_session_ctx = contextmanager(get_session)
 
 def init_db() -> None:
     """Initialize database tables (for development/testing only)."""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
@@ -0,0 +1,51 @@
+"""SQLite connection tuning for single-node deployments."""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config.settings import settings
+
+
+def is_sqlite(url: str) -> bool:
+    """Check whether a database URL points at SQLite."""
+    return url.startswith("sqlite")
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """Apply per-connection pragmas and proper transaction handling to a SQLite engine.
+
+    * ``journal_mode=WAL`` lets readers run concurrently with the single writer
+      (skipped for in-memory databases, which do not support it).
+    * ``synchronous=NORMAL`` is durable across application crashes in WAL mode and
+      avoids an fsync per commit.
+    * ``busy_timeout`` makes a connection wait for the write lock instead of failing
+      immediately with "database is locked".
+    * ``foreign_keys=ON`` enforces the ``ON DELETE CASCADE`` between tasks and projects.
+
+    The pysqlite driver's implicit transaction handling is disabled and SQLAlchemy
+    emits ``BEGIN`` itself, so SAVEPOINTs and AUTOCOMMIT connections work as documented.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    in_memory = engine.url.database in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            if not in_memory:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection) -> None:
+        if connection.get_execution_options().get("isolation_level") != "AUTOCOMMIT":
+            connection.exec_driver_sql("BEGIN")
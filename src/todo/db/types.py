@@ -0,0 +1,59 @@
+"""Column types that behave the same on PostgreSQL and SQLite."""
+
+from __future__ import annotations
+
+import datetime
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, Uuid
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+def utc_now() -> datetime.datetime:
+    """Current time as an aware UTC datetime (Python-side column default)."""
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class GUID(TypeDecorator):
+    """UUID stored natively on PostgreSQL and as CHAR(32) elsewhere, exposed as ``uuid.UUID``.
+
+    String parameters are parsed, so raw ids from outside the application still bind.
+    """
+
+    impl = Uuid(as_uuid=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[uuid.UUID]:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(str(value))
+
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware datetime that is always stored and returned in UTC.
+
+    SQLite has no timezone support, so values are stored there as naive UTC, which
+    keeps comparisons and ordering of the stored text correct. Naive values are
+    assumed to already be UTC.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime.datetime], dialect: Dialect) -> Optional[datetime.datetime]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        else:
+            value = value.astimezone(datetime.timezone.utc)
+        if dialect.name == "sqlite":
+            return value.replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: Optional[datetime.datetime], dialect: Dialect) -> Optional[datetime.datetime]:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=datetime.timezone.utc)
+        return value
@@ -0,0 +1,29 @@
+"""Real-time task change events."""
+
+from .publisher import (
+    TaskEvent,
+    IEventPublisher,
+    NotifyEventPublisher,
+    LocalEventPublisher,
+    EVENTS_CHANNEL,
+    TASK_CREATED,
+    TASK_UPDATED,
+    TASK_DELETED,
+    TASK_AUTOCLOSED,
+)
+from .broker import EventBroker, Subscription, event_broker
+
+__all__ = [
+    "TaskEvent",
+    "IEventPublisher",
+    "NotifyEventPublisher",
+    "LocalEventPublisher",
+    "EVENTS_CHANNEL",
+    "TASK_CREATED",
+    "TASK_UPDATED",
+    "TASK_DELETED",
+    "TASK_AUTOCLOSED",
+    "EventBroker",
+    "Subscription",
+    "event_broker",
+]
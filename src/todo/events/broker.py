@@ -0,0 +1,176 @@
+"""Per-worker fan-out of task events to SSE and WebSocket subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import select
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from sqlalchemy.engine import Engine
+
+from .publisher import EVENTS_CHANNEL, LISTEN_DRIVERS, TaskEvent
+
+logger = logging.getLogger(__name__)
+
+# How often the listener wakes up to check whether it should stop.
+_WAKEUP_SECONDS = 5.0
+
+
+class Subscription:
+    """Queue of events for one subscriber of a project.
+
+    ``get`` returns None once the subscriber fell too far behind and was dropped; the
+    client should reconnect and reload the task list.
+    """
+
+    def __init__(self, project_id: str, max_pending: int) -> None:
+        self.project_id = project_id
+        self.queue: asyncio.Queue[Optional[TaskEvent]] = asyncio.Queue(maxsize=max_pending)
+        self.dropped = False
+
+    async def get(self) -> Optional[TaskEvent]:
+        return await self.queue.get()
+
+    def offer(self, task_event: TaskEvent) -> None:
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(task_event)
+        except asyncio.QueueFull:
+            # The client has to reload anyway, so discard the backlog and signal the drop.
+            self.dropped = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """Fans events out to the subscribers of each project within this worker.
+
+    On PostgreSQL a single background thread per worker holds a dedicated connection
+    that ``LISTEN``s on the events channel; it is started with the first subscriber.
+    """
+
+    def __init__(self, max_pending: int = 100) -> None:
+        self.max_pending = max_pending
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[threading.Thread] = None
+        self._listener_lock = threading.Lock()
+        self._unsupported_driver = False
+        self._stop = threading.Event()
+
+    @asynccontextmanager
+    async def subscribe(self, project_id: str) -> AsyncIterator[Subscription]:
+        """Receive the events of a project for the duration of the block."""
+        self._loop = asyncio.get_running_loop()
+        self._ensure_listener()
+        subscription = Subscription(project_id, self.max_pending)
+        self._subscriptions.setdefault(project_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscriptions.get(project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[project_id]
+
+    def dispatch(self, task_event: TaskEvent) -> None:
+        """Deliver an event to the project's subscribers (must run on the event loop)."""
+        for subscription in list(self._subscriptions.get(task_event.project_id, ())):
+            subscription.offer(task_event)
+
+    def dispatch_threadsafe(self, task_event: TaskEvent) -> None:
+        """Deliver an event from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self.dispatch, task_event)
+
+    def stop(self) -> None:
+        """Stop the listener thread (if running)."""
+        self._stop.set()
+
+    def reset_after_fork(self) -> None:
+        """Forget the parent's loop, subscribers and listener thread (threads do not survive fork)."""
+        self._subscriptions = {}
+        self._loop = None
+        self._listener = None
+        self._listener_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _ensure_listener(self) -> None:
+        from ..db.session import get_engine
+
+        engine = get_engine()
+        if engine.dialect.name != "postgresql" or self._listener is not None or self._unsupported_driver:
+            return
+        with self._listener_lock:
+            if engine.dialect.driver not in LISTEN_DRIVERS:
+                self._unsupported_driver = True
+                logger.warning(
+                    f"Task events cannot be received with the {engine.dialect.driver} driver; "
+                    f"events are delivered within each worker only"
+                )
+                return
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, args=(engine,), name="todo-event-listener", daemon=True
+                )
+                self._listener.start()
+
+    def _listen(self, bind: Engine) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                # Detached from the pool: the listening connection must not count against pool_size.
+                connection = bind.raw_connection()
+                connection.detach()
+                dbapi_connection = connection.dbapi_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {EVENTS_CHANNEL}")
+                logger.info(f"Listening for task events on channel {EVENTS_CHANNEL}")
+                backoff = 1.0
+                receive = _psycopg_notifies if bind.dialect.driver == "psycopg" else _psycopg2_notifies
+                try:
+                    while not self._stop.is_set():
+                        for payload in receive(dbapi_connection):
+                            self._dispatch_payload(payload)
+                finally:
+                    dbapi_connection.close()
+            except Exception as e:
+                logger.error(f"Task event listener failed, reconnecting in {backoff:.0f}s: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _dispatch_payload(self, payload: str) -> None:
+        try:
+            self.dispatch_threadsafe(TaskEvent.from_json(payload))
+        except (ValueError, KeyError):
+            logger.warning(f"Ignoring malformed task event: {payload!r}")
+
+
+def _psycopg2_notifies(dbapi_connection: Any) -> Iterator[str]:
+    """Payloads of the notifications received within the next wakeup interval (psycopg2)."""
+    if select.select([dbapi_connection], [], [], _WAKEUP_SECONDS) == ([], [], []):
+        return
+    dbapi_connection.poll()
+    while dbapi_connection.notifies:
+        yield dbapi_connection.notifies.pop(0).payload
+
+
+def _psycopg_notifies(dbapi_connection: Any) -> Iterator[str]:
+    """Payloads of the notifications received within the next wakeup interval (psycopg 3.2+)."""
+    for notify in dbapi_connection.notifies(timeout=_WAKEUP_SECONDS):
+        yield notify.payload
+
+
+# Process-wide broker shared by all event endpoints of this worker.
+event_broker = EventBroker()
+os.register_at_fork(after_in_child=event_broker.reset_after_fork)
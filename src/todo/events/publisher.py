@@ -0,0 +1,115 @@
+"""Task change events and the publishers that emit them on commit."""
+
+from __future__ import annotations
+
+import datetime
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from ..models.task_orm import TaskORM
+
+# PostgreSQL NOTIFY channel carrying task events between processes.
+EVENTS_CHANNEL = "todo_events"
+
+# PostgreSQL drivers whose notification API the event listener supports.
+LISTEN_DRIVERS = frozenset({"psycopg2", "psycopg"})
+
+TASK_CREATED = "task.created"
+TASK_UPDATED = "task.updated"
+TASK_DELETED = "task.deleted"
+TASK_AUTOCLOSED = "task.autoclosed"
+
+
+def _isoformat(value: Optional[datetime.datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+@dataclass
+class TaskEvent:
+    """A change to a task, as delivered to subscribers of its project."""
+    type: str
+    project_id: str
+    task_id: str
+    task: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_task(cls, event_type: str, task: TaskORM) -> TaskEvent:
+        return cls(
+            type=event_type,
+            project_id=str(task.project_id),
+            task_id=str(task.id),
+            task={
+                "id": str(task.id),
+                "project_id": str(task.project_id),
+                "title": task.title,
+                "description": task.description,
+                "status": task.status.value,
+                "deadline": _isoformat(task.deadline),
+                "created_at": _isoformat(task.created_at),
+                "closed_at": _isoformat(task.closed_at),
+                "version": task.version,
+            },
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"type": self.type, "project_id": self.project_id, "task_id": self.task_id, "task": self.task},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> TaskEvent:
+        data = json.loads(payload)
+        return cls(type=data["type"], project_id=data["project_id"], task_id=data["task_id"], task=data["task"])
+
+
+class IEventPublisher(ABC):
+    """Interface for publishing task events. Events are delivered only if the session commits."""
+
+    @abstractmethod
+    def publish(self, task_event: TaskEvent) -> None:
+        """Publish an event as part of the current transaction."""
+        pass
+
+
+class NotifyEventPublisher(IEventPublisher):
+    """Publish through PostgreSQL ``NOTIFY``, which the server delivers to listeners on commit."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def publish(self, task_event: TaskEvent) -> None:
+        self.session.execute(select(func.pg_notify(EVENTS_CHANNEL, task_event.to_json())))
+
+
+class LocalEventPublisher(IEventPublisher):
+    """Publish to this process's broker after the session commits (backends without a listener).
+
+    Events only reach subscribers connected to the same worker process.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def publish(self, task_event: TaskEvent) -> None:
+        self.session.info.setdefault("pending_events", []).append(task_event)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending_events(session: Session) -> None:
+    pending = session.info.pop("pending_events", None)
+    if pending:
+        from .broker import event_broker
+
+        for task_event in pending:
+            event_broker.dispatch_threadsafe(task_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop("pending_events", None)
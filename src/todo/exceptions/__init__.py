@@ -1,7 +1,7 @@
 """Exception classes for the ToDo application."""
 
 from .base import ToDoException
-from .repository import RepositoryException, NotFoundError, DuplicateError
+from .repository import RepositoryException, NotFoundError, DuplicateError, PreconditionFailedError
 from .service import ServiceException, ValidationError, BusinessRuleError
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "RepositoryException",
     "NotFoundError",
     "DuplicateError",
+    "PreconditionFailedError",
     "ServiceException",
     "ValidationError",
     "BusinessRuleError",
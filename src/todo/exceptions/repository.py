@@ -17,3 +17,7 @@ class DuplicateError(RepositoryException):
     """Raised when attempting to create a duplicate entity."""
     pass
 
+
+class PreconditionFailedError(RepositoryException):
+    """Raised when an entity was modified since the version the caller expected."""
+    pass
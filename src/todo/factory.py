@@ -4,22 +4,58 @@ from __future__ import annotations
 
 from sqlalchemy.orm import Session
 
+from .config.settings import settings
 from .db.session import get_session_ctx
-from .repositories import ProjectRepository, TaskRepository
-from .repositories.interfaces import IProjectRepository, ITaskRepository
+from .repositories import (
+    ProjectRepository,
+    TaskRepository,
+    InMemoryStore,
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+    IdempotencyRepository,
+    InMemoryIdempotencyRepository,
+)
+from .repositories.interfaces import IProjectRepository, ITaskRepository, IIdempotencyRepository
+from .events.publisher import IEventPublisher, LISTEN_DRIVERS, NotifyEventPublisher, LocalEventPublisher
 from .services.todo_manager import ToDoListManager
+from .services.batch_executor import BatchExecutor
+
+# Process-wide store used when STORAGE_BACKEND is "memory".
+memory_store = InMemoryStore()
 
 
 def create_project_repository(session: Session) -> IProjectRepository:
-    """Create a Project repository instance."""
+    """Create a Project repository instance for the configured storage backend."""
+    if settings.STORAGE_BACKEND == "memory":
+        return InMemoryProjectRepository(memory_store)
     return ProjectRepository(session)
 
 
 def create_task_repository(session: Session) -> ITaskRepository:
-    """Create a Task repository instance."""
+    """Create a Task repository instance for the configured storage backend."""
+    if settings.STORAGE_BACKEND == "memory":
+        return InMemoryTaskRepository(memory_store)
     return TaskRepository(session)
 
 
+def create_idempotency_repository(session: Session) -> IIdempotencyRepository:
+    """Create an idempotency key repository for the configured backend."""
+    if settings.STORAGE_BACKEND == "memory" or settings.IDEMPOTENCY_BACKEND == "memory":
+        return InMemoryIdempotencyRepository(memory_store, settings.IDEMPOTENCY_MAX_ENTRIES)
+    return IdempotencyRepository(session)
+
+
+def create_event_publisher(session: Session) -> IEventPublisher | None:
+    """Create a task event publisher (NOTIFY on PostgreSQL, in-process otherwise)."""
+    if not settings.EVENTS_ENABLED:
+        return None
+    if settings.STORAGE_BACKEND != "memory":
+        dialect = session.get_bind().dialect
+        if dialect.name == "postgresql" and dialect.driver in LISTEN_DRIVERS:
+            return NotifyEventPublisher(session)
+    return LocalEventPublisher(session)
+
+
 def create_todo_manager(
     project_repository: IProjectRepository | None = None,
     task_repository: ITaskRepository | None = None,
@@ -44,6 +80,7 @@ def create_todo_manager(
     return ToDoListManager(
         project_repository=project_repository,
         task_repository=task_repository,
+        event_publisher=create_event_publisher(session) if session is not None else None,
     )
 
 
@@ -60,5 +97,9 @@ def create_todo_manager_with_session(session: Session) -> ToDoListManager:
     """
     project_repo = create_project_repository(session)
     task_repo = create_task_repository(session)
-    return create_todo_manager(project_repository=project_repo, task_repository=task_repo)
+    return create_todo_manager(project_repository=project_repo, task_repository=task_repo, session=session)
+
 
+def create_batch_executor(session: Session) -> BatchExecutor:
+    """Create a BatchExecutor for the session (without rollback support on the in-memory backend)."""
+    return BatchExecutor(session, supports_rollback=settings.STORAGE_BACKEND != "memory")
@@ -0,0 +1,122 @@
+"""Prometheus metrics for the API, database pool and scheduler.
+
+Metrics are exported in Prometheus text format. When several worker processes serve
+the API, set ``PROMETHEUS_MULTIPROC_DIR`` to a shared, empty directory before starting
+them; every process then writes its samples there and ``render_metrics`` aggregates them.
+"""
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.pool import Pool, QueuePool
+
+HTTP_REQUEST_DURATION = Histogram(
+    "todo_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "todo_http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+HTTP_ERRORS = Counter(
+    "todo_http_errors_total",
+    "Error responses by error code",
+    ["code"],
+)
+HTTP_THROTTLED_REQUESTS = Counter(
+    "todo_http_throttled_requests_total",
+    "Requests rejected by rate limiting (rate_limited) or load shedding (overloaded)",
+    ["reason", "group"],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "todo_db_pool_connections",
+    "Database pool connections by state",
+    ["database", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "todo_db_pool_size",
+    "Configured database pool size",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "todo_cache_requests_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"],
+)
+AUTOCLOSE_JOB_DURATION = Histogram(
+    "todo_autoclose_job_duration_seconds",
+    "Duration of auto-close overdue tasks job runs",
+)
+AUTOCLOSE_TASKS_CLOSED = Counter(
+    "todo_autoclose_tasks_closed_total",
+    "Tasks closed by the auto-close overdue tasks job",
+)
+
+_observed_pools: set[int] = set()
+
+
+def _update_pool_gauges(pool: Pool, database: str, returning: int = 0) -> None:
+    if not isinstance(pool, QueuePool):
+        return
+    DB_POOL_SIZE.labels(database).set(pool.size())
+    DB_POOL_CONNECTIONS.labels(database, "checked_out").set(pool.checkedout() - returning)
+    DB_POOL_CONNECTIONS.labels(database, "idle").set(pool.checkedin() + returning)
+    DB_POOL_CONNECTIONS.labels(database, "overflow").set(max(pool.overflow(), 0))
+
+
+def observe_pool(engine: Engine, database: str) -> None:
+    """Keep the pool gauges of ``engine`` up to date under the given database label."""
+    pool = engine.pool
+    if id(pool) in _observed_pools:
+        return
+    _observed_pools.add(id(pool))
+
+    def update(*args) -> None:
+        _update_pool_gauges(pool, database)
+
+    def update_on_checkin(*args) -> None:
+        # The checkin event fires before the connection is back in the pool.
+        _update_pool_gauges(pool, database, returning=1)
+
+    for name in ("connect", "checkout", "close"):
+        event.listen(pool, name, update)
+    event.listen(pool, "checkin", update_on_checkin)
+    update()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement_cache(conn, cursor, statement, parameters, context, executemany) -> None:
+    cache_hit = getattr(context, "cache_hit", None)
+    if cache_hit == CACHE_HIT:
+        CACHE_REQUESTS.labels("sql_compiled", "hit").inc()
+    elif cache_hit == CACHE_MISS:
+        CACHE_REQUESTS.labels("sql_compiled", "miss").inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render all metrics in Prometheus text format, aggregating worker processes if configured."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,44 @@
+"""SQLAlchemy ORM model for stored idempotent responses."""
+
+from __future__ import annotations
+
+import datetime
+from typing import Optional
+
+from sqlalchemy import String, Integer, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+from ..db.types import UTCDateTime, utc_now
+
+
+class IdempotencyKeyORM(Base):
+    """Response saved for an ``Idempotency-Key`` sent by a client.
+
+    A row is claimed (``status_code`` is NULL) before the request runs and completed
+    with the response afterwards; it is ignored and purged once ``expires_at`` passes.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    client_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    content_type: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        UTCDateTime(),
+        nullable=False,
+        default=utc_now,
+    )
+    expires_at: Mapped[datetime.datetime] = mapped_column(
+        UTCDateTime(),
+        nullable=False,
+        index=True,
+    )
+
+    @property
+    def is_completed(self) -> bool:
+        """Whether the response has been stored (False while the request is in progress)."""
+        return self.status_code is not None
@@ -1,56 +1,75 @@
 from __future__ import annotations
 
-import uuid
 import datetime
-from typing import Dict, List, TYPE_CHECKING
-
-from pydantic.dataclasses import dataclass as pydantic_dataclass
-from pydantic import Field
+import uuid
+from typing import Dict, List, Optional
 
 from ..config.settings import settings
+from ..db.ids import uuid7
+from ..exceptions import ValidationError
+from .task import Task, from_epoch_us, now_epoch_us
 
-if TYPE_CHECKING:
-    from .task import Task
 
-
-@pydantic_dataclass
 class Project:
-    id: str = Field(
-        default_factory=lambda: str(uuid.uuid4())
-    )
-    name: str = Field(
-        ...,
-        min_length=1,
-        max_length=settings.MAX_PROJECT_NAME_LENGTH
-    )
-    description: str = Field(
-        default_factory=str,
-        max_length=settings.MAX_PROJECT_DESCRIPTION_LENGTH
-    )
-    created_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.now
-    )
-    tasks: Dict[str, Task] = Field(
-        default_factory=dict
-    )
+    """Compact in-memory project.
+
+    ``created_at`` is stored as epoch microseconds. Attribute assignment is not
+    validated; use ``Project.create`` for untrusted input.
+    """
+
+    __slots__ = ("id", "name", "description", "created_at_us", "tasks", "version")
+
+    def __init__(
+            self,
+            id: uuid.UUID,
+            name: str,
+            description: str = "",
+            created_at_us: int = 0,
+            tasks: Optional[Dict[uuid.UUID, Task]] = None,
+            version: int = 1,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.created_at_us = created_at_us
+        self.tasks: Dict[uuid.UUID, Task] = tasks if tasks is not None else {}
+        self.version = version
+
+    @classmethod
+    def create(cls, name: str, description: str = "") -> Project:
+        """Create a new project, validating field lengths."""
+        if not 1 <= len(name) <= settings.MAX_PROJECT_NAME_LENGTH:
+            raise ValidationError(f"Project name must be 1-{settings.MAX_PROJECT_NAME_LENGTH} characters")
+        if len(description) > settings.MAX_PROJECT_DESCRIPTION_LENGTH:
+            raise ValidationError(
+                f"Project description must be at most {settings.MAX_PROJECT_DESCRIPTION_LENGTH} characters"
+            )
+        return cls(id=uuid7(), name=name, description=description, created_at_us=now_epoch_us())
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return from_epoch_us(self.created_at_us)
 
     def add_task(self, task: Task) -> None:
         self.tasks[task.id] = task
 
-    def remove_task(self, task_id: str) -> bool:
+    def remove_task(self, task_id: uuid.UUID) -> bool:
         if task_id in self.tasks:
             del self.tasks[task_id]
             return True
         return False
 
-    def get_task(self, task_id: str) -> Task | None:
+    def get_task(self, task_id: uuid.UUID) -> Task | None:
         return self.tasks.get(task_id)
 
     def get_all_tasks(self) -> List[Task]:
-        return sorted(self.tasks.values(), key=lambda t: t.created_at)
+        return sorted(self.tasks.values(), key=lambda t: t.created_at_us)
 
     def update_details(self, name: str = None, description: str = None) -> None:
         if name is not None:
             self.name = name
         if description is not None:
             self.description = description
+
+    def __repr__(self) -> str:
+        return f"Project(id={self.id!r}, name={self.name!r}, tasks={len(self.tasks)})"
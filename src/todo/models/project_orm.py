@@ -6,10 +6,12 @@ import datetime
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, func, UUID
+from sqlalchemy import Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.base import Base
+from ..db.ids import uuid7
+from ..db.types import GUID, UTCDateTime, utc_now
 from ..config.settings import settings
 
 if TYPE_CHECKING:
@@ -22,9 +24,9 @@ class ProjectORM(Base):
     __tablename__ = "projects"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=False),
+        GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     name: Mapped[str] = mapped_column(
         String(settings.MAX_PROJECT_NAME_LENGTH),
@@ -36,18 +38,29 @@ class ProjectORM(Base):
         default="",
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
+    # Incremented on every update; compared on UPDATE/DELETE for optimistic concurrency
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
 
     # Relationship to tasks (one-to-many)
     tasks: Mapped[list["TaskORM"]] = relationship(
         "TaskORM",
         back_populates="project",
         cascade="all, delete-orphan",
+        order_by="TaskORM.created_at",
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
     def update_details(self, name: str | None = None, description: str | None = None) -> None:
         """Update project name and/or description."""
         if name is not None:
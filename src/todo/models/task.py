@@ -1,48 +1,118 @@
 from __future__ import annotations
 
-import uuid
 import datetime
-from enum import Enum
-from typing import Optional, TYPE_CHECKING
-
-from pydantic import Field
-from pydantic.dataclasses import dataclass as pydantic_dataclass
+import uuid
+from typing import Optional
 
 from ..config.settings import settings
+from ..db.ids import uuid7
+from ..exceptions import ValidationError
+from .task_orm import TaskStatus
+
+# Statuses are stored as their index in this tuple.
+STATUSES: tuple[TaskStatus, ...] = tuple(TaskStatus)
+STATUS_CODES: dict[TaskStatus, int] = {status: code for code, status in enumerate(STATUSES)}
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
 
-if TYPE_CHECKING:
-    from .project import Project
+def to_epoch_us(value: datetime.datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return (value - _EPOCH) // datetime.timedelta(microseconds=1)
 
 
-class TaskStatus(str, Enum):
-    TODO = "TODO"
-    DOING = "DOING"
-    DONE = "DONE"
+def from_epoch_us(value: int) -> datetime.datetime:
+    """Convert integer microseconds since the Unix epoch to an aware UTC datetime."""
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def now_epoch_us() -> int:
+    """Current time as integer microseconds since the Unix epoch."""
+    return to_epoch_us(datetime.datetime.now(datetime.timezone.utc))
 
 
-@pydantic_dataclass
 class Task:
-    project: Project
-    id: str = Field(
-        default_factory=lambda: str(uuid.uuid4())
-    )
-    title: str = Field(
-        ...,
-        min_length=1,
-        max_length=settings.MAX_TASK_TITLE_LENGTH,
-    )
-    description: str = Field(
-        default_factory=str,
-        max_length=settings.MAX_TASK_DESCRIPTION_LENGTH,
-    )
-    created_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.now,
+    """Compact in-memory task.
+
+    Holds the parent project's id rather than the project itself, the status as a
+    small int and timestamps as epoch microseconds (``None`` when unset). Attribute
+    assignment is not validated; use ``Task.create`` for untrusted input.
+    """
+
+    __slots__ = (
+        "id", "project_id", "title", "description",
+        "status_code", "created_at_us", "deadline_us", "closed_at_us", "version",
     )
-    status: TaskStatus = TaskStatus.TODO
-    deadline: Optional[datetime.datetime] = None
+
+    def __init__(
+            self,
+            id: uuid.UUID,
+            project_id: uuid.UUID,
+            title: str,
+            description: str = "",
+            status_code: int = 0,
+            created_at_us: int = 0,
+            deadline_us: Optional[int] = None,
+            closed_at_us: Optional[int] = None,
+            version: int = 1,
+    ) -> None:
+        self.id = id
+        self.project_id = project_id
+        self.title = title
+        self.description = description
+        self.status_code = status_code
+        self.created_at_us = created_at_us
+        self.deadline_us = deadline_us
+        self.closed_at_us = closed_at_us
+        self.version = version
+
+    @classmethod
+    def create(
+            cls,
+            project_id: uuid.UUID,
+            title: str,
+            description: str = "",
+            deadline: Optional[datetime.datetime] = None,
+    ) -> Task:
+        """Create a new TODO task, validating field lengths."""
+        if not 1 <= len(title) <= settings.MAX_TASK_TITLE_LENGTH:
+            raise ValidationError(f"Task title must be 1-{settings.MAX_TASK_TITLE_LENGTH} characters")
+        if len(description) > settings.MAX_TASK_DESCRIPTION_LENGTH:
+            raise ValidationError(f"Task description must be at most {settings.MAX_TASK_DESCRIPTION_LENGTH} characters")
+        return cls(
+            id=uuid7(),
+            project_id=project_id,
+            title=title,
+            description=description,
+            created_at_us=now_epoch_us(),
+            deadline_us=to_epoch_us(deadline) if deadline is not None else None,
+        )
+
+    @property
+    def status(self) -> TaskStatus:
+        return STATUSES[self.status_code]
+
+    @property
+    def created_at(self) -> datetime.datetime:
+        return from_epoch_us(self.created_at_us)
+
+    @property
+    def deadline(self) -> Optional[datetime.datetime]:
+        return from_epoch_us(self.deadline_us) if self.deadline_us is not None else None
+
+    @property
+    def closed_at(self) -> Optional[datetime.datetime]:
+        return from_epoch_us(self.closed_at_us) if self.closed_at_us is not None else None
 
     def update_status(self, new_status: TaskStatus) -> None:
-        self.status = new_status
+        self.status_code = STATUS_CODES[new_status]
+        if new_status == TaskStatus.DONE:
+            if self.closed_at_us is None:
+                self.closed_at_us = now_epoch_us()
+        else:
+            self.closed_at_us = None
 
     def update_details(
             self,
@@ -55,4 +125,7 @@ class Task:
         if description is not None:
             self.description = description
         if deadline is not None:
-            self.deadline = deadline
+            self.deadline_us = to_epoch_us(deadline)
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, project_id={self.project_id!r}, title={self.title!r}, status={self.status.value})"
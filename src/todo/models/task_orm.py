@@ -7,10 +7,12 @@ import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, DateTime, func, UUID, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Index, Integer, String, func, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.base import Base
+from ..db.ids import uuid7
+from ..db.types import GUID, UTCDateTime, utc_now
 from ..config.settings import settings
 
 if TYPE_CHECKING:
@@ -28,14 +30,18 @@ class TaskORM(Base):
     """SQLAlchemy ORM model for Task entity."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of a project's tasks by (time-ordered) id
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=False),
+        GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     project_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=False),
+        GUID(),
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
     )
@@ -54,18 +60,26 @@ class TaskORM(Base):
         default=TaskStatus.TODO,
     )
     deadline: Mapped[Optional[datetime.datetime]] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=True,
     )
     created_at: Mapped[datetime.datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=False,
+        default=utc_now,
         server_default=func.now(),
     )
     closed_at: Mapped[Optional[datetime.datetime]] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=True,
     )
+    # Incremented on every update; compared on UPDATE/DELETE for optimistic concurrency
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
 
     # Relationship to project (many-to-one)
     project: Mapped["ProjectORM"] = relationship(
@@ -73,6 +87,8 @@ class TaskORM(Base):
         back_populates="tasks",
     )
 
+    __mapper_args__ = {"version_id_col": version}
+
     def update_status(self, new_status: TaskStatus) -> None:
         """Update task status."""
         self.status = new_status
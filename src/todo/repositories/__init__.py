@@ -1,13 +1,26 @@
 """Repository interfaces and implementations."""
 
-from .interfaces import IProjectRepository, ITaskRepository
+from .interfaces import IProjectRepository, ITaskRepository, IIdempotencyRepository
 from .project_repository import ProjectRepository
 from .task_repository import TaskRepository
+from .idempotency_repository import IdempotencyRepository
+from .in_memory_repository import (
+    InMemoryStore,
+    InMemoryProjectRepository,
+    InMemoryTaskRepository,
+    InMemoryIdempotencyRepository,
+)
 
 __all__ = [
     "IProjectRepository",
     "ITaskRepository",
+    "IIdempotencyRepository",
     "ProjectRepository",
     "TaskRepository",
+    "IdempotencyRepository",
+    "InMemoryStore",
+    "InMemoryProjectRepository",
+    "InMemoryTaskRepository",
+    "InMemoryIdempotencyRepository",
 ]
 
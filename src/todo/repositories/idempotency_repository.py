@@ -0,0 +1,83 @@
+"""SQLAlchemy implementation of the idempotency key repository."""
+
+from __future__ import annotations
+
+import datetime
+from typing import Optional
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..db.types import utc_now
+from ..models.idempotency_key_orm import IdempotencyKeyORM
+from .interfaces import IIdempotencyRepository
+
+
+class IdempotencyRepository(IIdempotencyRepository):
+    """SQLAlchemy-based implementation of the idempotency key repository."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize repository with a database session."""
+        self.session = session
+
+    def get(self, client_key: str, key: str) -> Optional[IdempotencyKeyORM]:
+        """Get an unexpired record for a client's idempotency key."""
+        record = self.session.get(IdempotencyKeyORM, (client_key, key))
+        if record is None or record.expires_at <= utc_now():
+            return None
+        return record
+
+    def claim(self, client_key: str, key: str, fingerprint: str, expires_at: datetime.datetime) -> bool:
+        """Reserve a key before running the request; False if an unexpired record exists."""
+        self.session.execute(
+            delete(IdempotencyKeyORM).where(
+                IdempotencyKeyORM.client_key == client_key,
+                IdempotencyKeyORM.key == key,
+                IdempotencyKeyORM.expires_at <= utc_now(),
+            )
+        )
+        try:
+            # Savepoint, so losing the race to a concurrent request keeps the outer transaction usable.
+            with self.session.begin_nested():
+                self.session.add(IdempotencyKeyORM(
+                    client_key=client_key,
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires_at=expires_at,
+                ))
+        except IntegrityError:
+            return False
+        return True
+
+    def complete(
+        self,
+        client_key: str,
+        key: str,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+        expires_at: datetime.datetime,
+    ) -> None:
+        """Store the response for a claimed key and keep it until ``expires_at``."""
+        self.session.execute(
+            update(IdempotencyKeyORM)
+            .where(IdempotencyKeyORM.client_key == client_key, IdempotencyKeyORM.key == key)
+            .values(status_code=status_code, content_type=content_type, body=body, expires_at=expires_at)
+        )
+
+    def release(self, client_key: str, key: str) -> None:
+        """Drop a claimed key so the request can be retried."""
+        self.session.execute(
+            delete(IdempotencyKeyORM).where(
+                IdempotencyKeyORM.client_key == client_key,
+                IdempotencyKeyORM.key == key,
+            )
+        )
+
+    def purge_expired(self) -> int:
+        """Delete expired records and return how many were removed."""
+        result = self.session.execute(
+            delete(IdempotencyKeyORM).where(IdempotencyKeyORM.expires_at <= utc_now())
+        )
+        return result.rowcount or 0
@@ -0,0 +1,378 @@
+"""In-memory implementation of Project and Task repositories."""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
+from typing import Any, Optional, Sequence
+
+from ..models.project import Project
+from ..models.task import Task
+from ..models.task_orm import TaskStatus
+from ..models.idempotency_key_orm import IdempotencyKeyORM
+from ..db.types import utc_now
+from ..exceptions.repository import DuplicateError, NotFoundError, PreconditionFailedError
+from .interfaces import (
+    IProjectRepository,
+    ITaskRepository,
+    IIdempotencyRepository,
+    PROJECT_ROW_FIELDS,
+    TASK_ROW_FIELDS,
+)
+
+
+def _utc(value: datetime.datetime) -> datetime.datetime:
+    """Normalize naive datetimes to UTC so deadlines stay comparable."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def _rows(fields: Sequence[str], entities: list[Any], **computed: Any) -> list[tuple]:
+    """Project entities onto named tuples holding only ``fields`` (mirrors SQL row results)."""
+    row_type = namedtuple("Row", fields)
+    return [
+        row_type(*(computed[field](entity) if field in computed else getattr(entity, field) for field in fields))
+        for entity in entities
+    ]
+
+
+def _page(entities: list[Any], after: Optional[uuid.UUID], limit: Optional[int]) -> list[Any]:
+    """Keyset page of ``entities`` ordered by id (mirrors the SQL repositories)."""
+    if limit is None:
+        return entities
+    ordered = sorted(entities, key=lambda entity: entity.id)
+    if after is not None:
+        ordered = [entity for entity in ordered if entity.id > after]
+    return ordered[:limit]
+
+
+class InMemoryStore:
+    """Shared state for the in-memory repositories.
+
+    Entities are kept as the compact slotted ``Project``/``Task`` models, indexed by id
+    and lowercase project name; each project holds its own tasks in creation order.
+    A deadline-sorted index serves overdue lookups. Writes are applied immediately:
+    session commit/rollback has no effect on the store.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.projects: dict[uuid.UUID, Project] = {}
+        self.project_ids_by_name: dict[str, uuid.UUID] = {}
+        self.tasks: dict[uuid.UUID, Task] = {}
+        # Sorted (deadline, task id) pairs and the deadline each task is indexed under.
+        self.deadline_index: list[tuple[datetime.datetime, uuid.UUID]] = []
+        self.indexed_deadlines: dict[uuid.UUID, datetime.datetime] = {}
+        # Idempotency records per (client key, key), oldest first.
+        self.idempotency_keys: OrderedDict[tuple[str, str], IdempotencyKeyORM] = OrderedDict()
+
+    def unindex_deadline(self, task_id: uuid.UUID) -> None:
+        previous = self.indexed_deadlines.pop(task_id, None)
+        if previous is not None:
+            position = bisect.bisect_left(self.deadline_index, (previous, task_id))
+            del self.deadline_index[position]
+
+    def index_deadline(self, task: Task) -> None:
+        task_id = task.id
+        # Normalize before unindexing, so a bad deadline leaves the old entry in place
+        deadline = _utc(task.deadline) if task.deadline is not None else None
+        self.unindex_deadline(task_id)
+        if deadline is not None:
+            bisect.insort(self.deadline_index, (deadline, task_id))
+            self.indexed_deadlines[task_id] = deadline
+
+    def remove_task(self, task_id: uuid.UUID) -> None:
+        task = self.tasks.pop(task_id)
+        self.unindex_deadline(task_id)
+        project = self.projects.get(task.project_id)
+        if project is not None:
+            project.remove_task(task_id)
+
+
+class InMemoryProjectRepository(IProjectRepository):
+    """In-memory implementation of Project repository."""
+
+    def __init__(self, store: InMemoryStore) -> None:
+        """Initialize repository with a shared store."""
+        self.store = store
+
+    def create(self, name: str, description: str = "") -> Project:
+        """Create a new project."""
+        with self.store.lock:
+            if name.lower() in self.store.project_ids_by_name:
+                raise DuplicateError(f"A project with name '{name}' already exists")
+
+            project = Project.create(name, description)
+            self.store.projects[project.id] = project
+            self.store.project_ids_by_name[name.lower()] = project.id
+            return project
+
+    def get_by_id(self, project_id: uuid.UUID) -> Optional[Project]:
+        """Get a project by ID."""
+        return self.store.projects.get(project_id)
+
+    def get_by_name(self, name: str) -> Optional[Project]:
+        """Get a project by name (case-insensitive)."""
+        project_id = self.store.project_ids_by_name.get(name.lower())
+        return self.store.projects.get(project_id) if project_id is not None else None
+
+    def get_all(self) -> list[Project]:
+        """Get all projects."""
+        return list(self.store.projects.values())
+
+    def get_rows(
+        self,
+        fields: Sequence[str] = PROJECT_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple]:
+        """Get projects as row tuples holding only ``fields``."""
+        return _rows(
+            fields,
+            _page(self.get_all(), after, limit),
+            task_count=lambda project: len(project.tasks),
+        )
+
+    def get_all_with_tasks(
+        self,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple[Project, list[Task], int]]:
+        """Get projects with their tasks and total task count."""
+        wanted = set(statuses) if statuses else None
+        result = []
+        for project in _page(self.get_all(), after, limit):
+            tasks = list(project.tasks.values())
+            task_count = len(tasks)
+            if wanted is not None:
+                tasks = [task for task in tasks if task.status in wanted]
+            result.append((project, tasks, task_count))
+        return result
+
+    def update(
+        self, project: Project, name: Optional[str] = None, description: Optional[str] = None
+    ) -> Project:
+        """Update an existing project.
+
+        ``project`` is the stored object itself, so the name is checked before any field changes.
+        """
+        with self.store.lock:
+            project_id = project.id
+            new_name = name if name is not None else project.name
+            owner = self.store.project_ids_by_name.get(new_name.lower())
+            if owner is not None and owner != project_id:
+                raise DuplicateError(f"A project with name '{new_name}' already exists")
+
+            project.update_details(name, description)
+            for indexed_name, indexed_id in list(self.store.project_ids_by_name.items()):
+                if indexed_id == project_id:
+                    del self.store.project_ids_by_name[indexed_name]
+            self.store.project_ids_by_name[project.name.lower()] = project_id
+            project.version += 1
+            return project
+
+    def delete(self, project_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a project by ID (and its tasks)."""
+        with self.store.lock:
+            project = self.store.projects.get(project_id)
+            if project is None:
+                return False
+            if expected_version is not None and project.version != expected_version:
+                raise PreconditionFailedError("Project version does not match")
+            del self.store.projects[project_id]
+            self.store.project_ids_by_name.pop(project.name.lower(), None)
+            for task_id in list(project.tasks):
+                self.store.remove_task(task_id)
+            return True
+
+    def count(self) -> int:
+        """Count total number of projects."""
+        return len(self.store.projects)
+
+
+class InMemoryTaskRepository(ITaskRepository):
+    """In-memory implementation of Task repository."""
+
+    def __init__(self, store: InMemoryStore) -> None:
+        """Initialize repository with a shared store."""
+        self.store = store
+
+    def create(
+        self,
+        project_id: uuid.UUID,
+        title: str,
+        description: str = "",
+        deadline: Optional[datetime.datetime] = None,
+    ) -> Task:
+        """Create a new task."""
+        with self.store.lock:
+            project = self.store.projects.get(project_id)
+            if project is None:
+                raise NotFoundError(f"Project {project_id} not found")
+            task = Task.create(project_id, title, description, deadline)
+            self.store.tasks[task.id] = task
+            project.add_task(task)
+            self.store.index_deadline(task)
+            return task
+
+    def create_in_project(
+        self,
+        project_id: uuid.UUID,
+        title: str,
+        description: str,
+        deadline: Optional[datetime.datetime],
+        max_tasks: int,
+    ) -> Optional[Task]:
+        """Create a task if the project exists and is below ``max_tasks`` (atomically, under the store lock)."""
+        with self.store.lock:
+            if project_id not in self.store.projects or self.count_by_project(project_id) >= max_tasks:
+                return None
+            return self.create(project_id, title, description, deadline)
+
+    def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
+        """Get a task by ID."""
+        return self.store.tasks.get(task_id)
+
+    def get_by_project_id(self, project_id: uuid.UUID) -> list[Task]:
+        """Get all tasks for a project."""
+        project = self.store.projects.get(project_id)
+        return list(project.tasks.values()) if project is not None else []
+
+    def get_rows_by_project_id(
+        self,
+        project_id: uuid.UUID,
+        fields: Sequence[str] = TASK_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple]:
+        """Get the tasks of a project as row tuples holding only ``fields``."""
+        return _rows(fields, _page(self.get_by_project_id(project_id), after, limit))
+
+    def update(self, task: Task) -> Task:
+        """Update an existing task (``task`` is the stored object; only the indexes need refreshing)."""
+        with self.store.lock:
+            self.store.index_deadline(task)
+            task.version += 1
+            return task
+
+    def update_fields(
+        self,
+        task_id: uuid.UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime.datetime] = None,
+        status: Optional[TaskStatus] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Task]:
+        """Set the given fields of a task."""
+        with self.store.lock:
+            task = self.store.tasks.get(task_id)
+            if task is None:
+                return None
+            if expected_version is not None and task.version != expected_version:
+                raise PreconditionFailedError("Task version does not match")
+            if title is None and description is None and deadline is None and status is None:
+                return task
+            task.update_details(title, description, deadline)
+            if status is not None:
+                task.update_status(status)
+            self.store.index_deadline(task)
+            task.version += 1
+            return task
+
+    def delete(self, task_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a task by ID."""
+        with self.store.lock:
+            task = self.store.tasks.get(task_id)
+            if task is None:
+                return False
+            if expected_version is not None and task.version != expected_version:
+                raise PreconditionFailedError("Task version does not match")
+            self.store.remove_task(task_id)
+            return True
+
+    def count_by_project(self, project_id: uuid.UUID) -> int:
+        """Count tasks for a project."""
+        project = self.store.projects.get(project_id)
+        return len(project.tasks) if project is not None else 0
+
+    def get_overdue_tasks(self) -> list[Task]:
+        """Get all overdue tasks that are not done."""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        with self.store.lock:
+            end = bisect.bisect_left(self.store.deadline_index, (now,))
+            candidates = [self.store.tasks[task_id] for _, task_id in self.store.deadline_index[:end]]
+        return [task for task in candidates if task.status != TaskStatus.DONE]
+
+
+class InMemoryIdempotencyRepository(IIdempotencyRepository):
+    """In-memory implementation of the idempotency key repository.
+
+    Holds at most ``max_entries`` records; the oldest are evicted first.
+    """
+
+    def __init__(self, store: InMemoryStore, max_entries: int) -> None:
+        """Initialize repository with a shared store and its size bound."""
+        self.store = store
+        self.max_entries = max_entries
+
+    def get(self, client_key: str, key: str) -> Optional[IdempotencyKeyORM]:
+        """Get an unexpired record for a client's idempotency key."""
+        record = self.store.idempotency_keys.get((client_key, key))
+        if record is None or record.expires_at <= utc_now():
+            return None
+        return record
+
+    def claim(self, client_key: str, key: str, fingerprint: str, expires_at: datetime.datetime) -> bool:
+        """Reserve a key before running the request; False if an unexpired record exists."""
+        with self.store.lock:
+            if self.get(client_key, key) is not None:
+                return False
+            records = self.store.idempotency_keys
+            records.pop((client_key, key), None)
+            records[(client_key, key)] = IdempotencyKeyORM(
+                client_key=client_key,
+                key=key,
+                fingerprint=fingerprint,
+                created_at=utc_now(),
+                expires_at=expires_at,
+            )
+            while len(records) > self.max_entries:
+                records.popitem(last=False)
+            return True
+
+    def complete(
+        self,
+        client_key: str,
+        key: str,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+        expires_at: datetime.datetime,
+    ) -> None:
+        """Store the response for a claimed key and keep it until ``expires_at``."""
+        record = self.store.idempotency_keys.get((client_key, key))
+        if record is not None:
+            record.status_code = status_code
+            record.content_type = content_type
+            record.body = body
+            record.expires_at = expires_at
+
+    def release(self, client_key: str, key: str) -> None:
+        """Drop a claimed key so the request can be retried."""
+        with self.store.lock:
+            self.store.idempotency_keys.pop((client_key, key), None)
+
+    def purge_expired(self) -> int:
+        """Delete expired records and return how many were removed."""
+        now = utc_now()
+        with self.store.lock:
+            expired = [name for name, record in self.store.idempotency_keys.items() if record.expires_at <= now]
+            for name in expired:
+                del self.store.idempotency_keys[name]
+            return len(expired)
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 import datetime
 import uuid
 
+from sqlalchemy.engine import Row
+
 from ..models.project_orm import ProjectORM
 from ..models.task_orm import TaskORM, TaskStatus
+from ..models.idempotency_key_orm import IdempotencyKeyORM
+
+# Fields available to the read-model (row) queries, in their default order.
+PROJECT_ROW_FIELDS: tuple[str, ...] = ("id", "name", "description", "created_at", "task_count", "version")
+TASK_ROW_FIELDS: tuple[str, ...] = (
+    "id", "project_id", "title", "description", "status", "deadline", "created_at", "closed_at", "version",
+)
 
 
 class IProjectRepository(ABC):
@@ -35,13 +44,47 @@ class IProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def update(self, project: ProjectORM) -> ProjectORM:
-        """Update an existing project."""
+    def get_rows(
+        self,
+        fields: Sequence[str] = PROJECT_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """Get projects as read-only row tuples holding only ``fields``.
+
+        With ``limit`` the rows are a keyset page ordered by id, starting after the id ``after``.
+        """
+        pass
+
+    @abstractmethod
+    def get_all_with_tasks(
+        self,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple[ProjectORM, list[TaskORM], int]]:
+        """Get projects with their tasks (only tasks in ``statuses`` when given) and total task count.
+
+        The count covers all of a project's tasks, whatever ``statuses`` filters out.
+        With ``limit`` the projects are a keyset page ordered by id, starting after the id ``after``.
+        """
+        pass
+
+    @abstractmethod
+    def update(
+        self, project: ProjectORM, name: Optional[str] = None, description: Optional[str] = None
+    ) -> ProjectORM:
+        """Set the given (non-None) fields of an existing project and save it.
+
+        The new name is checked for duplicates before anything is changed, so a failed
+        rename leaves ``project`` untouched. Raises PreconditionFailedError if the
+        project changed since it was loaded.
+        """
         pass
 
     @abstractmethod
-    def delete(self, project_id: uuid.UUID) -> bool:
-        """Delete a project by ID."""
+    def delete(self, project_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a project by ID, only at ``expected_version`` when given."""
         pass
 
     @abstractmethod
@@ -64,6 +107,21 @@ class ITaskRepository(ABC):
         """Create a new task."""
         pass
 
+    @abstractmethod
+    def create_in_project(
+        self,
+        project_id: uuid.UUID,
+        title: str,
+        description: str,
+        deadline: Optional[datetime.datetime],
+        max_tasks: int,
+    ) -> Optional[TaskORM]:
+        """Create a task if the project exists and has fewer than ``max_tasks`` tasks.
+
+        Returns None, without creating anything, when either condition does not hold.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, task_id: uuid.UUID) -> Optional[TaskORM]:
         """Get a task by ID."""
@@ -74,14 +132,46 @@ class ITaskRepository(ABC):
         """Get all tasks for a project."""
         pass
 
+    @abstractmethod
+    def get_rows_by_project_id(
+        self,
+        project_id: uuid.UUID,
+        fields: Sequence[str] = TASK_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """Get the tasks of a project as read-only row tuples holding only ``fields``.
+
+        With ``limit`` the rows are a keyset page ordered by id, starting after the id ``after``.
+        """
+        pass
+
     @abstractmethod
     def update(self, task: TaskORM) -> TaskORM:
         """Update an existing task."""
         pass
 
     @abstractmethod
-    def delete(self, task_id: uuid.UUID) -> bool:
-        """Delete a task by ID."""
+    def update_fields(
+        self,
+        task_id: uuid.UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime.datetime] = None,
+        status: Optional[TaskStatus] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[TaskORM]:
+        """Set the given (non-None) fields of a task without loading it first.
+
+        Changing the status applies the same ``closed_at`` rules as ``TaskORM.update_status``.
+        Returns the updated task, or None if it does not exist. Raises
+        PreconditionFailedError if ``expected_version`` is given and does not match.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, task_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a task by ID, only at ``expected_version`` when given."""
         pass
 
     @abstractmethod
@@ -94,3 +184,44 @@ class ITaskRepository(ABC):
         """Get all overdue tasks that are not done."""
         pass
 
+
+
+class IIdempotencyRepository(ABC):
+    """Interface for stored idempotent responses."""
+
+    @abstractmethod
+    def get(self, client_key: str, key: str) -> Optional[IdempotencyKeyORM]:
+        """Get an unexpired record for a client's idempotency key."""
+        pass
+
+    @abstractmethod
+    def claim(self, client_key: str, key: str, fingerprint: str, expires_at: datetime.datetime) -> bool:
+        """Reserve a key before running the request; False if an unexpired record exists.
+
+        ``expires_at`` should be short: a claim whose request never completes (e.g. the
+        worker died) is taken over by the next request once it expires.
+        """
+        pass
+
+    @abstractmethod
+    def complete(
+        self,
+        client_key: str,
+        key: str,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+        expires_at: datetime.datetime,
+    ) -> None:
+        """Store the response for a claimed key and keep it until ``expires_at``."""
+        pass
+
+    @abstractmethod
+    def release(self, client_key: str, key: str) -> None:
+        """Drop a claimed key so the request can be retried."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Delete expired records and return how many were removed."""
+        pass
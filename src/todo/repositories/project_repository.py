@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Sequence
 import uuid
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import Select, func, lambda_stmt, select
 
 from ..models.project_orm import ProjectORM
-from ..exceptions.repository import NotFoundError, DuplicateError
-from .interfaces import IProjectRepository
+from ..models.task_orm import TaskORM, TaskStatus
+from ..exceptions.repository import NotFoundError, DuplicateError, PreconditionFailedError
+from .interfaces import IProjectRepository, PROJECT_ROW_FIELDS
+
+
+def _paginate(statement: Select, model: type, after: Optional[uuid.UUID], limit: Optional[int]) -> Select:
+    """Order by creation time, or by id for a keyset page when ``limit`` is given."""
+    if limit is None:
+        return statement.order_by(model.created_at)
+    if after is not None:
+        statement = statement.where(model.id > after)
+    return statement.order_by(model.id).limit(limit)
 
 
 class ProjectRepository(IProjectRepository):
@@ -37,37 +49,111 @@ class ProjectRepository(IProjectRepository):
 
     def get_by_name(self, name: str) -> Optional[ProjectORM]:
         """Get a project by name (case-insensitive)."""
-        return self.session.query(ProjectORM).filter(
-            func.lower(ProjectORM.name) == func.lower(name)
-        ).first()
+        statement = lambda_stmt(
+            lambda: select(ProjectORM).where(func.lower(ProjectORM.name) == func.lower(name)).limit(1)
+        )
+        return self.session.execute(statement).scalars().first()
 
     def get_all(self) -> list[ProjectORM]:
         """Get all projects."""
         return self.session.query(ProjectORM).order_by(ProjectORM.created_at).all()
 
-    def update(self, project: ProjectORM) -> ProjectORM:
+    def get_rows(
+        self,
+        fields: Sequence[str] = PROJECT_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """Get projects as row tuples holding only ``fields``.
+
+        Only the requested columns are selected and no ORM objects are built, so the
+        rows bypass the identity map. ``task_count`` is computed in the same query.
+        Pages are read from the primary key index: ids are time-ordered, so no
+        secondary sort column is needed.
+        """
+        columns = [
+            select(func.count(TaskORM.id))
+            .where(TaskORM.project_id == ProjectORM.id)
+            .scalar_subquery()
+            .label("task_count")
+            if field == "task_count"
+            else getattr(ProjectORM, field)
+            for field in fields
+        ]
+        statement = _paginate(select(*columns), ProjectORM, after, limit)
+        return list(self.session.execute(statement).all())
+
+    def get_all_with_tasks(
+        self,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple[ProjectORM, list[TaskORM], int]]:
+        """Get all projects with their tasks and total task count.
+
+        Tasks are eager-loaded with ``selectinload``: one query for the projects and
+        one ``IN`` query for the tasks of all of them, however many projects there are.
+        When ``statuses`` filters the tasks, the total count is a subquery of the first query.
+        """
+        if not statuses:
+            statement = (
+                _paginate(select(ProjectORM), ProjectORM, after, limit)
+                .options(selectinload(ProjectORM.tasks))
+                .execution_options(populate_existing=True)
+            )
+            projects = self.session.execute(statement).scalars().all()
+            return [(project, list(project.tasks), len(project.tasks)) for project in projects]
+
+        task_count = (
+            select(func.count(TaskORM.id))
+            .where(TaskORM.project_id == ProjectORM.id)
+            .scalar_subquery()
+        )
+        statement = (
+            _paginate(select(ProjectORM, task_count), ProjectORM, after, limit)
+            .options(selectinload(ProjectORM.tasks.and_(TaskORM.status.in_(statuses))))
+            .execution_options(populate_existing=True)
+        )
+        return [(project, list(project.tasks), count) for project, count in self.session.execute(statement)]
+
+    def update(
+        self, project: ProjectORM, name: Optional[str] = None, description: Optional[str] = None
+    ) -> ProjectORM:
         """Update an existing project."""
-        # Check for duplicate name if name changed
-        if project.name:
+        # Check for duplicate name before touching the project, so a refused rename
+        # does not leave a dirty object behind in the session
+        new_name = name if name is not None else project.name
+        if new_name:
             existing = self.session.query(ProjectORM).filter(
-                func.lower(ProjectORM.name) == func.lower(project.name),
+                func.lower(ProjectORM.name) == func.lower(new_name),
                 ProjectORM.id != project.id
             ).first()
             if existing is not None:
-                raise DuplicateError(f"A project with name '{project.name}' already exists")
-
-        self.session.flush()
+                raise DuplicateError(f"A project with name '{new_name}' already exists")
+        project.update_details(name, description)
+
+        # The UPDATE is conditional on the version that was loaded
+        try:
+            self.session.flush()
+        except StaleDataError as e:
+            raise PreconditionFailedError("Project was modified concurrently") from e
         return project
 
-    def delete(self, project_id: uuid.UUID) -> bool:
-        """Delete a project by ID."""
+    def delete(self, project_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a project by ID, only at ``expected_version`` when given."""
         project = self.get_by_id(project_id)
         if project is None:
             return False
+        if expected_version is not None and project.version != expected_version:
+            raise PreconditionFailedError("Project version does not match")
         self.session.delete(project)
+        try:
+            self.session.flush()
+        except StaleDataError as e:
+            raise PreconditionFailedError("Project was modified concurrently") from e
         return True
 
     def count(self) -> int:
         """Count total number of projects."""
-        return self.session.query(func.count(ProjectORM.id)).scalar() or 0
+        return self.session.execute(lambda_stmt(lambda: select(func.count(ProjectORM.id)))).scalar() or 0
 
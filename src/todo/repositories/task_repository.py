@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Sequence
 import datetime
 import uuid
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import func, and_, insert, lambda_stmt, select, update, literal
 
+from ..db.ids import uuid7
+from ..db.types import GUID, UTCDateTime, utc_now
+
+from ..models.project_orm import ProjectORM
 from ..models.task_orm import TaskORM, TaskStatus
-from ..exceptions.repository import NotFoundError
-from .interfaces import ITaskRepository
+from ..exceptions.repository import NotFoundError, PreconditionFailedError
+from .interfaces import ITaskRepository, TASK_ROW_FIELDS
+from .project_repository import _paginate
 
 
 class TaskRepository(ITaskRepository):
@@ -38,6 +45,49 @@ class TaskRepository(ITaskRepository):
         self.session.flush()
         return task
 
+    def create_in_project(
+        self,
+        project_id: uuid.UUID,
+        title: str,
+        description: str,
+        deadline: Optional[datetime.datetime],
+        max_tasks: int,
+    ) -> Optional[TaskORM]:
+        """Create a task if the project exists and is below ``max_tasks``, in one round trip.
+
+        The existence check, the task count and the insert are a single
+        ``INSERT ... SELECT ... FROM projects WHERE ... RETURNING`` statement, instead
+        of a lookup, a count and a flush each waiting for the previous reply. As with
+        separate queries, concurrent inserts under READ COMMITTED can both pass the count.
+        """
+        task_count = (
+            select(func.count())
+            .select_from(TaskORM)
+            .where(TaskORM.project_id == project_id)
+            .scalar_subquery()
+        )
+        columns = TaskORM.__table__.c
+        values = select(
+            literal(uuid7(), GUID()),
+            ProjectORM.id,
+            literal(title, columns.title.type),
+            literal(description, columns.description.type),
+            literal(TaskStatus.TODO, columns.status.type),
+            literal(deadline, UTCDateTime()),
+            literal(utc_now(), UTCDateTime()),
+            literal(1, columns.version.type),
+        ).where(ProjectORM.id == project_id, task_count < max_tasks)
+        statement = (
+            insert(TaskORM)
+            .from_select(
+                ["id", "project_id", "title", "description", "status", "deadline", "created_at", "version"],
+                values,
+            )
+            .returning(TaskORM)
+            .execution_options(populate_existing=True)
+        )
+        return self.session.execute(statement).scalars().first()
+
     def get_by_id(self, task_id: uuid.UUID) -> Optional[TaskORM]:
         """Get a task by ID."""
         return self.session.get(TaskORM, task_id)
@@ -48,24 +98,108 @@ class TaskRepository(ITaskRepository):
             TaskORM.project_id == project_id
         ).order_by(TaskORM.created_at).all()
 
+    def get_rows_by_project_id(
+        self,
+        project_id: uuid.UUID,
+        fields: Sequence[str] = TASK_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """Get the tasks of a project as row tuples holding only ``fields``.
+
+        Only the requested columns are selected and no ORM objects are built, so the
+        rows bypass the identity map. Pages are read from the (project_id, id) index.
+        """
+        statement = (
+            select(*(getattr(TaskORM, field) for field in fields))
+            .where(TaskORM.project_id == project_id)
+        )
+        return list(self.session.execute(_paginate(statement, TaskORM, after, limit)).all())
+
     def update(self, task: TaskORM) -> TaskORM:
-        """Update an existing task."""
-        self.session.flush()
+        """Update an existing task (PreconditionFailedError if it changed since it was loaded)."""
+        try:
+            self.session.flush()
+        except StaleDataError as e:
+            raise PreconditionFailedError("Task was modified concurrently") from e
+        return task
+
+    def update_fields(
+        self,
+        task_id: uuid.UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime.datetime] = None,
+        status: Optional[TaskStatus] = None,
+        expected_version: Optional[int] = None,
+    ) -> Optional[TaskORM]:
+        """Set the given fields with a single ``UPDATE ... RETURNING`` statement.
+
+        The ``closed_at`` transition is part of the statement: it keeps an existing
+        value when the task is set to DONE again and is cleared for other statuses.
+        The version is incremented in the same statement and, with ``expected_version``,
+        checked in its WHERE clause. The returned task replaces any stale copy in the
+        session's identity map.
+        """
+        values: dict = {}
+        if title is not None:
+            values["title"] = title
+        if description is not None:
+            values["description"] = description
+        if deadline is not None:
+            values["deadline"] = deadline
+        if status is not None:
+            values["status"] = status
+            if status == TaskStatus.DONE:
+                values["closed_at"] = func.coalesce(TaskORM.closed_at, literal(utc_now(), UTCDateTime()))
+            else:
+                values["closed_at"] = None
+        if not values:
+            task = self.get_by_id(task_id)
+            if task is not None and expected_version is not None and task.version != expected_version:
+                raise PreconditionFailedError("Task version does not match")
+            return task
+        values["version"] = TaskORM.version + 1
+
+        statement = update(TaskORM).where(TaskORM.id == task_id)
+        if expected_version is not None:
+            statement = statement.where(TaskORM.version == expected_version)
+        statement = (
+            statement
+            .values(**values)
+            .returning(TaskORM)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        task = self.session.scalars(statement).one_or_none()
+        if task is None and expected_version is not None and self._exists(task_id):
+            raise PreconditionFailedError("Task version does not match")
         return task
 
-    def delete(self, task_id: uuid.UUID) -> bool:
-        """Delete a task by ID."""
+    def _exists(self, task_id: uuid.UUID) -> bool:
+        statement = lambda_stmt(lambda: select(TaskORM.id).where(TaskORM.id == task_id))
+        return self.session.execute(statement).first() is not None
+
+    def delete(self, task_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a task by ID, only at ``expected_version`` when given."""
         task = self.get_by_id(task_id)
         if task is None:
             return False
+        if expected_version is not None and task.version != expected_version:
+            raise PreconditionFailedError("Task version does not match")
         self.session.delete(task)
+        try:
+            self.session.flush()
+        except StaleDataError as e:
+            raise PreconditionFailedError("Task was modified concurrently") from e
         return True
 
     def count_by_project(self, project_id: uuid.UUID) -> int:
         """Count tasks for a project."""
-        return self.session.query(func.count(TaskORM.id)).filter(
-            TaskORM.project_id == project_id
-        ).scalar() or 0
+        # Lambda statement: built and cache-keyed once, only project_id is re-bound per call
+        statement = lambda_stmt(
+            lambda: select(func.count(TaskORM.id)).where(TaskORM.project_id == project_id)
+        )
+        return self.session.execute(statement).scalar() or 0
 
     def get_overdue_tasks(self) -> list[TaskORM]:
         """Get all overdue tasks that are not done."""
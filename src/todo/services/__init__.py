@@ -1,5 +1,6 @@
 """Services for the ToDo application."""
 
 from .todo_manager import ToDoListManager
+from .batch_executor import BatchExecutor, BatchResult
 
-__all__ = ["ToDoListManager"]
\ No newline at end of file
+__all__ = ["ToDoListManager", "BatchExecutor", "BatchResult"]
@@ -0,0 +1,104 @@
+"""Run a sequence of write operations on one session with batch transaction semantics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from ..exceptions.service import BusinessRuleError
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch step.
+
+    ``executed`` is False for steps skipped after an earlier failure in an
+    all-or-nothing batch.
+    """
+
+    value: Any = None
+    error: Optional[Exception] = None
+    executed: bool = True
+
+    @property
+    def ok(self) -> bool:
+        return self.executed and self.error is None
+
+
+class BatchExecutor:
+    """Execute batch steps on a single session and commit once.
+
+    A step is a callable performing one operation through the service layer and
+    returning its (already serialized) result. Results must be built inside the
+    step, because committing expires the ORM objects it touched.
+    """
+
+    def __init__(self, session: Session, supports_rollback: bool = True) -> None:
+        """Initialize with the session the steps write through.
+
+        Args:
+            session: Database session shared by all steps
+            supports_rollback: False when the storage backend applies writes immediately
+                (in-memory storage), which rules out all-or-nothing batches
+        """
+        self.session = session
+        self.supports_rollback = supports_rollback
+
+    def execute(
+        self, steps: Sequence[Callable[[], Any]], atomic: bool = True
+    ) -> tuple[bool, list[BatchResult]]:
+        """Run the steps in order.
+
+        Args:
+            steps: Operations to run
+            atomic: All-or-nothing when True: the first failure rolls back every step and
+                skips the rest. Otherwise each step runs in its own savepoint, failed steps
+                are rolled back individually and the others are committed.
+
+        Returns:
+            Whether anything was committed, and one result per step
+        """
+        if atomic:
+            if not self.supports_rollback:
+                raise BusinessRuleError("All-or-nothing batches are not supported by the in-memory backend")
+            return self._execute_atomic(steps)
+        return self._execute_independent(steps)
+
+    def _execute_atomic(self, steps: Sequence[Callable[[], Any]]) -> tuple[bool, list[BatchResult]]:
+        results: list[BatchResult] = []
+        try:
+            for index, step in enumerate(steps):
+                try:
+                    results.append(BatchResult(value=step()))
+                except Exception as exc:
+                    self.session.rollback()
+                    results.append(BatchResult(error=exc))
+                    results.extend(BatchResult(executed=False) for _ in steps[index + 1:])
+                    return False, results
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return True, results
+
+    def _execute_independent(self, steps: Sequence[Callable[[], Any]]) -> tuple[bool, list[BatchResult]]:
+        results: list[BatchResult] = []
+        try:
+            for step in steps:
+                savepoint = self.session.begin_nested() if self.supports_rollback else None
+                try:
+                    value = step()
+                    if savepoint is not None:
+                        savepoint.commit()
+                    results.append(BatchResult(value=value))
+                except Exception as exc:
+                    if savepoint is not None:
+                        savepoint.rollback()
+                    results.append(BatchResult(error=exc))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return any(result.ok for result in results), results
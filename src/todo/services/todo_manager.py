@@ -2,14 +2,22 @@ from __future__ import annotations
 
 import datetime
 import uuid
-from typing import Optional
+from typing import Optional, Sequence
+
+from sqlalchemy.engine import Row
 
 from ..config.settings import settings
 from ..models.project_orm import ProjectORM
 from ..models.task_orm import TaskORM, TaskStatus
-from ..repositories.interfaces import IProjectRepository, ITaskRepository
+from ..repositories.interfaces import (
+    IProjectRepository,
+    ITaskRepository,
+    PROJECT_ROW_FIELDS,
+    TASK_ROW_FIELDS,
+)
 from ..exceptions.service import ValidationError, BusinessRuleError
-from ..exceptions.repository import NotFoundError
+from ..events.publisher import IEventPublisher, TaskEvent, TASK_CREATED, TASK_UPDATED, TASK_DELETED
+from ..exceptions.repository import NotFoundError, PreconditionFailedError
 
 
 class ToDoListManager:
@@ -17,10 +25,16 @@ class ToDoListManager:
         self,
         project_repository: IProjectRepository,
         task_repository: ITaskRepository,
+        event_publisher: Optional[IEventPublisher] = None,
     ) -> None:
-        """Initialize service with repositories via dependency injection."""
+        """Initialize service with repositories (and optionally an event publisher) via dependency injection."""
         self.project_repo = project_repository
         self.task_repo = task_repository
+        self.event_publisher = event_publisher
+
+    def _publish(self, event_type: str, task: TaskORM) -> None:
+        if self.event_publisher is not None:
+            self.event_publisher.publish(TaskEvent.from_task(event_type, task))
 
     def create_project(self, name: str, description: str = "") -> ProjectORM:
         """Create a new project with business rule validation."""
@@ -44,118 +58,155 @@ class ToDoListManager:
             raise
 
     def edit_project(
-        self, project_id: str | uuid.UUID, name: str, description: str | None = None
+        self,
+        project_id: uuid.UUID,
+        name: str,
+        description: str | None = None,
+        expected_version: Optional[int] = None,
     ) -> ProjectORM:
-        """Edit an existing project."""
-        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-        project = self.project_repo.get_by_id(project_uuid)
+        """Edit an existing project, only at ``expected_version`` when given."""
+        project = self.project_repo.get_by_id(project_id)
         if project is None:
             raise NotFoundError("Project not found")
+        if expected_version is not None and project.version != expected_version:
+            raise PreconditionFailedError("Project version does not match")
 
-        project.update_details(name, description)
+        # The repository checks the new name before changing the project
         try:
-            return self.project_repo.update(project)
+            return self.project_repo.update(project, name, description)
         except Exception as e:
             if "already exists" in str(e).lower():
                 raise BusinessRuleError(str(e)) from e
             raise
 
-    def delete_project(self, project_id: str | uuid.UUID) -> bool:
+    def delete_project(self, project_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
         """Delete a project (cascade delete handled by database)."""
-        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-        return self.project_repo.delete(project_uuid)
+        return self.project_repo.delete(project_id, expected_version)
 
     def add_task_to_project(
         self,
-        project_id: str | uuid.UUID,
+        project_id: uuid.UUID,
         title: str,
         description: str = "",
         deadline: Optional[datetime.datetime] = None,
     ) -> TaskORM:
-        """Add a task to a project with business rule validation."""
-        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-        
-        # Check project exists
-        project = self.project_repo.get_by_id(project_uuid)
-        if project is None:
-            raise NotFoundError("Project not found")
-
-        # Business rule: check max number of tasks per project
-        task_count = self.task_repo.count_by_project(project_uuid)
-        if task_count >= settings.MAX_NUMBER_OF_TASKS:
+        """Add a task to a project with business rule validation.
+
+        The project check, the task limit and the insert run as one statement; the
+        reason for a refusal is only looked up when the task was not created.
+        """
+        task = self.task_repo.create_in_project(
+            project_id, title, description, deadline, settings.MAX_NUMBER_OF_TASKS
+        )
+        if task is None:
+            if self.project_repo.get_by_id(project_id) is None:
+                raise NotFoundError("Project not found")
+            # Business rule: max number of tasks per project
             raise BusinessRuleError(
                 f"Cannot add more than {settings.MAX_NUMBER_OF_TASKS} tasks to a project"
             )
 
-        # Create task
-        return self.task_repo.create(project_uuid, title, description, deadline)
+        self._publish(TASK_CREATED, task)
+        return task
 
     def change_task_status(
-        self, task_id: str | uuid.UUID, new_status: TaskStatus
+        self, task_id: uuid.UUID, new_status: TaskStatus, expected_version: Optional[int] = None
     ) -> TaskORM:
         """Change task status."""
-        task_uuid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-        task = self.task_repo.get_by_id(task_uuid)
-        if task is None:
-            raise NotFoundError("Task not found")
-
-        task.update_status(new_status)
-        return self.task_repo.update(task)
+        return self.edit_task(task_id, status=new_status, expected_version=expected_version)
     
     def edit_task(
         self,
-        task_id: str | uuid.UUID,
+        task_id: uuid.UUID,
         title: Optional[str] = None,
         description: Optional[str] = None,
         deadline: Optional[datetime.datetime] = None,
         status: Optional[TaskStatus] = None,
+        expected_version: Optional[int] = None,
     ) -> TaskORM:
-        """Edit an existing task."""
-        task_uuid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-        task = self.task_repo.get_by_id(task_uuid)
+        """Edit an existing task; fields left as None keep their current values.
+
+        The task is updated in place by the repository, without loading it first.
+        With ``expected_version`` the update only applies to that version of the task.
+        """
+        task = self.task_repo.update_fields(task_id, title, description, deadline, status, expected_version)
         if task is None:
             raise NotFoundError("Task not found")
 
-        task.update_details(title, description, deadline)
-        if status is not None:
-            task.update_status(status)
-
-        return self.task_repo.update(task)
+        self._publish(TASK_UPDATED, task)
+        return task
     
-    def delete_task(self, task_id: str | uuid.UUID) -> bool:
-        """Delete a task."""
-        task_uuid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-        return self.task_repo.delete(task_uuid)
+    def delete_task(self, task_id: uuid.UUID, expected_version: Optional[int] = None) -> bool:
+        """Delete a task, only at ``expected_version`` when given."""
+        task = self.task_repo.get_by_id(task_id) if self.event_publisher is not None else None
+        deleted = self.task_repo.delete(task_id, expected_version)
+        if deleted and task is not None:
+            self._publish(TASK_DELETED, task)
+        return deleted
 
     def list_all_projects(self) -> list[ProjectORM]:
         """List all projects."""
         return self.project_repo.get_all()
 
-    def list_project_tasks(self, project_id: str | uuid.UUID) -> list[TaskORM]:
+    def list_project_tasks(self, project_id: uuid.UUID) -> list[TaskORM]:
         """List all tasks for a project."""
-        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-        project = self.project_repo.get_by_id(project_uuid)
+        project = self.project_repo.get_by_id(project_id)
+        if project is None:
+            raise NotFoundError("Project not found")
+
+        return self.task_repo.get_by_project_id(project_id)
+
+    def list_project_rows(
+        self,
+        fields: Sequence[str] = PROJECT_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """List projects as read-only rows holding only ``fields`` (may include task_count).
+
+        With ``limit``, return one keyset page ordered by id, starting after ``after``.
+        """
+        return self.project_repo.get_rows(fields, after, limit)
+
+    def list_projects_with_tasks(
+        self,
+        statuses: Optional[Sequence[TaskStatus]] = None,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[tuple[ProjectORM, list[TaskORM], int]]:
+        """List projects with their tasks (optionally only tasks in ``statuses``) and total task count."""
+        return self.project_repo.get_all_with_tasks(statuses, after, limit)
+
+    def list_project_task_rows(
+        self,
+        project_id: uuid.UUID,
+        fields: Sequence[str] = TASK_ROW_FIELDS,
+        after: Optional[uuid.UUID] = None,
+        limit: Optional[int] = None,
+    ) -> list[Row]:
+        """List the tasks of a project as read-only rows holding only ``fields``.
+
+        With ``limit``, return one keyset page ordered by id, starting after ``after``.
+        """
+        project = self.project_repo.get_by_id(project_id)
         if project is None:
             raise NotFoundError("Project not found")
 
-        return self.task_repo.get_by_project_id(project_uuid)
+        return self.task_repo.get_rows_by_project_id(project_id, fields, after, limit)
 
-    def get_project(self, project_id: str | uuid.UUID) -> Optional[ProjectORM]:
-        """Get a project by ID (accepts string or UUID)."""
-        project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-        return self.project_repo.get_by_id(project_uuid)
+    def get_project(self, project_id: uuid.UUID) -> Optional[ProjectORM]:
+        """Get a project by ID."""
+        return self.project_repo.get_by_id(project_id)
 
     def get_task(
-        self, project_id: str | uuid.UUID, task_id: str | uuid.UUID
+        self, project_id: Optional[uuid.UUID], task_id: uuid.UUID
     ) -> Optional[TaskORM]:
         """Get a task by ID (optionally verify it belongs to project)."""
-        task_uuid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-        task = self.task_repo.get_by_id(task_uuid)
+        task = self.task_repo.get_by_id(task_id)
         
         # Optionally verify task belongs to project
         if task and project_id:
-            project_uuid = uuid.UUID(project_id) if isinstance(project_id, str) else project_id
-            if task.project_id != project_uuid:
+            if task.project_id != project_id:
                 return None
 
         return task
@@ -0,0 +1 @@
+"""Operational tools for the ToDo application (load testing, etc.)."""
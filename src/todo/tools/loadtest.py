@@ -0,0 +1,273 @@
+"""HTTP load generator that replays recorded traffic against a running API.
+
+Request sources:
+
+- JSON Lines request logs, one request per line::
+
+      {"method": "GET", "path": "/api/v1/projects"}
+      {"method": "POST", "path": "/api/v1/projects", "body": {"name": "p"}, "headers": {"Accept-Encoding": "gzip"}}
+
+- Postman v2.1 collections such as ``postman_collection.json``; ``{{variables}}`` are
+  resolved from the collection and from ``--var`` overrides.
+
+Example::
+
+    python -m src.todo.tools.loadtest postman_collection.json --base-url http://localhost:8000 \\
+        --var project_id=<uuid> --var task_id=<uuid> --methods GET \\
+        --concurrency 32 --rate 500 --duration 60 --json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import httpx
+
+_VARIABLE = re.compile(r"\{\{\s*([\w.-]+)\s*\}\}")
+_UUID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}(?=/|$)")
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@dataclass
+class RecordedRequest:
+    """One request to replay."""
+    method: str
+    path: str
+    body: Optional[str] = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def route(self) -> str:
+        """Path with ids collapsed, used to group latencies."""
+        path = self.path.split("?", 1)[0]
+        path = _UUID_SEGMENT.sub("/{id}", path)
+        return f"{self.method} {_NUMERIC_SEGMENT.sub('/{n}', path)}"
+
+
+def _substitute(value: str, variables: dict[str, str]) -> str:
+    return _VARIABLE.sub(lambda match: variables.get(match.group(1), match.group(0)), value)
+
+
+def load_jsonl(path: str) -> list[RecordedRequest]:
+    """Load a JSON Lines request log."""
+    requests = []
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if "method" not in entry or "path" not in entry:
+                raise ValueError(f"{path}:{line_number}: entries need 'method' and 'path'")
+            body = entry.get("body")
+            requests.append(RecordedRequest(
+                method=entry["method"].upper(),
+                path=entry["path"],
+                body=json.dumps(body) if body is not None and not isinstance(body, str) else body,
+                headers=dict(entry.get("headers") or {}),
+            ))
+    return requests
+
+
+def load_postman(path: str, overrides: dict[str, str]) -> list[RecordedRequest]:
+    """Load the requests of a Postman v2.1 collection, in collection order."""
+    with open(path, encoding="utf-8") as handle:
+        collection = json.load(handle)
+
+    variables = {var["key"]: str(var.get("value", "")) for var in collection.get("variable", [])}
+    variables.update(overrides)
+
+    requests = []
+
+    def walk(items: list[dict[str, Any]]) -> None:
+        for item in items:
+            if "item" in item:
+                walk(item["item"])
+                continue
+            request = item["request"]
+            url = request["url"]["raw"] if isinstance(request["url"], dict) else request["url"]
+            url = _substitute(url, variables)
+            # Replay paths only; the target host comes from --base-url.
+            path = re.sub(r"^[a-zA-Z]+://[^/]+", "", url)
+            body = request.get("body", {}).get("raw") if request.get("body") else None
+            requests.append(RecordedRequest(
+                method=request["method"].upper(),
+                path=path if path.startswith("/") else f"/{path}",
+                body=_substitute(body, variables) if body else None,
+                headers={
+                    header["key"]: _substitute(header["value"], variables)
+                    for header in request.get("header", [])
+                    if not header.get("disabled")
+                },
+            ))
+
+    walk(collection.get("item", []))
+    return requests
+
+
+@dataclass
+class RouteStats:
+    """Latencies and outcomes of one route."""
+    latencies: list[float] = field(default_factory=list)
+    client_errors: int = 0
+    server_errors: int = 0
+    failures: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies) + self.failures
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    # Rank = ceil(fraction * n); rounding first keeps e.g. 0.28 * 25 from landing just above 7
+    rank = math.ceil(round(fraction * len(ordered), 9))
+    index = min(len(ordered) - 1, max(0, rank - 1))
+    return ordered[index]
+
+
+async def run_load(
+    base_url: str,
+    requests: list[RecordedRequest],
+    concurrency: int,
+    rate: Optional[float],
+    total: Optional[int],
+    duration: Optional[float],
+    timeout: float,
+) -> tuple[dict[str, RouteStats], float]:
+    """Replay ``requests`` round-robin; returns per-route stats and the elapsed wall time."""
+    stats: dict[str, RouteStats] = {}
+    next_index = 0
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+
+    def claim() -> Optional[tuple[int, RecordedRequest]]:
+        nonlocal next_index
+        if total is not None and next_index >= total:
+            return None
+        if deadline is not None and time.perf_counter() >= deadline:
+            return None
+        index = next_index
+        next_index += 1
+        return index, requests[index % len(requests)]
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        async def worker() -> None:
+            while (claimed := claim()) is not None:
+                index, request = claimed
+                if rate:
+                    # Open-loop pacing: request N starts no earlier than N / rate seconds in.
+                    delay = start + index / rate - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                route = stats.setdefault(request.route, RouteStats())
+                sent = time.perf_counter()
+                try:
+                    response = await client.request(
+                        request.method, request.path, content=request.body, headers=request.headers
+                    )
+                except httpx.HTTPError:
+                    route.failures += 1
+                    continue
+                route.latencies.append(time.perf_counter() - sent)
+                if response.status_code >= 500:
+                    route.server_errors += 1
+                elif response.status_code >= 400:
+                    route.client_errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return stats, time.perf_counter() - start
+
+
+def build_report(stats: dict[str, RouteStats], elapsed: float) -> dict[str, Any]:
+    """Summarize throughput, latency percentiles and error rates."""
+    routes = {}
+    total = errors = 0
+    for route, route_stats in sorted(stats.items()):
+        ordered = sorted(route_stats.latencies)
+        route_errors = route_stats.server_errors + route_stats.failures
+        total += route_stats.count
+        errors += route_errors
+        routes[route] = {
+            "requests": route_stats.count,
+            "p50_ms": percentile(ordered, 0.50) * 1000,
+            "p95_ms": percentile(ordered, 0.95) * 1000,
+            "p99_ms": percentile(ordered, 0.99) * 1000,
+            "client_errors": route_stats.client_errors,
+            "error_rate": route_errors / route_stats.count if route_stats.count else 0.0,
+        }
+    return {
+        "requests": total,
+        "elapsed_seconds": elapsed,
+        "throughput_rps": total / elapsed if elapsed > 0 else 0.0,
+        "error_rate": errors / total if total else 0.0,
+        "routes": routes,
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(
+        f"{report['requests']} requests in {report['elapsed_seconds']:.2f}s "
+        f"({report['throughput_rps']:.1f} req/s), error rate {report['error_rate']:.2%}"
+    )
+    print(f"{'route':<48} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'4xx':>6} {'errors':>7}")
+    for route, row in report["routes"].items():
+        print(
+            f"{route:<48} {row['requests']:>7} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} "
+            f"{row['p99_ms']:>9.2f} {row['client_errors']:>6} {row['error_rate']:>7.2%}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.todo.tools.loadtest", description=__doc__.split("\n")[0])
+    parser.add_argument("source", help="JSON Lines request log or Postman collection (.json)")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Target API base URL")
+    parser.add_argument("--var", action="append", default=[], metavar="KEY=VALUE", help="Postman variable override")
+    parser.add_argument("--methods", help="Comma-separated HTTP methods to replay (default: all)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent connections")
+    parser.add_argument("--rate", type=float, help="Target requests per second across all connections")
+    parser.add_argument("--requests", type=int, help="Total requests to send")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--json", dest="json_output", help="Also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    overrides = dict(item.split("=", 1) for item in args.var)
+    if args.source.endswith(".jsonl") or args.source.endswith(".ndjson"):
+        requests = load_jsonl(args.source)
+    else:
+        requests = load_postman(args.source, overrides)
+    if args.methods:
+        allowed = {method.strip().upper() for method in args.methods.split(",")}
+        requests = [request for request in requests if request.method in allowed]
+    if not requests:
+        sys.exit("No requests to replay")
+
+    total = args.requests
+    if total is None and args.duration is None:
+        total = len(requests)
+
+    stats, elapsed = asyncio.run(run_load(
+        args.base_url, requests, args.concurrency, args.rate, total, args.duration, args.timeout
+    ))
+    report = build_report(stats, elapsed)
+    print_report(report)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Shared fixtures: a throwaway SQLite primary database and an API client."""
+
+import os
+import tempfile
+
+# Settings are read at import time, so the environment must be set before importing the app.
+_DATA_DIR = tempfile.mkdtemp(prefix="todo-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DATA_DIR, 'primary.db')}"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+os.environ["STORAGE_BACKEND"] = "sqlalchemy"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["METRICS_ENABLED"] = "false"
+
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.todo.db import Base
+from src.todo.db.session import get_engine
+import src.todo.models  # noqa: F401  (registers the tables)
+
+API_BASE_URL = "http://testserver/api/v1/"
+
+
+@pytest.fixture
+def primary_engine():
+    """The primary database, with empty tables for each test."""
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def client(primary_engine) -> Iterator[TestClient]:
+    """API client for the application as configured by the environment above."""
+    from src.todo.api.app import app
+
+    yield TestClient(app, base_url=API_BASE_URL)
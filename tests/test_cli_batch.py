@@ -0,0 +1,80 @@
+"""The ``todo`` subcommands and NDJSON batch mode."""
+
+import io
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.todo.cli.subcommands import run_command
+from src.todo.models.project_orm import ProjectORM
+
+
+def _run(argv: list[str], batch: str = "", monkeypatch=None) -> tuple[int, list[dict]]:
+    out = io.StringIO()
+    if monkeypatch is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(batch))
+    status = run_command(argv, out)
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def _project_count(engine) -> int:
+    with Session(engine) as session:
+        return session.scalar(select(func.count()).select_from(ProjectORM))
+
+
+def test_batch_applies_operations_with_references(primary_engine, monkeypatch):
+    batch = "\n".join([
+        '{"op": "project.add", "name": "Work"}',
+        '{"op": "task.add", "project": "$0", "title": "Report"}',
+        '{"op": "task.status", "id": "$1", "status": "doing"}',
+    ])
+
+    status, lines = _run(["batch", "-"], batch, monkeypatch)
+
+    assert status == 0
+    assert lines[2]["data"]["status"] == "DOING"
+    assert lines[-1] == {"committed": True, "operations": 3, "succeeded": 3}
+
+
+@pytest.mark.parametrize("line, message", [
+    ('{"op": "task.status", "id": "$0", "status": "LATER"}', "Invalid status"),
+    ('{"op": "task.add", "project": "$5", "title": "x"}', "does not point to an earlier add operation"),
+    ('{"op": "task.add", "project": "$0"}', "title is required"),
+    ('{"op": "task.add", "project": "$0", "title": "x", "deadline": "2000-01-01"}', "in the past"),
+])
+def test_invalid_parameters_reject_the_whole_batch(primary_engine, monkeypatch, line, message):
+    batch = '{"op": "project.add", "name": "Work"}\n' + line
+
+    status, lines = _run(["batch", "-"], batch, monkeypatch)
+
+    assert status == 1
+    (result,) = lines
+    assert result["error"]["code"] == "validation_error"
+    assert result["error"]["message"].startswith("Line 2: ")
+    assert message in result["error"]["message"]
+    assert _project_count(primary_engine) == 0
+
+
+def test_errors_use_the_api_codes(primary_engine):
+    status, (result,) = _run(["task", "status", "00000000-0000-0000-0000-000000000000", "DONE"])
+
+    assert status == 1
+    assert result["error"]["code"] == "resource_not_found"
+
+
+def test_commit_failure_is_reported_as_json(primary_engine, monkeypatch):
+    def fail(self):
+        raise OperationalError("COMMIT", {}, Exception("disk I/O error"))
+
+    monkeypatch.setattr(Session, "commit", fail)
+
+    status, (result,) = _run(["batch", "-"], '{"op": "project.add", "name": "Work"}', monkeypatch)
+
+    assert status == 1
+    assert result["op"] == "batch"
+    assert result["error"]["code"] == "internal_server_error"
+    monkeypatch.undo()
+    assert _project_count(primary_engine) == 0
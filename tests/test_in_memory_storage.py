@@ -0,0 +1,51 @@
+"""The API running on the in-memory storage backend (compact slotted models)."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.todo import factory
+from src.todo.config.settings import settings
+from src.todo.models import Project, Task
+from src.todo.repositories import InMemoryStore
+
+from .conftest import API_BASE_URL
+
+
+@pytest.fixture
+def memory_client(primary_engine, monkeypatch) -> TestClient:
+    from src.todo.api.app import app
+
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "memory")
+    monkeypatch.setattr(factory, "memory_store", InMemoryStore())
+    return TestClient(app, base_url=API_BASE_URL)
+
+
+def test_store_holds_compact_models(memory_client):
+    project = memory_client.post("projects", json={"name": "memory"}).json()["data"]
+    task = memory_client.post(
+        f"projects/{project['id']}/tasks", json={"title": "first", "deadline": "2030-01-01T00:00:00Z"}
+    ).json()["data"]
+
+    store = factory.memory_store
+    (stored_project,) = store.projects.values()
+    (stored_task,) = store.tasks.values()
+    assert isinstance(stored_project, Project)
+    assert isinstance(stored_task, Task)
+    assert stored_project.tasks == {stored_task.id: stored_task}
+    assert task["deadline"].startswith("2030-01-01T00:00:00")
+
+
+def test_task_lifecycle(memory_client):
+    project_id = memory_client.post("projects", json={"name": "memory"}).json()["data"]["id"]
+    task_id = memory_client.post(f"projects/{project_id}/tasks", json={"title": "first"}).json()["data"]["id"]
+
+    done = memory_client.patch(f"tasks/{task_id}/status", json={"status": "DONE"}).json()["data"]
+    assert done["status"] == "DONE"
+    assert done["closed_at"] is not None
+
+    listing = memory_client.get("projects?include=tasks").json()["data"]
+    assert [[task["id"] for task in project["tasks"]] for project in listing] == [[task_id]]
+
+    assert memory_client.delete(f"projects/{project_id}").status_code == 204
+    assert factory.memory_store.tasks == {}
+    assert memory_client.get(f"tasks/{task_id}").status_code == 404
@@ -0,0 +1,26 @@
+"""Project listing with embedded tasks."""
+
+import pytest
+
+
+@pytest.fixture
+def project_with_tasks(client) -> str:
+    project_id = client.post("projects", json={"name": "listed"}).json()["data"]["id"]
+    task_ids = [
+        client.post(f"projects/{project_id}/tasks", json={"title": f"task-{i}"}).json()["data"]["id"]
+        for i in range(3)
+    ]
+    client.patch(f"tasks/{task_ids[0]}/status", json={"status": "DONE"})
+    return project_id
+
+
+@pytest.mark.parametrize("query, embedded", [
+    ("include=tasks", 3),
+    ("include=tasks&status=DONE", 1),
+    ("include=tasks&status=TODO&status=DOING", 2),
+])
+def test_task_count_is_the_total_whatever_the_status_filter(client, project_with_tasks, query, embedded):
+    (project,) = client.get(f"projects?{query}").json()["data"]
+
+    assert len(project["tasks"]) == embedded
+    assert project["task_count"] == 3
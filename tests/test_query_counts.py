@@ -0,0 +1,92 @@
+"""Statement budgets of the API endpoints, pinned with ``assert_max_queries``.
+
+Budgets are exact current counts: an endpoint that starts issuing more statements (an
+N+1 loop, a redundant lookup) fails here and the budget has to be raised on purpose.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.todo.db import assert_max_queries
+
+PROJECTS = 3
+TASKS_PER_PROJECT = 4
+
+
+@pytest.fixture
+def seeded(client: TestClient) -> dict:
+    """Several projects with several tasks each, so per-row queries would show up in the counts."""
+    projects = [client.post("projects", json={"name": f"project-{i}"}).json()["data"] for i in range(PROJECTS)]
+    tasks = [
+        client.post(f"projects/{project['id']}/tasks", json={"title": f"task-{j}"}).json()["data"]
+        for project in projects
+        for j in range(TASKS_PER_PROJECT)
+    ]
+    return {
+        "project": projects[0]["id"],
+        "other_project": projects[-1]["id"],
+        "task": tasks[0]["id"],
+        "other_task": tasks[1]["id"],
+    }
+
+
+# (method, path, JSON body, expected status, statement budget)
+ENDPOINT_BUDGETS = [
+    ("GET", "projects", None, 200, 1),
+    ("GET", "projects?limit=2", None, 200, 1),
+    ("GET", "projects?include=tasks", None, 200, 2),
+    ("GET", "projects?include=tasks&status=TODO", None, 200, 2),
+    ("GET", "projects/{project}", None, 200, 2),
+    ("GET", "projects/{project}/tasks", None, 200, 2),
+    ("GET", "tasks/{task}", None, 200, 1),
+    ("POST", "projects", {"name": "created"}, 201, 6),
+    ("PUT", "projects/{project}", {"name": "renamed"}, 200, 7),
+    ("DELETE", "projects/{other_project}", None, 204, 5),
+    ("POST", "projects/{project}/tasks", {"title": "created"}, 201, 4),
+    ("PUT", "tasks/{task}", {"title": "renamed"}, 200, 2),
+    ("PATCH", "tasks/{task}", {"title": "renamed"}, 200, 2),
+    ("PATCH", "tasks/{task}/status", {"status": "DOING"}, 200, 2),
+    ("DELETE", "tasks/{other_task}", None, 204, 3),
+    ("GET", "health", None, 200, 0),
+]
+
+
+@pytest.mark.parametrize(
+    "method, path, body, expected_status, budget",
+    ENDPOINT_BUDGETS,
+    ids=[f"{method} {path}" for method, path, *_ in ENDPOINT_BUDGETS],
+)
+def test_endpoint_statement_budget(client, seeded, method, path, body, expected_status, budget):
+    url = path.format(**seeded)
+
+    with assert_max_queries(budget, f"{method} {path}"):
+        response = client.request(method, url, json=body)
+
+    assert response.status_code == expected_status
+
+
+def test_batch_statement_budget(client, seeded):
+    operations = [
+        {"op": "create_project", "data": {"name": "batch"}},
+        {"op": "create_task", "data": {"project_id": "$0", "title": "batch-task"}},
+    ]
+
+    with assert_max_queries(5, "POST /batch"):
+        response = client.post("batch", json={"operations": operations})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("path", ["projects", "projects?include=tasks", "projects/{project}/tasks"])
+def test_list_statement_count_does_not_grow_with_rows(client, seeded, path):
+    url = path.format(**seeded)
+    with assert_max_queries(100) as before:
+        client.get(url)
+
+    project_id = client.post("projects", json={"name": "one-more"}).json()["data"]["id"]
+    for j in range(TASKS_PER_PROJECT):
+        client.post(f"projects/{project_id}/tasks", json={"title": f"more-{j}"})
+        client.post(f"projects/{seeded['project']}/tasks", json={"title": f"more-{j}"})
+
+    with assert_max_queries(before.count, f"GET /{path} with more rows"):
+        client.get(url)
@@ -0,0 +1,103 @@
+"""Primary/replica routing of API requests, with two SQLite databases standing in for them."""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.todo.api.app import create_app
+from src.todo.api.middleware import LAST_WRITE_COOKIE
+from src.todo.config.settings import settings
+from src.todo.db import Base
+from src.todo.db import session as db_session
+from src.todo.models.project_orm import ProjectORM
+
+from .conftest import API_BASE_URL
+
+
+def _clear_replica_engines() -> None:
+    db_session.get_read_only_replica_engines.cache_clear()
+    db_session.get_replica_engines.cache_clear()
+
+
+@pytest.fixture
+def replica_engine(primary_engine, tmp_path, monkeypatch):
+    """A second database configured as the only read replica (not replicated from the primary)."""
+    monkeypatch.setattr(settings, "DATABASE_REPLICA_URLS", [f"sqlite:///{tmp_path / 'replica.db'}"])
+    _clear_replica_engines()
+    (engine,) = db_session.get_replica_engines()
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+    _clear_replica_engines()
+
+
+@pytest.fixture
+def replica_client(replica_engine) -> TestClient:
+    return TestClient(create_app(), base_url=API_BASE_URL)
+
+
+def _add_project(engine, name: str) -> None:
+    with Session(engine) as session:
+        session.add(ProjectORM(name=name, description=""))
+        session.commit()
+
+
+def _listed_names(client: TestClient) -> set[str]:
+    response = client.get("projects")
+    assert response.status_code == 200
+    return {project["name"] for project in response.json()["data"]}
+
+
+def test_reads_are_served_by_the_replica(primary_engine, replica_engine, replica_client):
+    _add_project(primary_engine, "on-primary")
+    _add_project(replica_engine, "on-replica")
+
+    assert _listed_names(replica_client) == {"on-replica"}
+
+
+def test_writes_go_to_the_primary(primary_engine, replica_engine, replica_client):
+    response = replica_client.post("projects", json={"name": "written"})
+
+    assert response.status_code == 201
+    with Session(primary_engine) as session:
+        assert session.scalars(select(ProjectORM.name)).all() == ["written"]
+    with Session(replica_engine) as session:
+        assert session.scalars(select(ProjectORM.name)).all() == []
+
+
+def test_client_reads_its_own_writes(replica_engine, replica_client):
+    _add_project(replica_engine, "on-replica")
+
+    response = replica_client.post("projects", json={"name": "written"})
+
+    assert LAST_WRITE_COOKIE in response.cookies
+    assert _listed_names(replica_client) == {"written"}
+
+
+def test_stickiness_is_carried_by_the_cookie(replica_engine, replica_client):
+    # A request served by another worker process only has the cookie to go by
+    _add_project(replica_engine, "on-replica")
+    other_worker = TestClient(create_app(), base_url=API_BASE_URL)
+    other_worker.cookies.set(LAST_WRITE_COOKIE, str(time.time()))
+
+    assert _listed_names(other_worker) == set()
+    assert _listed_names(replica_client) == {"on-replica"}
+
+
+def test_stale_or_invalid_write_cookie_reads_from_the_replica(replica_engine, replica_client):
+    _add_project(replica_engine, "on-replica")
+    stale = time.time() - settings.DATABASE_REPLICA_STICKINESS_SECONDS - 1
+    future = time.time() + 3600
+
+    for value in (str(stale), str(future), "not-a-time"):
+        replica_client.cookies.set(LAST_WRITE_COOKIE, value)
+        assert _listed_names(replica_client) == {"on-replica"}
+
+
+def test_reads_without_replicas_use_the_primary(primary_engine, client):
+    _add_project(primary_engine, "on-primary")
+
+    assert _listed_names(client) == {"on-primary"}